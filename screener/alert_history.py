@@ -1,11 +1,22 @@
 """Alert history storage and performance tracking.
 Uses SQLite for persistent local storage."""
+import asyncio
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 import streamlit as st
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+from screener.async_fetch import HTTPX_AVAILABLE, fetch_batch
+from screener.cache import cache_get, cache_set, TTL_HOUR, TTL_QUARTER
 from screener.db import (
     db_load_all_alerts,
     db_save_alerts_batch,
@@ -75,9 +86,90 @@ def clear_old_alerts(days_to_keep: int = 60) -> int:
     return db_clear_old_alerts(days_to_keep)
 
 
+# Symbols per yf.download request in the bulk prefetch path
+DOWNLOAD_CHUNK_SIZE = 20
+
+# Disk-cache payload for a window that came back with no bars (delisted or
+# bad symbol, window starting today), so renders don't refetch it every time
+_NO_DATA = 'no-data'
+
+
+def _perf_cache_ttl(start_date: str, days: int) -> int:
+    """A window that ended before today is immutable; one still open refreshes hourly."""
+    end = datetime.strptime(start_date, '%Y-%m-%d') + timedelta(days=days + 5)
+    return TTL_QUARTER if end.date() < datetime.now().date() else TTL_HOUR
+
+
+def _download_windows(windows: List[tuple], on_progress=None) -> Dict[tuple, Optional[pd.DataFrame]]:
+    """Fetch (symbol, start_date, days) windows with multi-symbol yf.download calls.
+
+    Windows sharing a start date and length share one date range, so each
+    group is downloaded DOWNLOAD_CHUNK_SIZE symbols per request. Windows in
+    a chunk whose download raised are left out of the result.
+    """
+    groups: Dict[tuple, List[str]] = {}
+    for symbol, start_date, days in windows:
+        groups.setdefault((start_date, days), []).append(symbol)
+
+    results = {}
+    total = len(windows)
+    done = 0
+    for (start_date, days), symbols in groups.items():
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = start + timedelta(days=days + 5)
+        for i in range(0, len(symbols), DOWNLOAD_CHUNK_SIZE):
+            chunk = symbols[i:i + DOWNLOAD_CHUNK_SIZE]
+            try:
+                data = yf.download(chunk, start=start, end=end, group_by='ticker',
+                                   auto_adjust=True, threads=True, progress=False)
+            except Exception:
+                chunk = []
+            for symbol in chunk:
+                df = None
+                if data is not None and not data.empty:
+                    if isinstance(data.columns, pd.MultiIndex):
+                        if symbol in data.columns.get_level_values(0):
+                            df = data[symbol]
+                    elif len(chunk) == 1:
+                        df = data
+                if df is not None:
+                    df = df[['Open', 'High', 'Low', 'Close', 'Volume']].dropna(subset=['Close']).head(days)
+                results[(symbol, start_date, days)] = df if df is not None and not df.empty else None
+            done += len(chunk)
+            if on_progress:
+                on_progress(done, total)
+    return results
+
+
+def prefetch_performance_data(windows: List[tuple], on_progress=None) -> None:
+    """Warm the disk cache for many (symbol, start_date, days) windows at once.
+
+    Uses one async HTTP client when httpx is installed, otherwise batched
+    yf.download calls. Windows already on disk, including ones recently
+    found to have no data, are skipped.
+    """
+    missing = [w for w in dict.fromkeys(windows) if cache_get('perf', *w) is None]
+    if not missing:
+        return
+    if HTTPX_AVAILABLE:
+        results = asyncio.run(fetch_batch(missing, on_progress))
+    else:
+        results = _download_windows(missing, on_progress)
+    for (symbol, start_date, days), df in results.items():
+        if df is not None:
+            cache_set('perf', symbol, start_date, days, payload=df,
+                      ttl_seconds=_perf_cache_ttl(start_date, days))
+        else:
+            cache_set('perf', symbol, start_date, days, payload=_NO_DATA, ttl_seconds=TTL_HOUR)
+
+
 @st.cache_data(ttl=3600, show_spinner=False)
 def fetch_performance_data(symbol: str, start_date: str, days: int = 20) -> Optional[pd.DataFrame]:
-    """Fetch price data from alert date to track performance."""
+    """Fetch price data from alert date to track performance.
+    Reads through the disk cache, so a closed window is only downloaded once."""
+    cached = cache_get('perf', symbol, start_date, days)
+    if cached is not None:
+        return cached if isinstance(cached, pd.DataFrame) else None
     try:
         start = datetime.strptime(start_date, '%Y-%m-%d')
         end = start + timedelta(days=days + 5)
@@ -86,13 +178,28 @@ def fetch_performance_data(symbol: str, start_date: str, days: int = 20) -> Opti
         df = ticker.history(start=start, end=end)
 
         if df.empty:
+            cache_set('perf', symbol, start_date, days, payload=_NO_DATA, ttl_seconds=TTL_HOUR)
             return None
 
-        return df[['Open', 'High', 'Low', 'Close', 'Volume']].head(days)
+        df = df[['Open', 'High', 'Low', 'Close', 'Volume']].head(days)
+        cache_set('perf', symbol, start_date, days, payload=df, ttl_seconds=_perf_cache_ttl(start_date, days))
+        return df
     except Exception:
         return None
 
 
+def fetch_performance_batch(pairs: List[tuple], days: int = 20) -> Dict[tuple, Optional[pd.DataFrame]]:
+    """Fetch price windows for many (symbol, start_date) pairs at once.
+
+    Cold windows are bulk-downloaded by prefetch_performance_data; every
+    window is then read back through the fetch_performance_data caches.
+    """
+    unique = list(dict.fromkeys(pairs))
+    prefetch_performance_data([(symbol, start_date, days) for symbol, start_date in unique])
+    return {(symbol, start_date): fetch_performance_data(symbol, start_date, days)
+            for symbol, start_date in unique}
+
+
 def calculate_performance(alert: dict, price_data: pd.DataFrame) -> dict:
     """Calculate performance metrics for an alert."""
     if price_data is None or price_data.empty:
@@ -151,6 +258,129 @@ def calculate_performance(alert: dict, price_data: pd.DataFrame) -> dict:
     }
 
 
+def _perf_kernel_loop(closes, highs, lows, lengths, alert_prices, bullish):
+    """Per-row P&L / max gain / max drawdown over NaN-padded price matrices."""
+    n = closes.shape[0]
+    pnl = np.empty(n)
+    max_gain = np.empty(n)
+    max_dd = np.empty(n)
+    for i in prange(n):
+        length = lengths[i]
+        base = alert_prices[i]
+        hi = highs[i, 0]
+        lo = lows[i, 0]
+        for t in range(1, length):
+            if highs[i, t] > hi:
+                hi = highs[i, t]
+            if lows[i, t] < lo:
+                lo = lows[i, t]
+        last = closes[i, length - 1]
+        if bullish[i]:
+            pnl[i] = (last - base) / base * 100
+            max_gain[i] = (hi - base) / base * 100
+            max_dd[i] = (lo - base) / base * 100
+        else:
+            pnl[i] = (base - last) / base * 100
+            max_gain[i] = (base - lo) / base * 100
+            max_dd[i] = (base - hi) / base * 100
+    return pnl, max_gain, max_dd
+
+
+def _perf_kernel_numpy(closes, highs, lows, lengths, alert_prices, bullish):
+    """Vectorized fallback for _perf_kernel_loop when Numba is not installed."""
+    last = closes[np.arange(closes.shape[0]), lengths - 1]
+    hi = np.nanmax(highs, axis=1)
+    lo = np.nanmin(lows, axis=1)
+    pnl = np.where(bullish, last - alert_prices, alert_prices - last) / alert_prices * 100
+    max_gain = np.where(bullish, hi - alert_prices, alert_prices - lo) / alert_prices * 100
+    max_dd = np.where(bullish, lo - alert_prices, alert_prices - hi) / alert_prices * 100
+    return pnl, max_gain, max_dd
+
+
+if NUMBA_AVAILABLE:
+    _perf_kernel = njit(parallel=True, cache=True)(_perf_kernel_loop)
+else:
+    _perf_kernel = _perf_kernel_numpy
+
+
+def _momentum_batch(closes: np.ndarray, lengths: np.ndarray, bullish: np.ndarray) -> np.ndarray:
+    """Vectorized _detect_momentum over NaN-padded (alerts x days) closes."""
+    rows = np.arange(closes.shape[0])
+    last = closes[rows, lengths - 1]
+    back5 = closes[rows, np.maximum(lengths - 5, 0)]
+    back10 = closes[rows, np.maximum(lengths - 10, 0)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        recent_5d = last / back5 - 1
+        prev_5d = np.where(lengths >= 10, back5 / back10 - 1, recent_5d)
+
+    bull = np.select(
+        [recent_5d < -0.03, recent_5d < prev_5d - 0.02, recent_5d > 0.02],
+        ['Losing Steam', 'Slowing', 'Strong'], default='Stable')
+    bear = np.select(
+        [recent_5d > 0.03, recent_5d > prev_5d + 0.02, recent_5d < -0.02],
+        ['Losing Steam', 'Slowing', 'Strong'], default='Stable')
+    return np.where(lengths < 5, 'Too Early', np.where(bullish, bull, bear))
+
+
+def calculate_performance_frame(alerts: pd.DataFrame,
+                                price_frames: List[Optional[pd.DataFrame]]) -> pd.DataFrame:
+    """Calculate performance metrics for many alerts as one vectorized pass.
+
+    Equivalent to calling calculate_performance(alert, df) for each row of
+    `alerts` (needs 'alert_price' and 'direction') paired with price_frames.
+    The P&L / max gain / drawdown math runs as a single kernel over
+    NaN-padded (alerts x days) price matrices. Returns a frame indexed like
+    `alerts` with the calculate_performance keys as columns.
+    """
+    n = len(alerts)
+    lengths = np.array([len(df) if df is not None else 0 for df in price_frames], dtype=np.int64)
+    valid = lengths > 0
+    width = max(int(lengths.max()) if n else 0, 1)
+    closes = np.full((n, width), np.nan)
+    highs = np.full_like(closes, np.nan)
+    lows = np.full_like(closes, np.nan)
+    if valid.any():
+        # One concat of every frame, scattered into the padded matrices in
+        # row-major order (the order boolean-mask assignment fills cells)
+        stacked = pd.concat(
+            [price_frames[row][['Close', 'High', 'Low']] for row in np.flatnonzero(valid)],
+            ignore_index=True,
+        ).to_numpy(dtype=float)
+        filled = np.arange(width) < lengths[:, None]
+        closes[filled] = stacked[:, 0]
+        highs[filled] = stacked[:, 1]
+        lows[filled] = stacked[:, 2]
+
+    alert_prices = alerts['alert_price'].fillna(0).to_numpy(dtype=float)
+    alert_prices = np.where(alert_prices <= 0, closes[:, 0], alert_prices)
+    bullish = (alerts['direction'].fillna('Bullish') == 'Bullish').to_numpy(dtype=bool)
+    safe_lengths = np.maximum(lengths, 1)
+
+    pnl = np.zeros(n)
+    max_gain = np.zeros(n)
+    max_dd = np.zeros(n)
+    if valid.any():
+        pnl[valid], max_gain[valid], max_dd[valid] = _perf_kernel(
+            closes[valid], highs[valid], lows[valid], lengths[valid], alert_prices[valid], bullish[valid])
+
+    status = np.select(
+        [pnl >= 10, pnl >= 5, pnl >= 0, pnl >= -5],
+        ['Winner', 'Gaining', 'Flat', 'Slight Loss'],
+        default='Loser',
+    )
+    current_price = np.where(valid, closes[np.arange(n), safe_lengths - 1], 0)
+
+    return pd.DataFrame({
+        'current_price': np.round(current_price, 2),
+        'pnl_pct': np.round(pnl, 2),
+        'max_gain_pct': np.round(max_gain, 2),
+        'max_drawdown_pct': np.round(max_dd, 2),
+        'days_tracked': lengths,
+        'status': np.where(valid, status, 'No Data'),
+        'momentum': np.where(valid, _momentum_batch(closes, safe_lengths, bullish), 'Unknown'),
+    }, index=alerts.index)
+
+
 def _detect_momentum(closes: list, direction: str) -> str:
     """Detect if the stock is losing momentum."""
     if len(closes) < 5:
@@ -200,6 +430,16 @@ def get_available_dates() -> list:
     return db_get_available_dates()
 
 
+def get_available_dates_index() -> dict:
+    """Alert dates indexed for the calendar view.
+
+    Returns {'dates': newest-first list, 'set': frozenset for O(1)
+    membership, 'recent': the 10 newest dates}.
+    """
+    dates = db_get_available_dates()
+    return {'dates': dates, 'set': frozenset(dates), 'recent': dates[:10]}
+
+
 def get_weekly_summary(weeks_back: int = 1, market: str = None) -> dict:
     """Generate weekly performance summary."""
     end_date = datetime.now()
@@ -225,17 +465,15 @@ def get_weekly_summary(weeks_back: int = 1, market: str = None) -> dict:
             'losing_steam_count': 0,
         }
 
-    performance_list = []
-    for _, alert in alerts_df.iterrows():
-        price_data = fetch_performance_data(alert['symbol'], alert['date'], 20)
-        perf = calculate_performance(alert.to_dict(), price_data)
-        perf['symbol'] = alert['symbol']
-        perf['direction'] = alert.get('direction', 'N/A')
-        perf['market'] = alert.get('market', 'us')
-        perf['date'] = alert['date']
-        performance_list.append(perf)
+    pairs = list(zip(alerts_df['symbol'], alerts_df['date']))
+    price_map = fetch_performance_batch(pairs, 20)
 
-    perf_df = pd.DataFrame(performance_list)
+    # Score every alert as columns of one frame; no per-alert dicts
+    perf_df = calculate_performance_frame(alerts_df, [price_map[pair] for pair in pairs])
+    perf_df['symbol'] = alerts_df['symbol']
+    perf_df['direction'] = alerts_df['direction'].fillna('N/A')
+    perf_df['market'] = alerts_df['market'].fillna('us')
+    perf_df['date'] = alerts_df['date']
 
     winners = len(perf_df[perf_df['pnl_pct'] >= 5])
     losers = len(perf_df[perf_df['pnl_pct'] <= -5])
@@ -336,3 +574,37 @@ def compute_signal_performance(signal: dict, current_price: float) -> dict:
         'days_held': days_held,
         'status_hint': status_hint,
     }
+
+
+def compute_signal_performance_batch(signals: pd.DataFrame, current_prices: pd.Series) -> pd.DataFrame:
+    """Vectorized compute_signal_performance over a frame of persisted signals.
+
+    current_prices must be aligned with `signals`. Returns a frame with the
+    same index holding current_price, pnl_pct, days_held and status_hint.
+    """
+    entry = signals['entry_price'].astype(float).to_numpy()
+    price = current_prices.astype(float).to_numpy()
+    bullish = (signals['direction'].fillna('Bullish') == 'Bullish').to_numpy()
+    stop = signals['stop_loss'].fillna(0).astype(float).to_numpy()
+    t1 = signals['target_1'].fillna(0).astype(float).to_numpy()
+
+    signal_dates = pd.to_datetime(signals['signal_date'], format='%Y-%m-%d', errors='coerce')
+    days_held = (pd.Timestamp.now() - signal_dates).dt.days.fillna(0).astype(int)
+
+    has_entry = entry > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pnl_pct = np.where(bullish, price - entry, entry - price) / entry * 100
+    pnl_pct = np.where(has_entry, np.round(pnl_pct, 2), 0)
+
+    # Auto-detect if stop or target has been breached
+    stopped = (stop > 0) & np.where(bullish, price <= stop, price >= stop)
+    target_hit = (t1 > 0) & np.where(bullish, price >= t1, price <= t1)
+    status_hint = np.select([~has_entry, stopped, target_hit],
+                            ['Active', 'Stopped Out', 'Target Hit'], default='Active')
+
+    return pd.DataFrame({
+        'current_price': np.where(has_entry, np.round(price, 2), price),
+        'pnl_pct': pnl_pct,
+        'days_held': days_held.to_numpy(),
+        'status_hint': status_hint,
+    }, index=signals.index)
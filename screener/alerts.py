@@ -2,7 +2,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional
 from screener.candlestick_patterns import scan_all_patterns
-from screener.technical_indicators import compute_all, generate_signals
+from screener.technical_indicators import compute_all, compute_entry_indicators, generate_signals
 from screener.breakout_detector import is_breaking_out, is_breaking_down
 
 
@@ -49,7 +49,7 @@ def score_stock(df: pd.DataFrame) -> dict:
     bullish = 0
     bearish = 0
 
-    enriched = compute_all(df.copy())
+    enriched = compute_all(df)
     signals = generate_signals(enriched)
 
     # RSI
@@ -305,22 +305,83 @@ def detect_entry_signal(df: pd.DataFrame, strategy: str = 'trend_following') ->
     if df is None or len(df) < 50:
         return []
 
-    enriched = compute_all(df.copy())
-    signals = generate_signals(enriched)
+    enriched = _with_indicators(df)
 
     results = []
     if strategy == 'trend_following':
-        bull = _check_trend_following_entry(enriched, signals)
+        # generate_signals() output is unused by the entry checks, so it is skipped here
+        bull = _check_trend_following_entry(enriched)
         if bull['has_signal']:
             results.append(bull)
-        bear = _check_bearish_trend_following_entry(enriched, signals)
+        bear = _check_bearish_trend_following_entry(enriched)
         if bear['has_signal']:
             results.append(bear)
     # Future: elif strategy == 'mean_reversion': ...
     return results
 
 
-def _check_trend_following_entry(enriched: pd.DataFrame, signals: dict) -> dict:
+_ENTRY_LAST_BAR_COLS = ['Close', 'Low', 'High', 'EMA_20', 'EMA_50', 'EMA_200']
+
+
+def _with_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """The entry-check indicators (TA-Lib) on a copy of df, unless df is
+    already enriched (ATR is the last column both enrichers add), in which
+    case it is used as-is."""
+    return df if 'ATR' in df.columns else compute_entry_indicators(df)
+
+
+def detect_entry_signal_batch(data: Dict[str, pd.DataFrame],
+                              strategy: str = 'trend_following') -> Dict[str, list]:
+    """Batch version of detect_entry_signal over many symbols.
+
+    Returns {symbol: [signal dicts]} for symbols with at least one signal.
+    The required conditions (EMA alignment + pullback to EMA20) are
+    evaluated for every symbol at once on a stacked last-bar array, so the
+    full condition checks (candlestick scans etc.) only run on candidates.
+    """
+    if strategy != 'trend_following':
+        return {}
+
+    enriched = {sym: _with_indicators(df) for sym, df in data.items()
+                if df is not None and len(df) >= 50}
+    if not enriched:
+        return {}
+
+    syms = list(enriched)
+    last = np.array([e[_ENTRY_LAST_BAR_COLS].values[-1] for e in enriched.values()], dtype=float)
+    close, low, high, ema20, ema50, ema200 = last.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bull_pullback = (close - ema20) / ema20 * 100
+        bear_pullback = (ema20 - close) / ema20 * 100
+    valid = ~np.isnan(last[:, 3:]).any(axis=1) & (ema20 > 0)
+
+    bull_ok = valid & (close > ema20) & (ema20 > ema50) & (ema50 > ema200) & (
+        ((bull_pullback >= 0) & (bull_pullback <= ENTRY_EMA_PULLBACK_PCT))
+        | ((low <= ema20) & (ema20 <= close)))
+    bear_ok = valid & (ema200 > ema50) & (ema50 > ema20) & (ema20 > close) & (
+        ((bear_pullback >= 0) & (bear_pullback <= ENTRY_EMA_PULLBACK_PCT))
+        | ((close <= ema20) & (ema20 <= high)))
+
+    results = {}
+    for i in np.flatnonzero(bull_ok | bear_ok):
+        sym = syms[i]
+        found = []
+        # generate_signals() output is unused by the entry checks, so it is skipped here
+        if bull_ok[i]:
+            bull = _check_trend_following_entry(enriched[sym])
+            if bull['has_signal']:
+                found.append(bull)
+        if bear_ok[i]:
+            bear = _check_bearish_trend_following_entry(enriched[sym])
+            if bear['has_signal']:
+                found.append(bear)
+        if found:
+            results[sym] = found
+    return results
+
+
+def _check_trend_following_entry(enriched: pd.DataFrame) -> dict:
     """Check Trend Following entry conditions:
     1. EMA alignment (required): close > EMA20 > EMA50 > EMA200
     2. Pullback to EMA20 (required): within 2% or Low touched EMA20
@@ -456,7 +517,7 @@ def _check_trend_following_entry(enriched: pd.DataFrame, signals: dict) -> dict:
     }
 
 
-def _check_bearish_trend_following_entry(enriched: pd.DataFrame, signals: dict) -> dict:
+def _check_bearish_trend_following_entry(enriched: pd.DataFrame) -> dict:
     """Check Bearish Trend Following entry conditions (short/sell):
     1. EMA alignment (required): EMA200 > EMA50 > EMA20 > close
     2. Rally to EMA20 (required): within 2% below EMA20 or High touched EMA20
@@ -0,0 +1,108 @@
+"""Concurrent daily-bar downloads over a single pooled HTTP client.
+
+Used to warm the performance cache for many alerts at once: one asyncio
+event loop drives every request through one httpx.AsyncClient (HTTP/2
+when `h2` is installed), instead of one thread + connection per alert.
+httpx is optional; callers fall back to per-symbol yfinance fetches.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_CHART_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/{symbol}'
+_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+MAX_CONNECTIONS = 50
+
+# (symbol, start_date 'YYYY-MM-DD', days)
+WindowKey = Tuple[str, str, int]
+
+
+def _parse_chart(payload: dict) -> Optional[pd.DataFrame]:
+    """Convert a Yahoo chart response into an adjusted OHLCV frame, like Ticker.history."""
+    result = (payload.get('chart') or {}).get('result') or []
+    if not result or not result[0].get('timestamp'):
+        return None
+    result = result[0]
+    quote = result['indicators']['quote'][0]
+    df = pd.DataFrame({
+        'Open': quote.get('open'),
+        'High': quote.get('high'),
+        'Low': quote.get('low'),
+        'Close': quote.get('close'),
+        'Volume': quote.get('volume'),
+    }, index=pd.to_datetime(result['timestamp'], unit='s', utc=True), dtype=float)
+    tz = result.get('meta', {}).get('exchangeTimezoneName')
+    if tz:
+        df.index = df.index.tz_convert(tz)
+
+    # yfinance auto_adjust=True: scale OHLC by adjclose / close
+    adj = (result['indicators'].get('adjclose') or [{}])[0].get('adjclose')
+    if adj is not None:
+        ratio = pd.Series(adj, index=df.index, dtype=float) / df['Close']
+        df[['Open', 'High', 'Low']] = df[['Open', 'High', 'Low']].mul(ratio, axis=0)
+        df['Close'] = df['Close'] * ratio
+
+    df = df.dropna(subset=['Close'])
+    return df if not df.empty else None
+
+
+async def _fetch_window(client, key: WindowKey) -> Optional[pd.DataFrame]:
+    """Fetch the daily bars for one (symbol, start_date, days) window.
+    Returns None when Yahoo has no bars for it; a failed request raises."""
+    symbol, start_date, days = key
+    start = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    end = start + timedelta(days=days + 5)
+    params = {
+        'period1': int(start.timestamp()),
+        'period2': int(end.timestamp()),
+        'interval': '1d',
+        'events': 'div,splits',
+    }
+    resp = await client.get(_CHART_URL.format(symbol=symbol), params=params)
+    if resp.status_code == 404:
+        return None  # unknown or delisted symbol
+    resp.raise_for_status()
+    df = _parse_chart(resp.json())
+    return df.head(days) if df is not None else None
+
+
+async def fetch_batch(keys: List[WindowKey],
+                      on_progress: Callable[[int, int], None] = None) -> Dict[WindowKey, Optional[pd.DataFrame]]:
+    """Fetch all windows concurrently over one pooled client.
+
+    Returns {key: DataFrame, or None when the window has no bars}; windows
+    whose request failed are left out. on_progress(completed, total) is
+    called as each request finishes.
+    """
+    total = len(keys)
+    results = {}
+    limits = httpx.Limits(max_connections=min(MAX_CONNECTIONS, max(total, 1)))
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits,
+                                 headers=_HEADERS, timeout=15.0) as client:
+        async def _run(key):
+            try:
+                return key, await _fetch_window(client, key), True
+            except Exception:
+                return key, None, False
+
+        for completed, task in enumerate(asyncio.as_completed([_run(k) for k in keys]), start=1):
+            key, df, ok = await task
+            if ok:
+                results[key] = df
+            if on_progress:
+                on_progress(completed, total)
+    return results
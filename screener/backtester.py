@@ -22,7 +22,7 @@ def detect_combo_signal(df: pd.DataFrame, combo: str) -> bool:
     if len(df) < 50:
         return False
     try:
-        enriched = compute_all(df.copy())
+        enriched = compute_all(df)
         signals = generate_signals(enriched)
         patterns = scan_all_patterns(df)
 
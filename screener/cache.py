@@ -0,0 +1,49 @@
+"""Persistent on-disk cache with per-entry TTLs.
+
+Entries survive Streamlit reruns and server restarts, so immutable data
+(e.g. historical bars for a past alert window) is only downloaded once.
+"""
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+_CACHE_DIR = Path(__file__).resolve().parent.parent / '.perf_cache'
+
+# TTLs aligned to how often the underlying data can change
+TTL_HOUR = 3600
+TTL_WEEK = 7 * 24 * 3600
+TTL_QUARTER = 90 * 24 * 3600
+
+
+def _entry_path(namespace: str, *key_parts) -> Path:
+    """Return the cache file path for a namespaced key."""
+    digest = hashlib.md5(repr(key_parts).encode('utf-8')).hexdigest()
+    return _CACHE_DIR / namespace / f'{digest}.pkl'
+
+
+def cache_get(namespace: str, *key_parts) -> Optional[Any]:
+    """Load a cached payload, or None if missing, expired or unreadable."""
+    path = _entry_path(namespace, *key_parts)
+    if not path.exists():
+        return None
+    try:
+        entry = pd.read_pickle(path)
+        if time.time() - entry['fetched_at'] > entry['ttl_seconds']:
+            return None
+        return entry['payload']
+    except Exception:
+        return None
+
+
+def cache_set(namespace: str, *key_parts, payload: Any, ttl_seconds: int) -> None:
+    """Store a payload with its TTL. Best-effort: never raises."""
+    try:
+        path = _entry_path(namespace, *key_parts)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {'fetched_at': time.time(), 'ttl_seconds': ttl_seconds, 'payload': payload}
+        pd.to_pickle(entry, path)
+    except Exception:
+        pass  # caching is best-effort, never block the app
@@ -1,13 +1,13 @@
-import pytz
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 # Paths
 SCREENER_DIR = Path(__file__).resolve().parent
 PROJECT_DIR = SCREENER_DIR.parent
 
 # Timezone
-TZ_INDIA = pytz.timezone('Asia/Kolkata')
-TZ_US = pytz.timezone('US/Eastern')
+TZ_INDIA = ZoneInfo('Asia/Kolkata')
+TZ_US = ZoneInfo('America/New_York')
 
 # Data defaults
 DEFAULT_LOOKBACK_DAYS = 365
@@ -22,20 +22,32 @@ def _get_cache_path(market: str, interval: str) -> Path:
     return _CACHE_DIR / f'{market}_{interval}_data.pkl'
 
 
+# Parsed cache_meta.json, reused until the file's mtime changes
+_meta_cache = {'mtime': None, 'meta': {}}
+
+
 def _load_cache_meta() -> dict:
-    """Load cache metadata."""
-    if not _CACHE_META_FILE.exists():
-        return {}
+    """Load cache metadata (a fresh top-level dict the caller may modify).
+    The file is only re-parsed when its mtime changes, since every app
+    rerun reads it through get_cache_info()."""
     try:
-        return json.loads(_CACHE_META_FILE.read_text(encoding='utf-8'))
-    except Exception:
+        mtime = _CACHE_META_FILE.stat().st_mtime_ns
+    except OSError:
         return {}
+    if _meta_cache['mtime'] != mtime:
+        try:
+            meta = json.loads(_CACHE_META_FILE.read_text(encoding='utf-8'))
+        except Exception:
+            return {}
+        _meta_cache.update(mtime=mtime, meta=meta)
+    return dict(_meta_cache['meta'])
 
 
 def _save_cache_meta(meta: dict):
     """Save cache metadata."""
     _ensure_cache_dir()
     _CACHE_META_FILE.write_text(json.dumps(meta, indent=2), encoding='utf-8')
+    _meta_cache['mtime'] = None  # Re-read on next load, even if the mtime tick is coarse
 
 
 def get_cache_info(market: str, interval: str = '1d') -> dict:
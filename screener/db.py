@@ -4,7 +4,7 @@ import sqlite3
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 _DB_DIR = Path(__file__).resolve().parent.parent / '.alert_history'
 _DB_PATH = _DB_DIR / 'screener.db'
@@ -19,6 +19,9 @@ def get_connection() -> sqlite3.Connection:
         _local.conn = sqlite3.connect(str(_DB_PATH), check_same_thread=False)
         _local.conn.row_factory = sqlite3.Row
         _local.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL only needs an fsync at checkpoints; commits stay durable
+        # against app crashes, which is all the watchlist/alerts need
+        _local.conn.execute("PRAGMA synchronous=NORMAL")
         _local.conn.execute("PRAGMA foreign_keys=ON")
         _init_schema(_local.conn)
         _maybe_migrate(_local.conn)
@@ -331,10 +334,22 @@ def db_clear_old_alerts(days_to_keep: int = 60) -> int:
 # Watchlist CRUD
 # ---------------------------------------------------------------------------
 
+# Fixed SQL text, so sqlite3's per-connection statement cache reuses the
+# prepared statements across reruns instead of re-parsing them
+_WATCHLIST_SELECT_ALL = "SELECT * FROM watchlist ORDER BY date_added DESC"
+_WATCHLIST_COLUMNS = """watchlist
+               (symbol, date_added, alert_date, direction, score, alert_price,
+                criteria, pattern, combo, market, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_WATCHLIST_INSERT = "INSERT INTO " + _WATCHLIST_COLUMNS
+_WATCHLIST_INSERT_OR_IGNORE = "INSERT OR IGNORE INTO " + _WATCHLIST_COLUMNS
+_WATCHLIST_DELETE = "DELETE FROM watchlist WHERE symbol = ?"
+
+
 def db_load_watchlist() -> List[dict]:
     """Load all watchlist items."""
     conn = get_connection()
-    cursor = conn.execute("SELECT * FROM watchlist ORDER BY date_added DESC")
+    cursor = conn.execute(_WATCHLIST_SELECT_ALL)
     return [dict(row) for row in cursor.fetchall()]
 
 
@@ -343,10 +358,7 @@ def db_add_watchlist_item(item: dict) -> bool:
     conn = get_connection()
     try:
         conn.execute(
-            """INSERT INTO watchlist
-               (symbol, date_added, alert_date, direction, score, alert_price,
-                criteria, pattern, combo, market, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            _WATCHLIST_INSERT,
             (
                 item.get('symbol', ''),
                 item.get('date_added', ''),
@@ -367,10 +379,35 @@ def db_add_watchlist_item(item: dict) -> bool:
         return False  # Symbol already in watchlist
 
 
+def db_add_watchlist_items_batch(items: List[dict]) -> int:
+    """Add multiple watchlist items in one transaction. Returns count of new items inserted
+    (symbols already in the watchlist are ignored)."""
+    conn = get_connection()
+    rows = []
+    for item in items:
+        rows.append((
+            item.get('symbol', ''),
+            item.get('date_added', ''),
+            item.get('alert_date', ''),
+            item.get('direction', ''),
+            int(item.get('score', 0)),
+            float(item.get('alert_price', 0.0)),
+            item.get('criteria', ''),
+            item.get('pattern', ''),
+            item.get('combo', ''),
+            item.get('market', 'us'),
+            item.get('created_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+        ))
+
+    cursor = conn.executemany(_WATCHLIST_INSERT_OR_IGNORE, rows)
+    conn.commit()
+    return cursor.rowcount
+
+
 def db_remove_watchlist_item(symbol: str) -> bool:
     """Remove a stock from the watchlist. Returns True if removed."""
     conn = get_connection()
-    cursor = conn.execute("DELETE FROM watchlist WHERE symbol = ?", (symbol,))
+    cursor = conn.execute(_WATCHLIST_DELETE, (symbol,))
     conn.commit()
     return cursor.rowcount > 0
 
@@ -396,6 +433,18 @@ def db_set_scheduler_last_run(market: str, date_str: str):
     conn.commit()
 
 
+def db_set_scheduler_last_runs(last_run: Dict[str, str]):
+    """Set the last run date for many markets in one transaction."""
+    if not last_run:
+        return
+    conn = get_connection()
+    conn.executemany(
+        "INSERT OR REPLACE INTO scheduler_state (market, last_run) VALUES (?, ?)",
+        list(last_run.items())
+    )
+    conn.commit()
+
+
 # ---------------------------------------------------------------------------
 # Entry Signals CRUD
 # ---------------------------------------------------------------------------
@@ -495,6 +544,20 @@ def db_update_entry_signal_status(signal_id: int, status: str,
     return cursor.rowcount > 0
 
 
+def db_close_entry_signals(closes: List[tuple], exit_date: str) -> int:
+    """Close many entry signals in one transaction.
+    closes is [(signal_id, exit_price), ...]. Returns count of rows updated."""
+    if not closes:
+        return 0
+    conn = get_connection()
+    cursor = conn.executemany(
+        "UPDATE entry_signals SET status = 'Closed', exit_price = ?, exit_date = ? WHERE id = ?",
+        [(exit_price, exit_date, signal_id) for signal_id, exit_price in closes]
+    )
+    conn.commit()
+    return cursor.rowcount
+
+
 def db_delete_entry_signal(signal_id: int) -> bool:
     """Delete a specific entry signal. Returns True if deleted."""
     conn = get_connection()
@@ -5,6 +5,7 @@ import streamlit as st
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple, List
+from screener.cache import cache_get, cache_set, TTL_HOUR
 
 try:
     from jugaad_data.nse import NSELive
@@ -237,12 +238,19 @@ def get_expiry_dates(symbol: str) -> Tuple[List[str], bool]:
         except Exception:
             pass  # fall through to yfinance
 
-    # yfinance fallback / default for non-Indian symbols
+    # yfinance fallback / default for non-Indian symbols. Expiry lists only
+    # change when a new series is listed, so they are kept on disk for an hour
+    cached = cache_get('expiries', symbol)
+    if cached is not None:
+        return cached, False
     try:
         ticker = yf.Ticker(symbol)
-        return list(ticker.options), False
+        dates = list(ticker.options)
     except Exception:
         return [], False
+    if dates:
+        cache_set('expiries', symbol, payload=dates, ttl_seconds=TTL_HOUR)
+    return dates, False
 
 
 @st.cache_data(ttl=300, show_spinner=False)
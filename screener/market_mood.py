@@ -4,6 +4,7 @@ import yfinance as yf
 import streamlit as st
 from typing import Dict, Tuple, Optional
 from screener.alerts import score_stock
+from screener.cache import cache_get, cache_set
 from screener.technical_indicators import compute_all
 from screener.fo_data import get_expiry_dates, get_option_chain, compute_pcr
 from screener.config import (
@@ -16,6 +17,10 @@ from screener.config import (
 @st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
 def fetch_vix(market: str) -> Optional[float]:
     symbol = "^INDIAVIX" if market == "indian" else "^VIX"
+    # Also kept on disk, so a restarted server doesn't refetch within the TTL
+    cached = cache_get('vix', symbol)
+    if cached is not None:
+        return cached
     try:
         df = yf.download(symbol, period="5d", interval="1d",
                          auto_adjust=True, progress=False)
@@ -25,7 +30,9 @@ def fetch_vix(market: str) -> Optional[float]:
             df.columns = df.columns.get_level_values(0)
         col = [c for c in df.columns if c.lower() == 'close']
         if col:
-            return round(float(df[col[0]].dropna().iloc[-1]), 2)
+            vix = round(float(df[col[0]].dropna().iloc[-1]), 2)
+            cache_set('vix', symbol, payload=vix, ttl_seconds=CACHE_TTL_SECONDS)
+            return vix
         return None
     except Exception:
         return None
@@ -64,7 +71,7 @@ def compute_breadth(data: Dict[str, pd.DataFrame]) -> dict:
         if len(df) < 50:
             continue
         try:
-            enriched = compute_all(df.copy())
+            enriched = compute_all(df)
             last = enriched.iloc[-1]
 
             rsi = last.get('RSI', np.nan)
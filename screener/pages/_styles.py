@@ -0,0 +1,95 @@
+"""Table layouts, column configs and cell styles shared by the tracker and watchlist pages."""
+from typing import List
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Entry-signal table layout (order of the row tuples); float columns are built as float64 arrays
+ENTRY_SIGNAL_COLUMNS = (
+    'Symbol', 'Chart', 'Direction', 'Setup', 'Strength', 'Entry $', 'EMA20',
+    'Pullback %', 'Stop $', 'Target 1', 'Target 2', 'Risk %', 'ADX', 'RSI',
+    'Vol Ratio', 'Conditions', 'Missing',
+)
+ENTRY_SIGNAL_FLOAT_COLUMNS = (
+    'Entry $', 'EMA20', 'Pullback %', 'Stop $', 'Target 1', 'Target 2', 'Risk %',
+    'ADX', 'RSI', 'Vol Ratio',
+)
+
+# Table column configs, built once at import instead of on every rerun
+ENTRY_SIGNAL_COLUMN_CONFIG = {
+    'Symbol': st.column_config.TextColumn('Symbol', width='small'),
+    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
+    'Direction': st.column_config.TextColumn('Direction', width='small'),
+    'Setup': st.column_config.TextColumn('Setup', width='small'),
+    'Strength': st.column_config.TextColumn('Signal', width='small'),
+    'Entry $': st.column_config.NumberColumn('Entry $', format="%.2f"),
+    'EMA20': st.column_config.NumberColumn('EMA20', format="%.2f"),
+    'Pullback %': st.column_config.NumberColumn('Pullback %', format="%.1f%%"),
+    'Stop $': st.column_config.NumberColumn('Stop $', format="%.2f"),
+    'Target 1': st.column_config.NumberColumn('T1 (2:1)', format="%.2f"),
+    'Target 2': st.column_config.NumberColumn('T2 (3:1)', format="%.2f"),
+    'Risk %': st.column_config.NumberColumn('Risk %', format="%.1f%%"),
+    'ADX': st.column_config.NumberColumn('ADX', format="%.0f"),
+    'RSI': st.column_config.NumberColumn('RSI', format="%.0f"),
+    'Vol Ratio': st.column_config.NumberColumn('Vol', format="%.1fx"),
+    'Conditions': st.column_config.TextColumn('Conditions Met', width='large'),
+    'Missing': st.column_config.TextColumn('Missing', width='medium'),
+}
+
+SAVED_SIGNAL_COLUMN_CONFIG = {
+    'Symbol': st.column_config.TextColumn('Symbol', width='small'),
+    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
+    'Direction': st.column_config.TextColumn('Dir', width='small'),
+    'Setup': st.column_config.TextColumn('Setup', width='small'),
+    'Strength': st.column_config.TextColumn('Signal', width='small'),
+    'Signal Date': st.column_config.TextColumn('Triggered', width='small'),
+    'Days Held': st.column_config.NumberColumn('Days', format="%d"),
+    'Entry $': st.column_config.NumberColumn('Entry $', format="%.2f"),
+    'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
+    'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
+    'Stop $': st.column_config.NumberColumn('Stop $', format="%.2f"),
+    'T1 (2:1)': st.column_config.NumberColumn('T1', format="%.2f"),
+    'T2 (3:1)': st.column_config.NumberColumn('T2', format="%.2f"),
+    'Risk %': st.column_config.NumberColumn('Risk %', format="%.1f%%"),
+    'Status': st.column_config.TextColumn('Status', width='small'),
+}
+
+# Table cell styles
+_CSS_DARK_GREEN = 'background-color: #1b5e20; color: white'
+_CSS_GREEN = 'background-color: #2e7d32; color: white'
+_CSS_AMBER = 'background-color: #ff8f00; color: black'
+_CSS_RED = 'background-color: #b71c1c; color: white'
+_CSS_BLUE = 'background-color: #1565c0; color: white'
+
+STRENGTH_CSS = {'Strong': _CSS_DARK_GREEN, 'Moderate': _CSS_AMBER}
+DIRECTION_CSS = {'Bullish': _CSS_DARK_GREEN, 'Bearish': _CSS_RED}
+MOMENTUM_CSS = {'Strong': _CSS_DARK_GREEN, 'Stable': _CSS_GREEN, 'Slowing': _CSS_AMBER, 'Losing Steam': _CSS_RED}
+SIGNAL_STATUS_CSS = {'Target Hit': _CSS_DARK_GREEN, 'Stopped Out': _CSS_RED, 'Active': _CSS_BLUE}
+
+
+def css_from_map(col: pd.Series, css_map: dict) -> pd.Series:
+    """Styler.apply helper: look up each cell's CSS in css_map (unknown values unstyled).
+    Categorical columns are mapped as plain values, so the '' fill always applies."""
+    return col.astype(object).map(css_map).fillna('')
+
+
+def pnl_css(col: pd.Series) -> np.ndarray:
+    """Styler.apply helper: P&L % buckets to CSS in one vectorized pass."""
+    vals = col.to_numpy(dtype=float)
+    return np.select([vals >= 5, vals >= 0, vals >= -5],
+                     [_CSS_DARK_GREEN, _CSS_GREEN, _CSS_AMBER], default=_CSS_RED)
+
+
+def rows_to_frame(rows: List[tuple], columns: tuple, float_cols: tuple) -> pd.DataFrame:
+    """Assemble row tuples into a DataFrame column by column.
+    float_cols are packed straight into float64 arrays."""
+    if not rows:
+        return pd.DataFrame(columns=list(columns))
+    data = {}
+    for col, values in zip(columns, zip(*rows)):
+        if col in float_cols:
+            data[col] = np.asarray(values, dtype=np.float64)
+        else:
+            data[col] = list(values)
+    return pd.DataFrame(data, copy=False)
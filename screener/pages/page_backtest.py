@@ -1,10 +1,17 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict
 from screener.backtester import backtest_combo
 
 
+def _return_css(col: pd.Series) -> np.ndarray:
+    """Styler.apply helper: green/red text for positive/negative returns, a column at a time."""
+    vals = pd.to_numeric(col, errors='coerce').to_numpy(dtype=float)
+    return np.select([vals > 0, vals < 0], ['color: #4caf50', 'color: #ef5350'], default='')
+
+
 def render(daily_data: Dict[str, pd.DataFrame]):
     """Render the backtesting tab for combo strategies."""
     st.header("Backtest Trading Combos")
@@ -122,20 +129,9 @@ def _display_single(result: dict):
     st.markdown("### Individual Trades")
     trades_df = pd.DataFrame(trades)
     if not trades_df.empty:
-        def _color_return(val):
-            try:
-                v = float(val)
-                if v > 0:
-                    return 'color: #4caf50'
-                elif v < 0:
-                    return 'color: #ef5350'
-            except (ValueError, TypeError):
-                pass
-            return ''
-
         st.dataframe(
-            trades_df.style.map(_color_return,
-                                 subset=['return_5d', 'return_10d', 'return_20d']),
+            trades_df.style.apply(_return_css,
+                                  subset=['return_5d', 'return_10d', 'return_20d']),
             use_container_width=True,
             hide_index=True,
         )
@@ -193,20 +189,9 @@ def _display_batch(results: list, combo: str):
         })
     stock_df = pd.DataFrame(rows).sort_values('Avg Ret 5d (%)', ascending=False)
 
-    def _color_val(val):
-        try:
-            v = float(val)
-            if v > 0:
-                return 'color: #4caf50'
-            elif v < 0:
-                return 'color: #ef5350'
-        except (ValueError, TypeError):
-            pass
-        return ''
-
     st.dataframe(
-        stock_df.style.map(_color_val,
-                            subset=['Avg Ret 5d (%)', 'Avg Ret 20d (%)']),
+        stock_df.style.apply(_return_css,
+                             subset=['Avg Ret 5d (%)', 'Avg Ret 20d (%)']),
         use_container_width=True,
         hide_index=True,
     )
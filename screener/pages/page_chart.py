@@ -70,7 +70,7 @@ def render(daily_data: Dict[str, pd.DataFrame], weekly_data: Dict[str, pd.DataFr
     show_rsi = st.checkbox("Show RSI", True, key="show_rsi")
 
     # Compute indicators
-    enriched = compute_all(df_view.copy())
+    enriched = compute_all(df_view)
 
     # S/R levels
     support_levels = None
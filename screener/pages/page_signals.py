@@ -12,9 +12,9 @@ from screener.trade_signals import (
     build_strike_details,
     get_momentum_picks,
     compute_sector_heatmap,
+    get_strike_step,
 )
 from screener.market_mood import fetch_vix
-from screener.config import NIFTY_STRIKE_STEP, BANKNIFTY_STRIKE_STEP
 from screener.utils import get_chart_url
 
 
@@ -171,11 +171,7 @@ def render(daily_data: Dict[str, pd.DataFrame],
     )
     idx_ticker = index_options[selected_index]
 
-    # Determine strike step
-    if 'BANK' in selected_index.upper():
-        step = BANKNIFTY_STRIKE_STEP
-    else:
-        step = NIFTY_STRIKE_STEP
+    step = get_strike_step(selected_index)
 
     with st.spinner(f"Analyzing {selected_index}..."):
         price_df = fetch_ohlcv(idx_ticker, period_days=5, interval='1d')
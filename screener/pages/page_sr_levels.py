@@ -50,7 +50,7 @@ def render(daily_data: Dict[str, pd.DataFrame]):
 
     # Chart with S/R overlay
     st.subheader("Chart with S/R Levels")
-    enriched = compute_all(df_view.copy())
+    enriched = compute_all(df_view)
     fig = candlestick_chart(
         enriched, selected,
         overlays=['EMA_20', 'EMA_50'],
@@ -78,7 +78,7 @@ def render(daily_data: Dict[str, pd.DataFrame]):
     symbols = sorted(daily_data.keys())
     selected = st.selectbox("Select stock for details", symbols, key="tech_detail_stock")
     if selected and selected in daily_data:
-        df = compute_all(daily_data[selected].copy())
+        df = compute_all(daily_data[selected])
         signals = generate_signals(df)
         last = df.iloc[-1]
 
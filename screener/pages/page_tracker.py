@@ -1,30 +1,70 @@
 """Performance Tracker page - Track historical alerts and their performance."""
+import time
 import streamlit as st
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from typing import Dict, List
-from datetime import datetime
+from typing import Dict, Optional
+from datetime import date, datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from screener.alert_history import (
     get_historical_alerts,
+    fetch_performance_batch,
     fetch_performance_data,
-    calculate_performance,
+    calculate_performance_frame,
     clear_old_alerts,
     delete_alert,
     get_alerts_by_date,
-    get_available_dates,
+    get_available_dates_index,
     get_weekly_summary,
+    prefetch_performance_data,
 )
 from screener.scheduler import (
     run_all_markets_auto_save,
     get_last_auto_save_times,
     is_market_closed,
 )
-from screener.alerts import detect_entry_signal
-from screener.alert_history import compute_signal_performance
+from screener.alerts import detect_entry_signal_batch
+from screener.cache import cache_get, cache_set, TTL_WEEK
+from screener.alert_history import compute_signal_performance_batch
 from screener.db import db_save_entry_signals, db_load_active_entry_signals, db_update_entry_signal_status
-from screener.utils import get_chart_url, get_unusual_whales_url
-from screener.watchlist_store import add_to_watchlist, is_in_watchlist, get_watchlist_symbols
+from screener.utils import get_chart_url, get_clean_symbol, get_unusual_whales_url
+from screener.pages._styles import (
+    DIRECTION_CSS, ENTRY_SIGNAL_COLUMN_CONFIG, ENTRY_SIGNAL_COLUMNS, ENTRY_SIGNAL_FLOAT_COLUMNS,
+    MOMENTUM_CSS, SAVED_SIGNAL_COLUMN_CONFIG, SIGNAL_STATUS_CSS, STRENGTH_CSS,
+    css_from_map, pnl_css, rows_to_frame,
+)
+from screener.watchlist_store import add_to_watchlist_bulk, get_watchlist_symbols
+
+
+# Threads in the shared fetch pool
+TRACKER_MAX_WORKERS = 10
+
+# Partial-rerun decorator (st.fragment from Streamlit 1.37, experimental from 1.33);
+# older versions just render normally
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Rows per page in the live tracker performance table
+TRACKER_PAGE_SIZE = 50
+
+# Live-tracker table layout
+PERF_COLUMNS = (
+    'Symbol', 'Chart', 'Option Flow', 'Market', 'Alert Date', 'Direction', 'Score',
+    'Setup', 'Criteria', 'Earnings', 'Alert $', 'Now $', 'P&L %', 'Max Gain %',
+    'Max DD %', 'Days', 'Status', 'Momentum', '_raw_symbol', '_pattern',
+)
+
+# Seconds a session may reuse its computed live-tracker table
+TRACKER_SESSION_TTL = 300
+
+# Symbols per yf.Tickers batch when prefetching earnings dates
+EARNINGS_CHUNK_SIZE = 10
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool, kept alive across reruns and sessions."""
+    return ThreadPoolExecutor(max_workers=TRACKER_MAX_WORKERS, thread_name_prefix='tracker')
 
 
 # Cache performance data to avoid repeated API calls
@@ -34,57 +74,193 @@ def _cached_fetch_performance(symbol: str, alert_date: str, track_days: int):
     return fetch_performance_data(symbol, alert_date, track_days)
 
 
-# Cache earnings data to avoid repeated API calls
-@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
-def _get_earnings_date(symbol: str) -> str:
-    """Get next earnings date for a symbol. Returns days until earnings or empty string."""
-    try:
-        ticker = yf.Ticker(symbol)
-        calendar = ticker.calendar
-
-        if calendar is None or calendar.empty:
-            return ""
-
-        # Get earnings date
-        if 'Earnings Date' in calendar.index:
-            earnings_date = calendar.loc['Earnings Date']
-            if isinstance(earnings_date, pd.Series):
-                earnings_date = earnings_date.iloc[0]
-        elif hasattr(calendar, 'columns') and len(calendar.columns) > 0:
-            # Sometimes calendar is a DataFrame with dates as columns
-            earnings_date = calendar.columns[0]
-        else:
-            return ""
-
-        if pd.isna(earnings_date):
-            return ""
-
-        # Convert to datetime if needed
-        if isinstance(earnings_date, str):
-            earnings_date = pd.to_datetime(earnings_date)
-        elif hasattr(earnings_date, 'to_pydatetime'):
-            earnings_date = earnings_date.to_pydatetime()
-
-        # Calculate days until earnings
-        today = datetime.now()
-        if hasattr(earnings_date, 'tzinfo') and earnings_date.tzinfo is not None:
-            earnings_date = earnings_date.replace(tzinfo=None)
-
-        days_until = (earnings_date - today).days
-
-        # If earnings is within 7 days (past or future), show warning
-        if -7 <= days_until <= 7:
-            if days_until < 0:
-                return f"📅 {days_until}d"  # Past (e.g., -1d, -2d)
-            elif days_until == 0:
-                return "📅 Today!"
-            else:
-                return f"📅 {days_until}d"  # Future (e.g., 1d, 3d)
-        return ""
-    except Exception:
+def _earnings_date(calendar) -> Optional[pd.Timestamp]:
+    """Extract the next earnings date (naive, midnight Timestamp) from a yfinance calendar."""
+    if calendar is None:
+        return None
+
+    # Get earnings date
+    if isinstance(calendar, dict):
+        # Newer yfinance returns {'Earnings Date': [date, ...], ...}
+        earnings_date = calendar.get('Earnings Date')
+        if isinstance(earnings_date, list):
+            earnings_date = earnings_date[0] if earnings_date else None
+        if earnings_date is None:
+            return None
+    elif calendar.empty:
+        return None
+    elif 'Earnings Date' in calendar.index:
+        earnings_date = calendar.loc['Earnings Date']
+        if isinstance(earnings_date, pd.Series):
+            earnings_date = earnings_date.iloc[0]
+    elif hasattr(calendar, 'columns') and len(calendar.columns) > 0:
+        # Sometimes calendar is a DataFrame with dates as columns
+        earnings_date = calendar.columns[0]
+    else:
+        return None
+
+    if pd.isna(earnings_date):
+        return None
+
+    # pd.Timestamp accepts str, datetime, date and Timestamp alike
+    earnings_date = pd.Timestamp(earnings_date)
+    if earnings_date.tzinfo is not None:
+        earnings_date = earnings_date.tz_localize(None)
+    return earnings_date.normalize()
+
+
+def _earnings_label(earnings_date: Optional[pd.Timestamp], today: pd.Timestamp) -> str:
+    """Days-until-earnings label when within a week either side, else empty string.
+    today is pd.Timestamp.now().normalize(), computed once by the caller."""
+    if not earnings_date:
         return ""
 
+    # Calculate days until earnings
+    days_until = (earnings_date - today).days
+
+    # If earnings is within 7 days (past or future), show warning
+    if -7 <= days_until <= 7:
+        if days_until < 0:
+            return f"📅 {days_until}d"  # Past (e.g., -1d, -2d)
+        elif days_until == 0:
+            return "📅 Today!"
+        else:
+            return f"📅 {days_until}d"  # Future (e.g., 1d, 3d)
+    return ""
+
 
+# Cache earnings data to avoid repeated API calls
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache for 1 hour
+def _fetch_earnings_chunk(symbols: tuple) -> Dict[str, str]:
+    """Get earnings labels for up to EARNINGS_CHUNK_SIZE symbols via one yf.Tickers.
+    Raw dates are kept on disk for a week, since earnings calendars change weekly."""
+    dates = {}
+    missing = []
+    for sym in symbols:
+        cached = cache_get('earnings', sym)
+        if cached is None:
+            missing.append(sym)
+        else:
+            dates[sym] = cached
+
+    if missing:
+        try:
+            tickers = yf.Tickers(' '.join(missing)).tickers
+        except Exception:
+            tickers = {}
+        for sym in missing:
+            try:
+                earnings_date = _earnings_date(tickers[sym.upper()].calendar)
+            except Exception:
+                dates[sym] = None
+                continue
+            # '' marks "no upcoming date" so symbols without earnings aren't refetched
+            dates[sym] = earnings_date or ''
+            cache_set('earnings', sym, payload=dates[sym], ttl_seconds=TTL_WEEK)
+
+    today = pd.Timestamp.now().normalize()
+    return {sym: _earnings_label(dates[sym], today) for sym in symbols}
+
+
+def _prefetch_earnings(symbols) -> Dict[str, str]:
+    """Fetch earnings labels for all symbols up front, in parallel chunks."""
+    unique = sorted(set(symbols))  # Sorted so chunks (and their cache keys) are stable
+    chunks = [tuple(unique[i:i + EARNINGS_CHUNK_SIZE]) for i in range(0, len(unique), EARNINGS_CHUNK_SIZE)]
+    earnings = {}
+    for labels in _get_executor().map(_fetch_earnings_chunk, chunks):
+        earnings.update(labels)
+    return earnings
+
+
+# Label columns stored as categoricals (None = categories inferred from the data)
+_STATUS_LEVELS = ['Winner', 'Gaining', 'Flat', 'Slight Loss', 'Loser', 'No Data']
+_MOMENTUM_LEVELS = ['Strong', 'Stable', 'Slowing', 'Losing Steam', 'Too Early', 'Unknown']
+CATEGORY_COLUMNS = {
+    'Status': _STATUS_LEVELS,
+    'status': _STATUS_LEVELS,
+    'Momentum': _MOMENTUM_LEVELS,
+    'Direction': None,
+    'direction': None,
+    'Market': None,
+    'market': None,
+}
+
+
+# Table column configs, built once at import instead of on every rerun
+CHART_LINK_COLUMN_CONFIG = {
+    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
+}
+
+PERF_EDITOR_COLUMN_CONFIG = {
+    'Add to WL': st.column_config.CheckboxColumn('WL', width='small', help='Select to add to watchlist'),
+    'Symbol': st.column_config.TextColumn('Symbol', width='small'),
+    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
+    'Option Flow': st.column_config.LinkColumn('Flow', display_text='View', width='small'),
+    'Alert $': st.column_config.NumberColumn('Alert $', format="%.2f"),
+    'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
+    'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
+    'Max Gain %': st.column_config.NumberColumn('Max %', format="%.1f%%"),
+    'Max DD %': st.column_config.NumberColumn('DD %', format="%.1f%%"),
+}
+
+PERF_TABLE_COLUMN_CONFIG = {
+    'Symbol': st.column_config.TextColumn('Symbol', width='small'),
+    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
+    'Option Flow': st.column_config.LinkColumn('Flow', display_text='View', width='small'),
+    'Alert $': st.column_config.NumberColumn('Alert $', format="%.2f"),
+    'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
+    'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%",
+                                           help="Winner ≥ 5%, Loser ≤ -5%"),
+    'Max Gain %': st.column_config.NumberColumn('Max %', format="%.1f%%"),
+    'Max DD %': st.column_config.NumberColumn('DD %', format="%.1f%%"),
+}
+
+
+def _to_arrow(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert to Arrow-backed dtypes so Streamlit can serialize without a copy.
+    Low-cardinality label columns (CATEGORY_COLUMNS) become categoricals."""
+    df = df.convert_dtypes(dtype_backend='pyarrow', convert_integer=False)
+    for col, categories in CATEGORY_COLUMNS.items():
+        if col in df.columns:
+            df[col] = pd.Categorical(df[col].to_numpy(dtype=object, na_value=None), categories=categories)
+    return df
+
+
+def _top_n(df: pd.DataFrame, col: str, n: int, largest: bool = True) -> pd.DataFrame:
+    """nlargest/nsmallest via np.argpartition: O(n) selection, then sort only the n picked rows."""
+    vals = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    idx = np.flatnonzero(~np.isnan(vals))
+    if len(idx) > n:
+        keys = -vals[idx] if largest else vals[idx]
+        idx = idx[np.argpartition(keys, n - 1)[:n]]
+    return df.iloc[idx].sort_values(col, ascending=not largest)
+
+
+def _token_counts(series: pd.Series, split: bool = False, exclude: tuple = ()) -> pd.Series:
+    """Count non-empty values, most frequent first. split=True counts each
+    comma-separated token of a cell separately."""
+    cells = series.astype(str).str.strip()
+    # One mask drops missing, blank and stringified-NaN cells before splitting
+    tokens = cells[series.notna() & (cells != '') & (cells != 'nan')]
+    if split:
+        tokens = tokens.str.split(',').explode().str.strip()
+        tokens = tokens[tokens != '']
+    if exclude:
+        tokens = tokens[~tokens.isin(exclude)]
+    return tokens.value_counts()
+
+
+def _score_buckets(scores: pd.Series) -> list:
+    """[avg score, #5, #6, #7, #8+] from one pd.cut + value_counts pass."""
+    buckets = pd.cut(scores, bins=[4, 5, 6, 7, np.inf], labels=['5', '6', '7', '8+'])
+    counts = buckets.value_counts(sort=False)
+    return [round(scores.mean(), 1)] + [int(c) for c in counts]
+
+
+def _most_common(series: pd.Series) -> str:
+    """Most frequent value in a Series, or 'N/A' when it has no values."""
+    counts = series.value_counts()
+    return counts.idxmax() if not counts.empty else 'N/A'
 
 
 def _safe_market(val) -> str:
@@ -94,69 +270,79 @@ def _safe_market(val) -> str:
     return str(val).upper()
 
 
-def _process_single_alert(alert_dict: dict, alert_date: str, track_days: int) -> dict:
-    """Process a single alert: fetch performance, earnings, and chart URL.
-    Designed to run in a thread pool for parallel execution."""
-    symbol = alert_dict['symbol']
-    alert_market = _safe_market(alert_dict.get('market', 'us'))
-
-    price_data = _cached_fetch_performance(symbol, alert_date, track_days)
-    perf = calculate_performance(alert_dict, price_data)
-    earnings_info = _get_earnings_date(symbol)
-    chart_url = get_chart_url(symbol)
-    uw_url = get_unusual_whales_url(symbol)
+def _alerts_fingerprint(alerts_df: pd.DataFrame) -> int:
+    """Content hash of the alerts a performance table is computed from, so a
+    saved or deleted alert invalidates the session's cached table."""
+    rows = pd.util.hash_pandas_object(
+        alerts_df[['symbol', 'date', 'direction', 'alert_price']], index=False)
+    return hash(rows.to_numpy().tobytes())
 
-    display_symbol = symbol.replace('.NS', '') if symbol.endswith('.NS') else symbol
-
-    return {
-        'Symbol': display_symbol,
-        'Chart': chart_url,
-        'Option Flow': uw_url,
-        'Market': alert_market,
-        'Alert Date': alert_date,
-        'Direction': alert_dict.get('direction', 'N/A'),
-        'Score': alert_dict.get('score', 0),
-        'Setup': alert_dict.get('combo', 'N/A'),
-        'Criteria': alert_dict.get('criteria', ''),
-        'Earnings': earnings_info,
-        'Alert $': alert_dict.get('alert_price', 0),
-        'Now $': perf['current_price'],
-        'P&L %': perf['pnl_pct'],
-        'Max Gain %': perf['max_gain_pct'],
-        'Max DD %': perf['max_drawdown_pct'],
-        'Days': perf['days_tracked'],
-        'Status': perf['status'],
-        'Momentum': perf['momentum'],
-        '_raw_symbol': symbol,
-        '_pattern': alert_dict.get('pattern', ''),
-    }
 
+def _process_alerts_parallel(alerts_df: pd.DataFrame, track_days: int, progress_bar=None) -> pd.DataFrame:
+    """Fetch every alert's price window in parallel, then score all alerts in one batch."""
+    if alerts_df.empty:
+        return pd.DataFrame(columns=list(PERF_COLUMNS))
 
-def _process_alerts_parallel(alerts_df: pd.DataFrame, track_days: int, progress_bar=None) -> List[dict]:
-    """Process all alerts in parallel using a thread pool."""
     total = len(alerts_df)
-    results = [None] * total  # Preserve order
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_idx = {}
-        for idx, (_, alert) in enumerate(alerts_df.iterrows()):
-            alert_dict = alert.to_dict()
-            alert_date = alert_dict['date']
-            future = executor.submit(_process_single_alert, alert_dict, alert_date, track_days)
-            future_to_idx[future] = idx
-
-        completed = 0
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                results[idx] = future.result()
-            except Exception:
-                pass  # Skip failed alerts
-            completed += 1
-            if progress_bar:
-                progress_bar.progress(completed / total, text=f"Processing {completed}/{total}...")
+    symbols = alerts_df['symbol'].tolist()
+    dates = alerts_df['date'].tolist()
+
+    # One batched earnings pass instead of a calendar request per alert
+    unique_symbols = alerts_df['symbol'].unique()
+    earnings = _prefetch_earnings(unique_symbols)
+    urls = {sym: (get_chart_url(sym), get_unusual_whales_url(sym)) for sym in unique_symbols}
+
+    # Download all price windows over one pooled async client; workers then hit the cache
+    def _on_prefetch(done, n):
+        if progress_bar:
+            progress_bar.progress(done / n, text=f"Downloading prices {done}/{n}...")
+
+    prefetch_performance_data(list(zip(symbols, dates, [track_days] * total)), _on_prefetch)
+
+    price_frames = [None] * total  # Preserve order
+    executor = _get_executor()
+    future_to_idx = {
+        executor.submit(_cached_fetch_performance, sym, alert_date, track_days): idx
+        for idx, (sym, alert_date) in enumerate(zip(symbols, dates))
+    }
 
-    return [r for r in results if r is not None]
+    completed = 0
+    for future in as_completed(future_to_idx):
+        try:
+            price_frames[future_to_idx[future]] = future.result()
+        except Exception:
+            pass  # Scored as 'No Data'
+        completed += 1
+        if progress_bar:
+            progress_bar.progress(completed / total, text=f"Processing {completed}/{total}...")
+
+    # P&L / max gain / drawdown / momentum for all alerts in one vectorized pass
+    perf = calculate_performance_frame(alerts_df, price_frames)
+
+    chart_urls, uw_urls = zip(*(urls[sym] for sym in symbols))
+    data = {
+        'Symbol': [get_clean_symbol(sym) for sym in symbols],
+        'Chart': list(chart_urls),
+        'Option Flow': list(uw_urls),
+        'Market': [_safe_market(m) for m in alerts_df['market']],
+        'Alert Date': dates,
+        'Direction': alerts_df['direction'].to_numpy(),
+        'Score': alerts_df['score'].to_numpy(),
+        'Setup': alerts_df['combo'].to_numpy(),
+        'Criteria': alerts_df['criteria'].to_numpy(),
+        'Earnings': [earnings.get(sym, "") for sym in symbols],
+        'Alert $': alerts_df['alert_price'].to_numpy(dtype=np.float64),
+        'Now $': perf['current_price'].to_numpy(),
+        'P&L %': perf['pnl_pct'].to_numpy(),
+        'Max Gain %': perf['max_gain_pct'].to_numpy(),
+        'Max DD %': perf['max_drawdown_pct'].to_numpy(),
+        'Days': perf['days_tracked'].to_numpy(),
+        'Status': perf['status'].to_numpy(),
+        'Momentum': perf['momentum'].to_numpy(),
+        '_raw_symbol': symbols,
+        '_pattern': alerts_df['pattern'].to_numpy(),
+    }
+    return pd.DataFrame(data, copy=False)
 
 
 def _scan_entry_signals(symbols: list, daily_data: Dict[str, pd.DataFrame],
@@ -170,22 +356,19 @@ def _scan_entry_signals(symbols: list, daily_data: Dict[str, pd.DataFrame],
     if setup_map is None:
         setup_map = {}
     signals = []
-    skipped = 0
-    seen = set()
-    for sym in symbols:
-        if sym in seen:
-            continue
-        seen.add(sym)
-        if sym not in daily_data:
-            skipped += 1
-            continue
-        results = detect_entry_signal(daily_data[sym], strategy='trend_following')
+    unique_syms = list(dict.fromkeys(symbols))
+    scan_data = {sym: daily_data[sym] for sym in unique_syms if sym in daily_data}
+    skipped = len(unique_syms) - len(scan_data)
+
+    batch_results = detect_entry_signal_batch(scan_data, strategy='trend_following')
+    for sym, results in batch_results.items():
+        # Per-symbol values, shared by its bullish and bearish signals
+        clean_sym, chart_url, setup = get_clean_symbol(sym), get_chart_url(sym), setup_map.get(sym, '')
         for result in results:
-            display_sym = sym.replace('.NS', '') if sym.endswith('.NS') else sym
-            result['symbol'] = display_sym
+            result['symbol'] = clean_sym
             result['_raw_symbol'] = sym
-            result['chart_url'] = get_chart_url(sym)
-            result['setup'] = setup_map.get(sym, '')
+            result['chart_url'] = chart_url
+            result['setup'] = setup
             signals.append(result)
 
     # Sort: Strong first, then Moderate; within same strength bullish first
@@ -200,26 +383,26 @@ def _build_entry_signals_df(signals: list) -> pd.DataFrame:
     rows = []
     for sig in signals:
         d = sig['details']
-        rows.append({
-            'Symbol': sig['symbol'],
-            'Chart': sig.get('chart_url', ''),
-            'Direction': sig.get('direction', ''),
-            'Setup': sig.get('setup', ''),
-            'Strength': sig['strength'],
-            'Entry $': sig['entry_price'],
-            'EMA20': sig['ema20'],
-            'Pullback %': sig['pullback_pct'],
-            'Stop $': sig['stop_loss'],
-            'Target 1': sig['target_1'],
-            'Target 2': sig['target_2'],
-            'Risk %': sig['risk_pct'],
-            'ADX': d.get('adx') if d.get('adx') is not None else 0,
-            'RSI': d.get('rsi') if d.get('rsi') is not None else 0,
-            'Vol Ratio': d.get('volume_ratio') if d.get('volume_ratio') is not None else 0,
-            'Conditions': ', '.join(sig['conditions_met']),
-            'Missing': ', '.join(sig['conditions_missing']),
-        })
-    return pd.DataFrame(rows)
+        rows.append((
+            sig['symbol'],
+            sig.get('chart_url', ''),
+            sig.get('direction', ''),
+            sig.get('setup', ''),
+            sig['strength'],
+            sig['entry_price'],
+            sig['ema20'],
+            sig['pullback_pct'],
+            sig['stop_loss'],
+            sig['target_1'],
+            sig['target_2'],
+            sig['risk_pct'],
+            d.get('adx') if d.get('adx') is not None else 0,
+            d.get('rsi') if d.get('rsi') is not None else 0,
+            d.get('volume_ratio') if d.get('volume_ratio') is not None else 0,
+            ', '.join(sig['conditions_met']),
+            ', '.join(sig['conditions_missing']),
+        ))
+    return rows_to_frame(rows, ENTRY_SIGNAL_COLUMNS, ENTRY_SIGNAL_FLOAT_COLUMNS)
 
 
 def _render_entry_signals(signals: list, skipped_count: int, key_prefix: str):
@@ -243,53 +426,14 @@ def _render_entry_signals(signals: list, skipped_count: int, key_prefix: str):
     # Build and display table
     sig_df = _build_entry_signals_df(signals)
 
-    def color_strength(val):
-        if val == 'Strong':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Moderate':
-            return 'background-color: #ff8f00; color: black'
-        return ''
-
-    def color_direction(val):
-        if val == 'Bullish':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Bearish':
-            return 'background-color: #b71c1c; color: white'
-        return ''
-
-    col_order = [
-        'Symbol', 'Chart', 'Direction', 'Setup', 'Strength',
-        'Entry $', 'EMA20', 'Pullback %',
-        'Stop $', 'Target 1', 'Target 2', 'Risk %',
-        'ADX', 'RSI', 'Vol Ratio', 'Conditions', 'Missing',
-    ]
-
     st.dataframe(
         sig_df.style
-            .applymap(color_strength, subset=['Strength'])
-            .applymap(color_direction, subset=['Direction']),
+            .apply(css_from_map, css_map=STRENGTH_CSS, subset=['Strength'])
+            .apply(css_from_map, css_map=DIRECTION_CSS, subset=['Direction']),
         use_container_width=True,
         hide_index=True,
-        column_order=col_order,
-        column_config={
-            'Symbol': st.column_config.TextColumn('Symbol', width='small'),
-            'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-            'Direction': st.column_config.TextColumn('Direction', width='small'),
-            'Setup': st.column_config.TextColumn('Setup', width='small'),
-            'Strength': st.column_config.TextColumn('Signal', width='small'),
-            'Entry $': st.column_config.NumberColumn('Entry $', format="%.2f"),
-            'EMA20': st.column_config.NumberColumn('EMA20', format="%.2f"),
-            'Pullback %': st.column_config.NumberColumn('Pullback %', format="%.1f%%"),
-            'Stop $': st.column_config.NumberColumn('Stop $', format="%.2f"),
-            'Target 1': st.column_config.NumberColumn('T1 (2:1)', format="%.2f"),
-            'Target 2': st.column_config.NumberColumn('T2 (3:1)', format="%.2f"),
-            'Risk %': st.column_config.NumberColumn('Risk %', format="%.1f%%"),
-            'ADX': st.column_config.NumberColumn('ADX', format="%.0f"),
-            'RSI': st.column_config.NumberColumn('RSI', format="%.0f"),
-            'Vol Ratio': st.column_config.NumberColumn('Vol', format="%.1fx"),
-            'Conditions': st.column_config.TextColumn('Conditions Met', width='large'),
-            'Missing': st.column_config.TextColumn('Missing', width='medium'),
-        },
+        column_order=list(ENTRY_SIGNAL_COLUMNS),
+        column_config=ENTRY_SIGNAL_COLUMN_CONFIG,
     )
 
 
@@ -388,6 +532,7 @@ def _render_live_tracker(daily_data: Dict[str, pd.DataFrame], market: str):
     with col_clear:
         if st.button("🗑️ Clear alerts older than 60 days"):
             removed = clear_old_alerts(60)
+            _cached_alerts_by_date.clear()
             st.success(f"Removed {removed} old alerts")
 
     # Convert filter values for query
@@ -414,12 +559,18 @@ def _render_live_tracker(daily_data: Dict[str, pd.DataFrame], market: str):
 
     st.info(f"📋 **{len(alerts_df)} alerts** from the last {days_back} days")
 
-    # Calculate performance for each alert (parallel)
-    progress_bar = st.progress(0, text="Calculating performance...")
-    performance_data = _process_alerts_parallel(alerts_df, track_days, progress_bar)
-    progress_bar.empty()
-
-    perf_df = pd.DataFrame(performance_data)
+    # Reuse this session's result when only the status/momentum filters changed
+    cache_key = (market_query, direction_query, setup_query, days_back, track_days,
+                 _alerts_fingerprint(alerts_df))
+    cached = st.session_state.get('_tracker_perf_cache')
+    if cached and cached['key'] == cache_key and time.time() - cached['ts'] <= TRACKER_SESSION_TTL:
+        perf_df = cached['perf_df']
+    else:
+        # Calculate performance for each alert (parallel)
+        progress_bar = st.progress(0, text="Calculating performance...")
+        perf_df = _to_arrow(_process_alerts_parallel(alerts_df, track_days, progress_bar))
+        progress_bar.empty()
+        st.session_state['_tracker_perf_cache'] = {'key': cache_key, 'ts': time.time(), 'perf_df': perf_df}
 
     if perf_df.empty:
         st.warning("Could not calculate performance data")
@@ -446,15 +597,26 @@ def _render_live_tracker(daily_data: Dict[str, pd.DataFrame], market: str):
             key='momentum_filter'
         )
 
-    # Apply filters
-    filtered_df = perf_df.copy()
-    if status_filter:
-        filtered_df = filtered_df[filtered_df['Status'].isin(status_filter)]
-    if momentum_filter:
-        filtered_df = filtered_df[filtered_df['Momentum'].isin(momentum_filter)]
+    # Apply filters as one boolean mask over the raw arrays; no filter means no new frame
+    filtered_df = perf_df
+    if status_filter or momentum_filter:
+        mask = np.ones(len(perf_df), dtype=bool)
+        if status_filter:
+            mask &= np.isin(perf_df['Status'].to_numpy(), status_filter)
+        if momentum_filter:
+            mask &= np.isin(perf_df['Momentum'].to_numpy(), momentum_filter)
+        filtered_df = perf_df[mask]
+
+    # Paginate so table render cost scales with the page, not the history
+    n_pages = max((len(filtered_df) + TRACKER_PAGE_SIZE - 1) // TRACKER_PAGE_SIZE, 1)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages,
+                               value=1, step=1, key='tracker_page')
+    page_df = filtered_df.iloc[(page - 1) * TRACKER_PAGE_SIZE:page * TRACKER_PAGE_SIZE]
 
     # Display table with styling
-    _render_performance_table(filtered_df, key='tracker_perf')
+    _render_performance_table(page_df, key=f'tracker_perf_p{page}')
 
     # Alerts losing steam section
     losing_steam_df = perf_df[perf_df['Momentum'] == 'Losing Steam']
@@ -465,41 +627,43 @@ def _render_live_tracker(daily_data: Dict[str, pd.DataFrame], market: str):
             losing_steam_df[['Symbol', 'Chart', 'Market', 'Alert Date', 'Direction', 'Setup', 'Earnings', 'P&L %', 'Max Gain %', 'Days']],
             use_container_width=True,
             hide_index=True,
-            column_config={
-                'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-            }
+            column_config=CHART_LINK_COLUMN_CONFIG
         )
 
     # Top and bottom performers side by side
     col_top, col_bottom = st.columns(2)
 
     with col_top:
-        top_df = perf_df.nlargest(5, 'P&L %')
+        top_df = _top_n(perf_df, 'P&L %', 5)
         if not top_df.empty:
             st.subheader("🏆 Top 5 Performers")
             st.dataframe(
                 top_df[['Symbol', 'Chart', 'Direction', 'Setup', 'Earnings', 'P&L %', 'Max Gain %', 'Status']],
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-                }
+                column_config=CHART_LINK_COLUMN_CONFIG
             )
 
     with col_bottom:
-        bottom_df = perf_df.nsmallest(5, 'P&L %')
+        bottom_df = _top_n(perf_df, 'P&L %', 5, largest=False)
         if not bottom_df.empty:
             st.subheader("📉 Bottom 5 Performers")
             st.dataframe(
                 bottom_df[['Symbol', 'Chart', 'Direction', 'Setup', 'Earnings', 'P&L %', 'Max DD %', 'Status']],
                 use_container_width=True,
                 hide_index=True,
-                column_config={
-                    'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-                }
+                column_config=CHART_LINK_COLUMN_CONFIG
             )
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _saved_tracker_signals() -> tuple:
+    """Active Tracker signals plus their (symbol, signal_date, direction) key set.
+    Short TTL; cleared explicitly whenever signals are saved or closed."""
+    rows = db_load_active_entry_signals(source='Tracker')
+    return rows, {(r['symbol'], r['signal_date'], r['direction']) for r in rows}
+
+
 def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
     """Entry Signals tab — saved signals from DB + live scan for new ones."""
 
@@ -507,7 +671,7 @@ def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
     st.subheader("🗂️ Saved Entry Signals")
     st.caption("Persisted across sessions. Close a signal when your trade is done.")
 
-    saved = db_load_active_entry_signals(source='Tracker')
+    saved, saved_keys = _saved_tracker_signals()
 
     if saved:
         _render_tracker_saved_signals(saved, daily_data, key_prefix='tracker_saved')
@@ -529,6 +693,11 @@ def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
             key='entry_sig_days'
         )
 
+    # Nothing to scan against until market data has loaded
+    if not daily_data:
+        st.warning("Market data still loading…")
+        return
+
     # Load tracked symbols
     market_query = market if market != 'all' else None
     alerts_df = get_historical_alerts(days_back, market=market_query)
@@ -538,12 +707,12 @@ def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
         return
 
     # Build symbol -> setup mapping from historical alerts
-    tracker_symbols = alerts_df['symbol'].unique().tolist()
-    setup_map = {}
-    for _, row in alerts_df.iterrows():
-        sym = row.get('symbol', '')
-        if sym and sym not in setup_map:
-            setup_map[sym] = row.get('combo', '')
+    first_alerts = alerts_df.drop_duplicates('symbol', keep='first')
+    tracker_symbols = first_alerts['symbol'].tolist()
+    setup_map = dict(zip(tracker_symbols, first_alerts['combo'].fillna('')))
+    if not tracker_symbols:
+        st.info("No tracked symbols.")
+        return
 
     st.markdown(f"Scanning **{len(tracker_symbols)}** unique symbols from {len(alerts_df)} alerts...")
 
@@ -552,7 +721,6 @@ def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
 
     # Filter out signals already saved (same symbol + today + direction)
     today = datetime.now().strftime('%Y-%m-%d')
-    saved_keys = {(s['symbol'], s['signal_date'], s['direction']) for s in saved}
     new_signals = [
         s for s in entry_signals
         if (s['_raw_symbol'], today, s.get('direction', '')) not in saved_keys
@@ -614,6 +782,7 @@ def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
                 })
             count = db_save_entry_signals(to_save)
             if count > 0:
+                _saved_tracker_signals.clear()
                 st.success(f"Saved {count} new entry signal(s)")
                 st.rerun()
             else:
@@ -628,45 +797,42 @@ def _render_entry_signals_tab(daily_data: Dict[str, pd.DataFrame], market: str):
 def _render_tracker_saved_signals(saved: list, daily_data: Dict[str, pd.DataFrame],
                                    key_prefix: str):
     """Render saved entry signals table with live performance data (Tracker)."""
-    rows = []
-    for sig in saved:
-        raw_sym = sig['symbol']
-        display_sym = raw_sym.replace('.NS', '') if raw_sym.endswith('.NS') else raw_sym
-
-        # Get current price from daily_data
-        if raw_sym in daily_data and not daily_data[raw_sym].empty:
-            current_price = float(daily_data[raw_sym]['Close'].iloc[-1])
-        else:
-            current_price = sig['entry_price']
-
-        perf = compute_signal_performance(sig, current_price)
-
-        rows.append({
-            '_id': sig['id'],
-            'Symbol': display_sym,
-            'Chart': get_chart_url(raw_sym),
-            'Direction': sig['direction'],
-            'Setup': sig.get('setup', ''),
-            'Strength': sig['strength'],
-            'Signal Date': sig['signal_date'],
-            'Days Held': perf['days_held'],
-            'Entry $': sig['entry_price'],
-            'Now $': perf['current_price'],
-            'P&L %': perf['pnl_pct'],
-            'Stop $': sig['stop_loss'],
-            'T1 (2:1)': sig['target_1'],
-            'T2 (3:1)': sig['target_2'],
-            'Risk %': sig['risk_pct'],
-            'Status': perf['status_hint'],
-        })
-
-    df = pd.DataFrame(rows)
+    sig_df = pd.DataFrame(saved)
 
-    # Summary metrics
-    total = len(df)
-    active = len(df[df['Status'] == 'Active'])
-    winners = len(df[df['P&L %'] > 0])
-    avg_pnl = df['P&L %'].mean() if total > 0 else 0
+    # Current price from daily_data, one last-close lookup per symbol
+    last_close = {
+        sym: float(daily_data[sym]['Close'].values[-1])
+        for sym in sig_df['symbol'].unique()
+        if sym in daily_data and not daily_data[sym].empty
+    }
+    now_prices = sig_df['symbol'].map(last_close).fillna(sig_df['entry_price'])
+    perf = compute_signal_performance_batch(sig_df, now_prices)
+
+    df = pd.DataFrame({
+        '_id': sig_df['id'],
+        'Symbol': sig_df['symbol'].str.removesuffix('.NS'),
+        'Chart': sig_df['symbol'].map({sym: get_chart_url(sym) for sym in sig_df['symbol'].unique()}),
+        'Direction': sig_df['direction'],
+        'Setup': sig_df['setup'],
+        'Strength': sig_df['strength'],
+        'Signal Date': sig_df['signal_date'],
+        'Days Held': perf['days_held'],
+        'Entry $': sig_df['entry_price'],
+        'Now $': perf['current_price'],
+        'P&L %': perf['pnl_pct'],
+        'Stop $': sig_df['stop_loss'],
+        'T1 (2:1)': sig_df['target_1'],
+        'T2 (3:1)': sig_df['target_2'],
+        'Risk %': sig_df['risk_pct'],
+        'Status': perf['status_hint'],
+    })
+
+    # Summary metrics, as boolean reductions over plain arrays (no filtered sub-frames)
+    pnl = df['P&L %'].to_numpy(dtype=float)
+    total = pnl.size
+    active = int((df['Status'].to_numpy() == 'Active').sum())
+    winners = int((pnl > 0).sum())
+    avg_pnl = float(np.nanmean(pnl)) if total > 0 else 0
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
@@ -678,81 +844,71 @@ def _render_tracker_saved_signals(saved: list, daily_data: Dict[str, pd.DataFram
     with c4:
         st.metric("Avg P&L", f"{avg_pnl:.1f}%")
 
-    def color_pnl(val):
-        if val >= 5:
-            return 'background-color: #1b5e20; color: white'
-        elif val >= 0:
-            return 'background-color: #2e7d32; color: white'
-        elif val >= -5:
-            return 'background-color: #ff8f00; color: black'
-        else:
-            return 'background-color: #b71c1c; color: white'
-
-    def color_status(val):
-        if val == 'Target Hit':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Stopped Out':
-            return 'background-color: #b71c1c; color: white'
-        elif val == 'Active':
-            return 'background-color: #1565c0; color: white'
-        return ''
-
     display_cols = [c for c in df.columns if c != '_id']
 
     st.dataframe(
         df[display_cols].style
-            .applymap(color_pnl, subset=['P&L %'])
-            .applymap(color_status, subset=['Status']),
+            .apply(pnl_css, subset=['P&L %'])
+            .apply(css_from_map, css_map=SIGNAL_STATUS_CSS, subset=['Status']),
         use_container_width=True,
         hide_index=True,
-        column_config={
-            'Symbol': st.column_config.TextColumn('Symbol', width='small'),
-            'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-            'Direction': st.column_config.TextColumn('Dir', width='small'),
-            'Setup': st.column_config.TextColumn('Setup', width='small'),
-            'Strength': st.column_config.TextColumn('Signal', width='small'),
-            'Signal Date': st.column_config.TextColumn('Triggered', width='small'),
-            'Days Held': st.column_config.NumberColumn('Days', format="%d"),
-            'Entry $': st.column_config.NumberColumn('Entry $', format="%.2f"),
-            'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
-            'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
-            'Stop $': st.column_config.NumberColumn('Stop $', format="%.2f"),
-            'T1 (2:1)': st.column_config.NumberColumn('T1', format="%.2f"),
-            'T2 (3:1)': st.column_config.NumberColumn('T2', format="%.2f"),
-            'Risk %': st.column_config.NumberColumn('Risk %', format="%.1f%%"),
-            'Status': st.column_config.TextColumn('Status', width='small'),
-        },
+        column_config=SAVED_SIGNAL_COLUMN_CONFIG,
     )
 
     # Close signals management
-    options = [f"{row['Symbol']} ({row['Direction']}, {row['Signal Date']})" for _, row in df.iterrows()]
     id_list = df['_id'].tolist()
+    exit_prices = df['Now $'].tolist()
+    options = [
+        f"{sym} ({direction}, {signal_date})"
+        for sym, direction, signal_date in zip(df['Symbol'], df['Direction'], df['Signal Date'])
+    ]
+    option_idx = {label: idx for idx, label in enumerate(options)}
 
     to_close = st.multiselect("Select signals to close", options=options, key=f'{key_prefix}_close')
 
     if to_close and st.button("Close Selected", key=f'{key_prefix}_close_btn'):
         closed = 0
         for label in to_close:
-            idx = options.index(label)
-            sig_id = id_list[idx]
-            now_price = df.iloc[idx]['Now $']
+            idx = option_idx[label]
             if db_update_entry_signal_status(
-                sig_id, 'Closed',
-                exit_price=now_price,
+                id_list[idx], 'Closed',
+                exit_price=exit_prices[idx],
                 exit_date=datetime.now().strftime('%Y-%m-%d')
             ):
                 closed += 1
         if closed > 0:
+            _saved_tracker_signals.clear()
             st.success(f"Closed {closed} signal(s)")
             st.rerun()
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_alerts_by_date(date_str: str, market_query: Optional[str]) -> pd.DataFrame:
+    """Cached get_alerts_by_date for past days, whose alerts only change when
+    old alerts are cleared (which clears this cache). Today's alerts are still
+    being saved, so _alerts_by_date reads them uncached."""
+    return get_alerts_by_date(date_str, market_query)
+
+
+def _alerts_by_date(date_str: str, market_query: Optional[str]) -> pd.DataFrame:
+    if date_str == date.today().isoformat():
+        return get_alerts_by_date(date_str, market_query)
+    return _cached_alerts_by_date(date_str, market_query)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_weekly_summary(weeks_back: int, market_query: Optional[str], cache_date: str) -> dict:
+    """Cached get_weekly_summary. cache_date (today's ISO date) rolls the key daily."""
+    return get_weekly_summary(weeks_back, market_query)
+
+
 def _render_calendar_view(market: str):
     """Calendar-based historical view of alerts."""
     st.caption("Select a past date to see which alerts were triggered and how they performed since then.")
 
-    # Get available dates
-    available_dates = get_available_dates()
+    # Get available dates (newest first, plus a set for membership checks)
+    date_index = get_available_dates_index()
+    available_dates = date_index['dates']
 
     if not available_dates:
         st.info("No historical alerts found. Save some alerts first!")
@@ -761,13 +917,13 @@ def _render_calendar_view(market: str):
     col1, col2 = st.columns([1, 1])
 
     with col1:
-        # Date selector
-        min_date = datetime.strptime(min(available_dates), '%Y-%m-%d').date()
-        max_date = datetime.strptime(max(available_dates), '%Y-%m-%d').date()
+        # Date selector (dates come back newest first, so no min/max scan needed)
+        min_date = datetime.strptime(available_dates[-1], '%Y-%m-%d').date()
+        max_date = datetime.strptime(available_dates[0], '%Y-%m-%d').date()
 
         selected_date = st.date_input(
             "Select Alert Date",
-            value=datetime.strptime(available_dates[0], '%Y-%m-%d').date(),
+            value=max_date,
             min_value=min_date,
             max_value=max_date,
             key='calendar_date'
@@ -785,15 +941,15 @@ def _render_calendar_view(market: str):
     market_query = None if market_filter == 'All' else market_filter.lower()
 
     # Check if this date has alerts
-    if date_str not in available_dates:
+    if date_str not in date_index['set']:
         st.warning(f"No alerts found for {date_str}. Try selecting a different date.")
         st.markdown("**Dates with alerts:**")
-        for d in available_dates[:10]:
+        for d in date_index['recent']:
             st.caption(f"• {d}")
         return
 
     # Get alerts for selected date
-    alerts_df = get_alerts_by_date(date_str, market_query)
+    alerts_df = _alerts_by_date(date_str, market_query)
 
     if alerts_df.empty:
         st.info(f"No alerts for {date_str} in {market_filter} market")
@@ -807,11 +963,9 @@ def _render_calendar_view(market: str):
 
     # Calculate performance till today (parallel)
     progress_bar = st.progress(0, text="Calculating performance...")
-    performance_data = _process_alerts_parallel(alerts_df, days_since, progress_bar)
+    perf_df = _to_arrow(_process_alerts_parallel(alerts_df, days_since, progress_bar))
     progress_bar.empty()
 
-    perf_df = pd.DataFrame(performance_data)
-
     if not perf_df.empty:
         # Summary for this date
         _render_summary_metrics(perf_df)
@@ -845,8 +999,11 @@ def _render_weekly_summary(market: str):
 
     market_query = None if market_filter == 'All' else market_filter.lower()
 
+    if st.button("🔄 Refresh", key='weekly_refresh', help="Recompute the report with the latest prices"):
+        _cached_weekly_summary.clear()
+
     with st.spinner("Generating weekly summary..."):
-        summary = get_weekly_summary(weeks_back, market_query)
+        summary = _cached_weekly_summary(weeks_back, market_query, date.today().isoformat())
 
     if summary['total_alerts'] == 0:
         st.info(f"No alerts found in the last {weeks_back} week(s)")
@@ -940,21 +1097,38 @@ def _render_weekly_summary(market: str):
             st.caption("No data")
 
 
+def _summary_stats(pnl: np.ndarray, momentum: np.ndarray) -> dict:
+    """Compute summary metric values from P&L and Momentum columns in one numpy pass."""
+    winners = int((pnl >= 5).sum())
+    losers = int((pnl <= -5).sum())
+    return {
+        'total': len(pnl),
+        'winners': winners,
+        'losers': losers,
+        'flat': len(pnl) - winners - losers,
+        'avg_pnl': float(np.nanmean(pnl)) if len(pnl) else float('nan'),
+        'losing_steam': int((momentum == 'Losing Steam').sum()),
+    }
+
+
 def _render_summary_metrics(perf_df: pd.DataFrame):
     """Render summary metrics row."""
     st.subheader("📊 Performance Summary")
     col1, col2, col3, col4, col5 = st.columns(5)
 
-    winners = len(perf_df[perf_df['P&L %'] >= 5])
-    losers = len(perf_df[perf_df['P&L %'] <= -5])
-    flat = len(perf_df) - winners - losers
-    avg_pnl = perf_df['P&L %'].mean()
-    losing_steam = len(perf_df[perf_df['Momentum'] == 'Losing Steam'])
+    stats = _summary_stats(perf_df['P&L %'].to_numpy(dtype=np.float64, na_value=np.nan),
+                           perf_df['Momentum'].to_numpy(dtype=object, na_value=''))
+    total = stats['total']
+    winners = stats['winners']
+    losers = stats['losers']
+    flat = stats['flat']
+    avg_pnl = stats['avg_pnl']
+    losing_steam = stats['losing_steam']
 
     with col1:
-        st.metric("🟢 Winners (>5%)", winners, delta=f"{winners/len(perf_df)*100:.0f}% win rate")
+        st.metric("🟢 Winners (>5%)", winners, delta=f"{winners/total*100:.0f}% win rate")
     with col2:
-        st.metric("🔴 Losers (<-5%)", losers, delta=f"-{losers/len(perf_df)*100:.0f}%", delta_color="inverse")
+        st.metric("🔴 Losers (<-5%)", losers, delta=f"-{losers/total*100:.0f}%", delta_color="inverse")
     with col3:
         st.metric("⚪ Flat", flat, help="P&L between -5% and +5%")
     with col4:
@@ -963,45 +1137,20 @@ def _render_summary_metrics(perf_df: pd.DataFrame):
         st.metric("⚠️ Losing Steam", losing_steam, delta="Exit candidates" if losing_steam > 0 else "None", delta_color="off")
 
 
+@_fragment
 def _render_performance_table(perf_df: pd.DataFrame, key: str = 'perf_table', editable: bool = True):
-    """Render styled performance dataframe with optional checkbox for watchlist."""
-    # Style functions
-    def color_pnl(val):
-        if val >= 5:
-            return 'background-color: #1b5e20; color: white'
-        elif val >= 0:
-            return 'background-color: #2e7d32; color: white'
-        elif val >= -5:
-            return 'background-color: #ff8f00; color: black'
-        else:
-            return 'background-color: #b71c1c; color: white'
-
-    def color_momentum(val):
-        if val == 'Strong':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Stable':
-            return 'background-color: #2e7d32; color: white'
-        elif val == 'Slowing':
-            return 'background-color: #ff8f00; color: black'
-        elif val == 'Losing Steam':
-            return 'background-color: #b71c1c; color: white'
-        return ''
-
+    """Render styled performance dataframe with optional checkbox for watchlist.
+    Runs as a fragment: ticking checkboxes reruns only this table, reusing perf_df."""
     # Filter out internal columns from display
     display_cols = [c for c in perf_df.columns if not c.startswith('_')]
 
     if editable:
         # Add checkbox column for watchlist selection (single load for efficiency)
         wl_symbols = get_watchlist_symbols()
-        edit_df = perf_df[display_cols].copy()
-        # Build a mapping from display symbol to raw symbol for WL check
-        raw_sym_map = {}
-        if '_raw_symbol' in perf_df.columns:
-            for i, row in perf_df.iterrows():
-                raw_sym_map[row['Symbol']] = row['_raw_symbol']
-        edit_df.insert(0, 'Add to WL', edit_df['Symbol'].apply(
-            lambda s: raw_sym_map.get(s, s) in wl_symbols
-        ))
+        edit_df = perf_df[display_cols]
+        # Watchlist stores raw symbols (with .NS); check membership row-aligned in one pass
+        raw_syms = perf_df['_raw_symbol'] if '_raw_symbol' in perf_df.columns else edit_df['Symbol']
+        edit_df.insert(0, 'Add to WL', raw_syms.isin(wl_symbols).to_numpy())
 
         # Column order: WL, Symbol, Chart first, then the rest
         tracker_col_order = [
@@ -1019,45 +1168,30 @@ def _render_performance_table(perf_df: pd.DataFrame, key: str = 'perf_table', ed
             key=key,
             column_order=tracker_col_order,
             disabled=[c for c in edit_df.columns if c != 'Add to WL'],
-            column_config={
-                'Add to WL': st.column_config.CheckboxColumn('WL', width='small', help='Select to add to watchlist'),
-                'Symbol': st.column_config.TextColumn('Symbol', width='small'),
-                'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-                'Option Flow': st.column_config.LinkColumn('Flow', display_text='View', width='small'),
-                'Alert $': st.column_config.NumberColumn('Alert $', format="%.2f"),
-                'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
-                'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
-                'Max Gain %': st.column_config.NumberColumn('Max %', format="%.1f%%"),
-                'Max DD %': st.column_config.NumberColumn('DD %', format="%.1f%%"),
-            }
+            column_config=PERF_EDITOR_COLUMN_CONFIG
         )
 
         # Add to watchlist button
         if st.button("Add Selected to Watchlist", key=f'{key}_wl_btn', help="Add all checked stocks to your watchlist"):
-            added = 0
-            skipped = 0
-            for idx, row in edited_df.iterrows():
-                if row['Add to WL']:
-                    # Get the raw symbol from perf_df
-                    raw_sym = perf_df.iloc[idx].get('_raw_symbol', row['Symbol'])
-                    if is_in_watchlist(raw_sym):
-                        continue
-                    alert_date = row.get('Alert Date', datetime.now().strftime('%Y-%m-%d'))
-                    ok = add_to_watchlist(
-                        symbol=raw_sym,
-                        direction=row['Direction'],
-                        score=int(row['Score']),
-                        alert_price=float(row.get('Alert $', 0)),
-                        criteria=row.get('Criteria', ''),
-                        pattern=perf_df.iloc[idx].get('_pattern', ''),
-                        combo=row.get('Setup', ''),
-                        market=row.get('Market', 'US').lower(),
-                        alert_date=alert_date,
-                    )
-                    if ok:
-                        added += 1
-                    else:
-                        skipped += 1
+            selected = edited_df[edited_df['Add to WL'].to_numpy(dtype=bool)]
+            src = perf_df.loc[selected.index]
+            raw_syms = src['_raw_symbol'] if '_raw_symbol' in src.columns else selected['Symbol']
+            patterns = src['_pattern'] if '_pattern' in src.columns else [''] * len(selected)
+
+            # One upfront set-diff against the watchlist, then a single batched insert
+            existing = get_watchlist_symbols()
+            entries = [
+                {'symbol': raw, 'direction': direction, 'score': score, 'alert_price': price,
+                 'criteria': criteria, 'pattern': pattern, 'combo': combo, 'market': mkt,
+                 'alert_date': alert_date}
+                for raw, direction, score, price, criteria, pattern, combo, mkt, alert_date in zip(
+                    raw_syms, selected['Direction'], selected['Score'], selected['Alert $'],
+                    selected['Criteria'], patterns, selected['Setup'], selected['Market'],
+                    selected['Alert Date'])
+                if raw not in existing
+            ]
+            added = add_to_watchlist_bulk(entries)
+            skipped = len(entries) - added
             if added > 0:
                 st.success(f"Added {added} stock(s) to watchlist!")
                 st.rerun()
@@ -1076,22 +1210,11 @@ def _render_performance_table(perf_df: pd.DataFrame, key: str = 'perf_table', ed
             'Days', 'Status', 'Momentum',
         ]
         st.dataframe(
-            display_df.style
-                .applymap(color_pnl, subset=['P&L %'])
-                .applymap(color_momentum, subset=['Momentum']),
+            display_df.style.apply(css_from_map, css_map=MOMENTUM_CSS, subset=['Momentum']),
             use_container_width=True,
             hide_index=True,
             column_order=readonly_col_order,
-            column_config={
-                'Symbol': st.column_config.TextColumn('Symbol', width='small'),
-                'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-                'Option Flow': st.column_config.LinkColumn('Flow', display_text='View', width='small'),
-                'Alert $': st.column_config.NumberColumn('Alert $', format="%.2f"),
-                'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
-                'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
-                'Max Gain %': st.column_config.NumberColumn('Max %', format="%.1f%%"),
-                'Max DD %': st.column_config.NumberColumn('DD %', format="%.1f%%"),
-            }
+            column_config=PERF_TABLE_COLUMN_CONFIG
         )
 
 
@@ -1116,40 +1239,25 @@ def _render_winner_analytics(market: str):
         st.info("No alerts found for analysis. Save more alerts first!")
         return
 
-    # Calculate performance for all alerts (parallel)
-    def _process_analytics_alert(alert_dict: dict) -> dict:
-        symbol = alert_dict['symbol']
-        alert_date = alert_dict['date']
-        price_data = _cached_fetch_performance(symbol, alert_date, 20)
-        perf = calculate_performance(alert_dict, price_data)
-        return {
-            'symbol': symbol,
-            'date': alert_date,
-            'direction': alert_dict.get('direction', 'N/A'),
-            'score': alert_dict.get('score', 0),
-            'criteria': alert_dict.get('criteria', ''),
-            'pattern': alert_dict.get('pattern', ''),
-            'combo': alert_dict.get('combo', ''),
-            'market': _safe_market(alert_dict.get('market', 'us')),
-            'pnl_pct': perf['pnl_pct'],
-            'max_gain_pct': perf['max_gain_pct'],
-            'status': perf['status'],
-        }
-
-    all_performance = []
+    # Fetch every price window in one batch, then score all alerts in one pass
     with st.spinner("Analyzing alerts..."):
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [
-                executor.submit(_process_analytics_alert, alert.to_dict())
-                for _, alert in alerts_df.iterrows()
-            ]
-            for future in as_completed(futures):
-                try:
-                    all_performance.append(future.result())
-                except Exception:
-                    pass
-
-    perf_df = pd.DataFrame(all_performance)
+        pairs = list(zip(alerts_df['symbol'], alerts_df['date']))
+        price_map = fetch_performance_batch(pairs, 20)
+        perf = calculate_performance_frame(alerts_df, [price_map[pair] for pair in pairs])
+
+    perf_df = _to_arrow(pd.DataFrame({
+        'symbol': alerts_df['symbol'],
+        'date': alerts_df['date'],
+        'direction': alerts_df['direction'],
+        'score': alerts_df['score'],
+        'criteria': alerts_df['criteria'],
+        'pattern': alerts_df['pattern'],
+        'combo': alerts_df['combo'],
+        'market': [_safe_market(m) for m in alerts_df['market']],
+        'pnl_pct': perf['pnl_pct'],
+        'max_gain_pct': perf['max_gain_pct'],
+        'status': perf['status'],
+    }))
 
     if perf_df.empty:
         st.warning("Could not calculate performance data")
@@ -1158,22 +1266,22 @@ def _render_winner_analytics(market: str):
     # Split into winners and losers
     winners_df = perf_df[perf_df['pnl_pct'] >= min_pnl]
     losers_df = perf_df[perf_df['pnl_pct'] <= -min_pnl]
-    total = len(perf_df)
+    n_total, n_winners, n_losers = len(perf_df), len(winners_df), len(losers_df)
 
     # Summary
     st.divider()
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Alerts", total)
+        st.metric("Total Alerts", n_total)
     with col2:
-        st.metric("Winners", len(winners_df), delta=f"{len(winners_df)/total*100:.0f}%")
+        st.metric("Winners", n_winners, delta=f"{n_winners/n_total*100:.0f}%")
     with col3:
-        st.metric("Losers", len(losers_df), delta=f"-{len(losers_df)/total*100:.0f}%", delta_color="inverse")
+        st.metric("Losers", n_losers, delta=f"-{n_losers/n_total*100:.0f}%", delta_color="inverse")
     with col4:
-        avg_winner = winners_df['pnl_pct'].mean() if not winners_df.empty else 0
+        avg_winner = winners_df['pnl_pct'].mean() if n_winners else 0
         st.metric("Avg Winner P&L", f"{avg_winner:.1f}%")
 
-    if winners_df.empty:
+    if not n_winners:
         st.warning(f"No winners found with P&L >= {min_pnl}%. Try lowering the threshold.")
         return
 
@@ -1186,10 +1294,9 @@ def _render_winner_analytics(market: str):
     with col1:
         # Score Distribution
         st.markdown("#### 📊 Score Distribution")
-        score_analysis = winners_df.groupby('score').agg({
-            'symbol': 'count',
-            'pnl_pct': 'mean'
-        }).rename(columns={'symbol': 'Count', 'pnl_pct': 'Avg P&L %'}).round(1)
+        score_analysis = winners_df.groupby('score', observed=True, sort=False).agg(
+            **{'Count': ('symbol', 'size'), 'Avg P&L %': ('pnl_pct', 'mean')}
+        ).round(1)
         score_analysis = score_analysis.sort_index(ascending=False)
 
         if not score_analysis.empty:
@@ -1200,14 +1307,16 @@ def _render_winner_analytics(market: str):
     with col2:
         # Direction Analysis
         st.markdown("#### 🎯 Direction Analysis")
-        dir_winners = winners_df.groupby('direction').agg({
-            'symbol': 'count',
-            'pnl_pct': 'mean'
-        }).rename(columns={'symbol': 'Winners', 'pnl_pct': 'Avg P&L %'}).round(1)
-
-        dir_all = perf_df.groupby('direction').size().rename('Total')
-        dir_analysis = dir_winners.join(dir_all)
+        # Single pass over perf_df: totals, winner counts and winner avg P&L
+        is_winner = perf_df['pnl_pct'] >= min_pnl
+        dir_analysis = perf_df.assign(
+            _win=is_winner, _win_pnl=perf_df['pnl_pct'].where(is_winner),
+        ).groupby('direction', observed=True, sort=False).agg(
+            **{'Winners': ('_win', 'sum'), 'Total': ('symbol', 'size'), 'Avg P&L %': ('_win_pnl', 'mean')}
+        )
+        dir_analysis = dir_analysis[dir_analysis['Winners'] > 0].round(1)
         dir_analysis['Win Rate %'] = (dir_analysis['Winners'] / dir_analysis['Total'] * 100).round(1)
+        dir_analysis = dir_analysis.sort_values('Win Rate %', ascending=False)
 
         if not dir_analysis.empty:
             best_dir = dir_analysis['Win Rate %'].idxmax()
@@ -1216,130 +1325,92 @@ def _render_winner_analytics(market: str):
 
     st.divider()
 
-    # Pattern Analysis
-    col1, col2 = st.columns(2)
+    # Secondary sections start collapsed; users mostly read the summary above
+    with st.expander("📈 Winning Patterns & Setups", expanded=False):
+        # Pattern Analysis
+        col1, col2 = st.columns(2)
 
-    with col1:
-        st.markdown("#### 📈 Winning Patterns")
-        # Extract patterns from winners
-        pattern_counts = {}
-        for patterns in winners_df['pattern'].dropna():
-            if patterns and str(patterns) != 'nan':
-                for p in str(patterns).split(','):
-                    p = p.strip()
-                    if p:
-                        pattern_counts[p] = pattern_counts.get(p, 0) + 1
-
-        if pattern_counts:
-            pattern_df = pd.DataFrame([
-                {'Pattern': k, 'Count': v, 'Win %': round(v / len(winners_df) * 100, 1)}
-                for k, v in sorted(pattern_counts.items(), key=lambda x: -x[1])[:10]
-            ])
-            st.success(f"**Top pattern: {pattern_df.iloc[0]['Pattern']}** ({pattern_df.iloc[0]['Count']} winners)")
-            st.dataframe(pattern_df, use_container_width=True, hide_index=True)
-        else:
-            st.info("No pattern data available")
+        with col1:
+            st.markdown("#### 📈 Winning Patterns")
+            # Extract patterns from winners
+            pattern_counts = _token_counts(winners_df['pattern'], split=True).head(10)
+
+            if not pattern_counts.empty:
+                pattern_df = pattern_counts.rename_axis('Pattern').reset_index(name='Count')
+                pattern_df['Win %'] = (pattern_df['Count'] / n_winners * 100).round(1)
+                st.success(f"**Top pattern: {pattern_df.iloc[0]['Pattern']}** ({pattern_df.iloc[0]['Count']} winners)")
+                st.dataframe(pattern_df, use_container_width=True, hide_index=True)
+            else:
+                st.info("No pattern data available")
 
-    with col2:
-        st.markdown("#### 🎲 Winning Setups (Combo)")
-        # Extract combos from winners
-        combo_counts = {}
-        for combo in winners_df['combo'].dropna():
-            if combo and str(combo) != 'nan' and str(combo) != 'No clear setup':
-                combo = str(combo).strip()
-                if combo:
-                    combo_counts[combo] = combo_counts.get(combo, 0) + 1
-
-        if combo_counts:
-            combo_df = pd.DataFrame([
-                {'Setup': k, 'Count': v, 'Win %': round(v / len(winners_df) * 100, 1)}
-                for k, v in sorted(combo_counts.items(), key=lambda x: -x[1])[:10]
-            ])
-            st.success(f"**Top setup: {combo_df.iloc[0]['Setup']}** ({combo_df.iloc[0]['Count']} winners)")
-            st.dataframe(combo_df, use_container_width=True, hide_index=True)
-        else:
-            st.info("No setup/combo data available")
+        with col2:
+            st.markdown("#### 🎲 Winning Setups (Combo)")
+            # Extract combos from winners
+            combo_counts = _token_counts(winners_df['combo'], exclude=('No clear setup',)).head(10)
+
+            if not combo_counts.empty:
+                combo_df = combo_counts.rename_axis('Setup').reset_index(name='Count')
+                combo_df['Win %'] = (combo_df['Count'] / n_winners * 100).round(1)
+                st.success(f"**Top setup: {combo_df.iloc[0]['Setup']}** ({combo_df.iloc[0]['Count']} winners)")
+                st.dataframe(combo_df, use_container_width=True, hide_index=True)
+            else:
+                st.info("No setup/combo data available")
 
-    st.divider()
+    with st.expander("🔑 Key Criteria in Winners", expanded=False):
+        # Top 15 criteria
+        criteria_counts = _token_counts(winners_df['criteria'], split=True).head(15)
 
-    # Criteria Analysis
-    st.markdown("#### 🔑 Key Criteria in Winners")
-    criteria_counts = {}
-    for criteria in winners_df['criteria'].dropna():
-        if criteria and str(criteria) != 'nan':
-            for c in str(criteria).split(','):
-                c = c.strip()
-                if c:
-                    criteria_counts[c] = criteria_counts.get(c, 0) + 1
-
-    if criteria_counts:
-        # Sort and get top 15
-        top_criteria = sorted(criteria_counts.items(), key=lambda x: -x[1])[:15]
-        criteria_df = pd.DataFrame([
-            {'Criteria': k, 'Appearances': v, '% of Winners': round(v / len(winners_df) * 100, 1)}
-            for k, v in top_criteria
-        ])
-
-        st.success(f"**Most common criteria: {criteria_df.iloc[0]['Criteria']}** (in {criteria_df.iloc[0]['% of Winners']:.0f}% of winners)")
-
-        # Display as bar chart
-        st.bar_chart(criteria_df.set_index('Criteria')['Appearances'])
-        st.dataframe(criteria_df, use_container_width=True, hide_index=True)
-    else:
-        st.info("No criteria data available")
+        if not criteria_counts.empty:
+            criteria_df = criteria_counts.rename_axis('Criteria').reset_index(name='Appearances')
+            criteria_df['% of Winners'] = (criteria_df['Appearances'] / n_winners * 100).round(1)
 
-    st.divider()
+            st.success(f"**Most common criteria: {criteria_df.iloc[0]['Criteria']}** (in {criteria_df.iloc[0]['% of Winners']:.0f}% of winners)")
 
-    # Winners vs Losers Comparison
-    st.markdown("#### ⚔️ Winners vs Losers Comparison")
+            # One table; the % column doubles as the bar chart
+            st.dataframe(
+                criteria_df, use_container_width=True, hide_index=True,
+                column_config={'% of Winners': st.column_config.ProgressColumn(
+                    '% of Winners', format='%.1f%%', min_value=0, max_value=100)},
+            )
+        else:
+            st.info("No criteria data available")
 
-    if not losers_df.empty:
-        col1, col2 = st.columns(2)
+    with st.expander("⚔️ Winners vs Losers Comparison", expanded=False):
+        if n_losers:
+            col1, col2 = st.columns(2)
 
-        with col1:
-            st.markdown("**Winners Profile**")
-            st.markdown(f"""
-            - Avg Score: **{winners_df['score'].mean():.1f}**
-            - Avg P&L: **+{winners_df['pnl_pct'].mean():.1f}%**
-            - Avg Max Gain: **{winners_df['max_gain_pct'].mean():.1f}%**
-            - Most Common Direction: **{winners_df['direction'].mode().iloc[0] if not winners_df['direction'].mode().empty else 'N/A'}**
-            """)
+            with col1:
+                st.markdown("**Winners Profile**")
+                st.markdown(f"""
+                - Avg Score: **{winners_df['score'].mean():.1f}**
+                - Avg P&L: **+{winners_df['pnl_pct'].mean():.1f}%**
+                - Avg Max Gain: **{winners_df['max_gain_pct'].mean():.1f}%**
+                - Most Common Direction: **{_most_common(winners_df['direction'])}**
+                """)
 
-        with col2:
-            st.markdown("**Losers Profile**")
-            st.markdown(f"""
-            - Avg Score: **{losers_df['score'].mean():.1f}**
-            - Avg P&L: **{losers_df['pnl_pct'].mean():.1f}%**
-            - Avg Max Gain: **{losers_df['max_gain_pct'].mean():.1f}%**
-            - Most Common Direction: **{losers_df['direction'].mode().iloc[0] if not losers_df['direction'].mode().empty else 'N/A'}**
-            """)
+            with col2:
+                st.markdown("**Losers Profile**")
+                st.markdown(f"""
+                - Avg Score: **{losers_df['score'].mean():.1f}**
+                - Avg P&L: **{losers_df['pnl_pct'].mean():.1f}%**
+                - Avg Max Gain: **{losers_df['max_gain_pct'].mean():.1f}%**
+                - Most Common Direction: **{_most_common(losers_df['direction'])}**
+                """)
 
-        # Score comparison
-        st.markdown("**Score Comparison**")
-        comparison_data = {
-            'Metric': ['Avg Score', 'Score 5', 'Score 6', 'Score 7', 'Score 8+'],
-            'Winners': [
-                round(winners_df['score'].mean(), 1),
-                len(winners_df[winners_df['score'] == 5]),
-                len(winners_df[winners_df['score'] == 6]),
-                len(winners_df[winners_df['score'] == 7]),
-                len(winners_df[winners_df['score'] >= 8]),
-            ],
-            'Losers': [
-                round(losers_df['score'].mean(), 1),
-                len(losers_df[losers_df['score'] == 5]),
-                len(losers_df[losers_df['score'] == 6]),
-                len(losers_df[losers_df['score'] == 7]),
-                len(losers_df[losers_df['score'] >= 8]),
-            ],
-        }
-        st.dataframe(pd.DataFrame(comparison_data), use_container_width=True, hide_index=True)
-    else:
-        st.info(f"No losers with P&L <= -{min_pnl}% found for comparison")
+            # Score comparison
+            st.markdown("**Score Comparison**")
+            comparison_data = {
+                'Metric': ['Avg Score', 'Score 5', 'Score 6', 'Score 7', 'Score 8+'],
+                'Winners': _score_buckets(winners_df['score']),
+                'Losers': _score_buckets(losers_df['score']),
+            }
+            st.dataframe(pd.DataFrame(comparison_data), use_container_width=True, hide_index=True)
+        else:
+            st.info(f"No losers with P&L <= -{min_pnl}% found for comparison")
 
     # Top Winners List
     st.divider()
     st.markdown("#### 🏆 Top 10 Winners")
-    top_winners = winners_df.nlargest(10, 'pnl_pct')[['symbol', 'date', 'direction', 'score', 'pattern', 'combo', 'pnl_pct']]
+    top_winners = _top_n(winners_df, 'pnl_pct', 10)[['symbol', 'date', 'direction', 'score', 'pattern', 'combo', 'pnl_pct']]
     top_winners.columns = ['Symbol', 'Date', 'Direction', 'Score', 'Pattern', 'Setup', 'P&L %']
     st.dataframe(top_winners, use_container_width=True, hide_index=True)
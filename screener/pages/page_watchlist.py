@@ -1,103 +1,297 @@
 """Watchlist Monitor page - Track curated stocks with full performance data."""
+import os
+import time
 import streamlit as st
+import numpy as np
 import pandas as pd
+import yfinance as yf
 from typing import Dict, List
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
 from screener.watchlist_store import load_watchlist, remove_from_watchlist
-from screener.alert_history import fetch_performance_data, calculate_performance, compute_signal_performance
-from screener.alerts import detect_entry_signal
-from screener.db import db_save_entry_signals, db_load_active_entry_signals, db_update_entry_signal_status
-from screener.utils import get_chart_url, get_unusual_whales_url
+from screener.alert_history import (
+    fetch_performance_data,
+    calculate_performance_frame,
+    compute_signal_performance_batch,
+    prefetch_performance_data,
+)
+from screener.alerts import detect_entry_signal_batch
+from screener.db import db_save_entry_signals, db_load_active_entry_signals, db_close_entry_signals
+from screener.scheduler import is_market_open
+from screener.technical_indicators import compute_entry_indicators
+from screener.utils import get_chart_url, get_clean_symbol, get_unusual_whales_url
+from screener.pages._styles import (
+    DIRECTION_CSS, ENTRY_SIGNAL_COLUMN_CONFIG, ENTRY_SIGNAL_COLUMNS, ENTRY_SIGNAL_FLOAT_COLUMNS,
+    MOMENTUM_CSS, SAVED_SIGNAL_COLUMN_CONFIG, SIGNAL_STATUS_CSS, STRENGTH_CSS,
+    css_from_map, pnl_css, rows_to_frame,
+)
+
+
+# Seconds before a session's cached price window is topped up with new bars,
+# while the symbol's market is in session / outside it
+WATCHLIST_REFRESH_SECONDS = 300
+WATCHLIST_CLOSED_REFRESH_SECONDS = 3600
+
+# Price fetches are I/O-bound, so more threads than cores is fine: the stdlib
+# default of cores + 4, capped so large boxes don't contend on one session
+WATCHLIST_MAX_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+
+# Minimum seconds between progress-bar redraws; each one is a frontend message
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Sentinel marking a window whose fetch failed
+_FETCH_FAILED = object()
+
+# Storage format of watchlist / signal dates
+DATE_FMT = '%Y-%m-%d'
+
+# Decimals kept for the performance table's numeric columns
+DISPLAY_DECIMALS = {'Alert $': 2, 'Now $': 2, 'P&L %': 1, 'Max Gain %': 1, 'Max DD %': 1}
+
+# "Sort by" option -> (column, ascending). Date Added is a datetime64 column
+WATCHLIST_SORT_KEYS = {
+    'Date Added': ('Date Added', False),
+    'Score': ('Score', False),
+    'P&L %': ('P&L %', False),
+    'Symbol': ('Symbol', True),
+}
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool, kept alive across reruns and sessions."""
+    return ThreadPoolExecutor(max_workers=WATCHLIST_MAX_WORKERS, thread_name_prefix='watchlist')
+
+
+def _watchlist_track_days(date_added: str, today: date) -> int:
+    """Bars to fetch so the window runs from date added until today."""
+    days_since = (today - date.fromisoformat(date_added)).days
+    return max(days_since + 5, 10)
 
 
 @st.cache_data(ttl=300, show_spinner=False)
-def _cached_fetch_watchlist_perf(symbol: str, date_added: str):
+def _cached_fetch_watchlist_perf(symbol: str, date_added: str, track_days: int):
     """Fetch performance data from date added until now."""
-    days_since = (datetime.now() - datetime.strptime(date_added, '%Y-%m-%d')).days
-    track_days = max(days_since + 5, 10)
     return fetch_performance_data(symbol, date_added, track_days)
 
 
-def _safe_market(val) -> str:
-    """Safely get market value as uppercase string."""
-    if val is None or (isinstance(val, float) and pd.isna(val)):
-        return 'US'
-    return str(val).upper()
+@st.cache_data(ttl=300, show_spinner=False)
+def _enrich_with_indicators(_daily_data: Dict[str, pd.DataFrame], fingerprint: tuple) -> Dict[str, pd.DataFrame]:
+    """compute_entry_indicators() for the fingerprinted symbols.
+
+    fingerprint is ((symbol, bar_count, last_timestamp, *last_bar_ohlcv), ...):
+    a new bar or an intraday update of the current one both change the key.
+    """
+    return {entry[0]: compute_entry_indicators(_daily_data[entry[0]]) for entry in fingerprint}
 
 
-def _process_single_watchlist_item(item: dict) -> dict:
-    """Process a single watchlist item: fetch performance, chart URL."""
-    symbol = item['symbol']
-    date_added = item.get('date_added', datetime.now().strftime('%Y-%m-%d'))
-    item_market = _safe_market(item.get('market', 'us'))
+def _bar_stamp(df: pd.DataFrame) -> tuple:
+    """Length, last timestamp and last bar values of a price frame."""
+    return (len(df), df.index[-1],
+            *(float(df[col].to_numpy()[-1]) for col in ('Open', 'High', 'Low', 'Close', 'Volume')))
 
-    price_data = _cached_fetch_watchlist_perf(symbol, date_added)
-    perf = calculate_performance(item, price_data)
-    chart_url = get_chart_url(symbol)
-    uw_url = get_unusual_whales_url(symbol)
 
-    display_symbol = symbol.replace('.NS', '') if symbol.endswith('.NS') else symbol
-    days_in_watchlist = (datetime.now() - datetime.strptime(date_added, '%Y-%m-%d')).days
-    alert_date = item.get('alert_date', date_added)
+def _indicator_data(watchlist: List[dict], daily_data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """Indicator-enriched frames for the watchlist symbols present in daily_data."""
+    fingerprint = tuple(
+        (sym, *_bar_stamp(daily_data[sym]))
+        for sym in dict.fromkeys(item['symbol'] for item in watchlist)
+        if sym in daily_data and not daily_data[sym].empty
+    )
+    return _enrich_with_indicators(daily_data, fingerprint)
+
+
+def _extend_windows(known: Dict[tuple, pd.DataFrame]) -> Dict[tuple, object]:
+    """Top up known (symbol, date_added) windows with one multi-symbol
+    yf.download from the earliest last bar onward, splicing each symbol's
+    new bars on. The last bar is refetched too, since today's bar keeps
+    moving intraday. A failed download maps every key to _FETCH_FAILED."""
+    if not known:
+        return {}
+    symbols = sorted({sym for sym, _ in known})
+    start = min(prev.index[-1].date() for prev in known.values())
+    try:
+        data = yf.download(symbols, start=start, interval='1d', group_by='ticker',
+                           auto_adjust=True, threads=True, progress=False)
+    except Exception:
+        return dict.fromkeys(known, _FETCH_FAILED)
+
+    results = {}
+    for key, prev in known.items():
+        new = None
+        if data is not None and not data.empty:
+            if isinstance(data.columns, pd.MultiIndex):
+                if key[0] in data.columns.get_level_values(0):
+                    new = data[key[0]]
+            elif len(symbols) == 1:
+                new = data
+        if new is not None:
+            new = new[['Open', 'High', 'Low', 'Close', 'Volume']].dropna(subset=['Close'])
+            # Daily downloads come back tz-naive; match the window's exchange timezone
+            if new.index.tz is None and prev.index.tz is not None:
+                new.index = new.index.tz_localize(prev.index.tz)
+            new = new[new.index.date >= prev.index[-1].date()]
+        if new is None or new.empty:
+            results[key] = prev
+        else:
+            results[key] = pd.concat([prev[prev.index < new.index[0]], new])
+    return results
+
+
+def _load_window(key: tuple, track_days: int):
+    """Load a whole (symbol, date_added) window from the warmed caches.
+    Returns _FETCH_FAILED instead of raising, so failures can be counted."""
+    try:
+        return _cached_fetch_watchlist_perf(*key, track_days)
+    except Exception:
+        return _FETCH_FAILED
+
+
+def _alert_price_frame(alert_price: float, day: date) -> pd.DataFrame:
+    """One flat bar at alert_price, standing in for a window that starts today."""
+    price = float(alert_price)
+    return pd.DataFrame({'Open': [price], 'High': [price], 'Low': [price], 'Close': [price], 'Volume': [0.0]},
+                        index=pd.DatetimeIndex([pd.Timestamp(day)]))
+
+
+def _market_labels(markets: pd.Series) -> pd.Series:
+    """Uppercase market names for a whole column; missing values count as US."""
+    return markets.fillna('us').astype(str).str.upper()
+
+
+def _throttled_progress(progress_bar):
+    """report(done, total, text) callback for progress_bar that skips updates
+    closer than PROGRESS_MIN_INTERVAL apart; the final update always draws."""
+    last_update = [0.0]
+
+    def report(done: int, total: int, text: str):
+        if progress_bar is None:
+            return
+        now = time.monotonic()
+        if done >= total or now - last_update[0] >= PROGRESS_MIN_INTERVAL:
+            last_update[0] = now
+            progress_bar.progress(done / total, text=text)
+
+    return report
+
+
+def _process_watchlist_parallel(items: pd.DataFrame, progress_bar=None) -> pd.DataFrame:
+    """Fetch every watchlist row's price window in parallel, then score and
+    assemble all rows column-wise in one DataFrame."""
+    total = len(items)
+    now = time.time()
+    # {(symbol, date_added): (fetched_at, window)} kept across reruns of this session
+    windows = st.session_state.setdefault('_watchlist_price_windows', {})
+    keys = list(zip(items['symbol'], items['date_added']))
+    # One clock read and one parse per distinct date added, for the whole pass
+    today = date.today()
+    track_days = {added: _watchlist_track_days(added, today) for added in items['date_added'].unique()}
+    # Items alerted and added today have no history to track yet: they are
+    # priced at their alert price with no fetch at all (and nothing is cached
+    # for them). Older alerts added today (e.g. bulk adds from the tracker)
+    # carry a stale alert price and are fetched like any other row.
+    today_str = today.isoformat()
+    added_today = ((items['date_added'] == today_str)
+                   & (items['alert_date'] == today_str)
+                   & (items['alert_price'].fillna(0) > 0)).to_numpy()
+
+    report = _throttled_progress(progress_bar)
+
+    # Download windows this session has never seen over one pooled async client
+    def _on_prefetch(done, n):
+        report(done, n, f"Downloading prices {done}/{n}...")
+
+    prefetch_performance_data(
+        [(sym, added, track_days[added])
+         for (sym, added), fresh in zip(keys, added_today) if not fresh and (sym, added) not in windows],
+        _on_prefetch,
+    )
 
-    return {
-        'Symbol': display_symbol,
-        '_raw_symbol': symbol,
-        'Chart': chart_url,
-        'Option Flow': uw_url,
-        'Market': item_market,
-        'Alert Date': alert_date,
+    # Known windows only fetch bars since their last one; fresh ones are reused as-is.
+    # Bars barely move outside market hours, so windows stay fresh longer then.
+    markets = items['market'].fillna('us').astype(str).str.lower()
+    refresh_secs = {
+        mkt: WATCHLIST_REFRESH_SECONDS if is_market_open(mkt) else WATCHLIST_CLOSED_REFRESH_SECONDS
+        for mkt in markets.unique()
+    }
+    price_frames = [None] * total  # Preserve order
+    stale = []
+    for idx, (key, mkt) in enumerate(zip(keys, markets)):
+        if added_today[idx]:
+            price_frames[idx] = _alert_price_frame(items['alert_price'].iat[idx], today)
+            continue
+        fetched_at, prev = windows.get(key, (None, None))
+        if prev is not None and now - fetched_at < refresh_secs[mkt]:
+            price_frames[idx] = prev
+        else:
+            stale.append(idx)
+
+    # A warm rerun (filter or sort change) finds every window fresh and skips
+    # the download and the pool entirely
+    failed = 0
+    if stale:
+        # Known windows are topped up by one batched download; windows new to
+        # this session were just prefetched, so read them back in parallel
+        stale_keys = list(dict.fromkeys(keys[idx] for idx in stale))
+        known = {k: windows[k][1] for k in stale_keys if k in windows}
+        unseen = [k for k in stale_keys if k not in known]
+        refreshed = _extend_windows(known)
+        if len(unseen) == 1:
+            refreshed[unseen[0]] = _load_window(unseen[0], track_days[unseen[0][1]])
+        elif unseen:
+            refreshed.update(zip(unseen, _get_executor().map(_load_window, unseen, [track_days[k[1]] for k in unseen])))
+
+        for completed, idx in enumerate(stale, start=total - len(stale) + 1):
+            frame = refreshed[keys[idx]]
+            if frame is _FETCH_FAILED:
+                failed += 1
+                frame = windows.get(keys[idx], (None, None))[1]  # Last known window, if any
+            elif frame is not None:
+                windows[keys[idx]] = (now, frame)
+            price_frames[idx] = frame
+            report(completed, total, f"Processing {completed}/{total}...")
+
+    if failed:
+        st.warning(f"Could not refresh prices for {failed} stock{'s' if failed != 1 else ''}; showing last known data.")
+
+    perf = calculate_performance_frame(items, price_frames)
+    symbols = items['symbol']
+    date_added = pd.to_datetime(items['date_added'], format=DATE_FMT, cache=True)
+
+    return pd.DataFrame({
+        'Symbol': symbols.str.removesuffix('.NS'),
+        'Chart': symbols.map(get_chart_url),
+        'Option Flow': symbols.map(get_unusual_whales_url),
+        'Market': _market_labels(items['market']),
+        'Alert Date': items['alert_date'],
         'Date Added': date_added,
-        'Days': days_in_watchlist,
-        'Direction': item.get('direction', 'N/A'),
-        'Score': item.get('score', 0),
-        'Setup': item.get('combo', 'N/A'),
-        'Criteria': item.get('criteria', ''),
-        'Alert $': item.get('alert_price', 0),
+        'Days': (pd.Timestamp.now().normalize() - date_added).dt.days,
+        'Direction': items['direction'],
+        'Score': items['score'],
+        'Setup': items['combo'],
+        'Criteria': items['criteria'],
+        'Alert $': items['alert_price'],
         'Now $': perf['current_price'],
         'P&L %': perf['pnl_pct'],
         'Max Gain %': perf['max_gain_pct'],
         'Max DD %': perf['max_drawdown_pct'],
         'Status': perf['status'],
         'Momentum': perf['momentum'],
-    }
-
-
-def _process_watchlist_parallel(watchlist: List[dict], progress_bar=None) -> List[dict]:
-    """Process all watchlist items in parallel."""
-    total = len(watchlist)
-    results = [None] * total
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_idx = {}
-        for idx, item in enumerate(watchlist):
-            future = executor.submit(_process_single_watchlist_item, item)
-            future_to_idx[future] = idx
-
-        completed = 0
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                results[idx] = future.result()
-            except Exception:
-                pass
-            completed += 1
-            if progress_bar:
-                progress_bar.progress(completed / total, text=f"Processing {completed}/{total}...")
-
-    return [r for r in results if r is not None]
+    })
 
 
 def _render_summary_metrics(perf_df: pd.DataFrame):
     """Render summary metrics row."""
     col1, col2, col3, col4, col5 = st.columns(5)
 
-    total = len(perf_df)
-    winners = len(perf_df[perf_df['P&L %'] >= 5])
-    losers = len(perf_df[perf_df['P&L %'] <= -5])
-    avg_pnl = perf_df['P&L %'].mean()
-    losing_steam = len(perf_df[perf_df['Momentum'] == 'Losing Steam'])
+    # All counts from two plain arrays; no filtered sub-frames
+    pnl = perf_df['P&L %'].to_numpy(dtype=float)
+    momentum = perf_df['Momentum'].to_numpy()
+    total = pnl.size
+    winners = int((pnl >= 5).sum())
+    losers = int((pnl <= -5).sum())
+    avg_pnl = float(pnl.mean()) if total else 0.0
+    losing_steam = int((momentum == 'Losing Steam').sum())
 
     with col1:
         st.metric("📊 Total Stocks", total)
@@ -120,39 +314,20 @@ def _render_summary_metrics(perf_df: pd.DataFrame):
 
 def _render_performance_table(perf_df: pd.DataFrame):
     """Render styled performance dataframe."""
-    def color_pnl(val):
-        if val >= 5:
-            return 'background-color: #1b5e20; color: white'
-        elif val >= 0:
-            return 'background-color: #2e7d32; color: white'
-        elif val >= -5:
-            return 'background-color: #ff8f00; color: black'
-        else:
-            return 'background-color: #b71c1c; color: white'
-
-    def color_momentum(val):
-        if val == 'Strong':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Stable':
-            return 'background-color: #2e7d32; color: white'
-        elif val == 'Slowing':
-            return 'background-color: #ff8f00; color: black'
-        elif val == 'Losing Steam':
-            return 'background-color: #b71c1c; color: white'
-        return ''
-
     display_cols = [
         'Symbol', 'Chart', 'Option Flow', 'Market', 'Alert Date', 'Date Added', 'Days',
         'Direction', 'Score', 'Setup', 'Criteria',
         'Alert $', 'Now $', 'P&L %', 'Max Gain %', 'Max DD %',
         'Status', 'Momentum'
     ]
-    display_df = perf_df[[c for c in display_cols if c in perf_df.columns]]
+    # Round to the displayed precision once, so the styler's per-cell display
+    # strings stay short; column_config formats are applied in the browser
+    display_df = perf_df[[c for c in display_cols if c in perf_df.columns]].round(DISPLAY_DECIMALS)
 
     st.dataframe(
         display_df.style
-            .applymap(color_pnl, subset=['P&L %'])
-            .applymap(color_momentum, subset=['Momentum']),
+            .apply(pnl_css, subset=['P&L %'])
+            .apply(css_from_map, css_map=MOMENTUM_CSS, subset=['Momentum']),
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -160,6 +335,7 @@ def _render_performance_table(perf_df: pd.DataFrame):
             'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
             'Option Flow': st.column_config.LinkColumn('Flow', display_text='View', width='small'),
             'Alert Date': st.column_config.TextColumn('Alerted', width='small'),
+            'Date Added': st.column_config.DatetimeColumn('Date Added', format='YYYY-MM-DD'),
             'Alert $': st.column_config.NumberColumn('Alert $', format="%.2f"),
             'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
             'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
@@ -183,18 +359,19 @@ def _scan_entry_signals(watchlist_items: list, daily_data: Dict[str, pd.DataFram
         setup_map[sym] = setup
 
     signals = []
-    skipped = 0
-    for sym in setup_map:
-        if sym not in daily_data:
-            skipped += 1
-            continue
-        results = detect_entry_signal(daily_data[sym], strategy='trend_following')
+    scan_data = {sym: daily_data[sym] for sym in setup_map if sym in daily_data}
+    skipped = len(setup_map) - len(scan_data)
+
+    # One batch call: shared last-bar screening, full checks only on candidates
+    batch_results = detect_entry_signal_batch(scan_data, strategy='trend_following')
+    for sym, results in batch_results.items():
+        # Per-symbol values, shared by its bullish and bearish signals
+        clean_sym, chart_url, setup = get_clean_symbol(sym), get_chart_url(sym), setup_map.get(sym, '')
         for result in results:
-            display_sym = sym.replace('.NS', '') if sym.endswith('.NS') else sym
-            result['symbol'] = display_sym
+            result['symbol'] = clean_sym
             result['_raw_symbol'] = sym
-            result['chart_url'] = get_chart_url(sym)
-            result['setup'] = setup_map.get(sym, '')
+            result['chart_url'] = chart_url
+            result['setup'] = setup
             signals.append(result)
 
     # Sort: Strong first, then Moderate; within same strength bullish first
@@ -204,31 +381,45 @@ def _scan_entry_signals(watchlist_items: list, daily_data: Dict[str, pd.DataFram
     return signals, skipped
 
 
+def _unsaved_mask(signals: list, saved: list, signal_date: str) -> np.ndarray:
+    """True for each signal with no saved (symbol, signal_date, direction) match,
+    via one left anti-join instead of per-signal set lookups."""
+    key_cols = ['symbol', 'signal_date', 'direction']
+    sig_keys = pd.DataFrame({
+        'symbol': [sig['_raw_symbol'] for sig in signals],
+        'signal_date': signal_date,
+        'direction': [sig.get('direction', '') for sig in signals],
+    }, columns=key_cols)
+    saved_keys = pd.DataFrame(saved, columns=key_cols).drop_duplicates()
+    merged = sig_keys.merge(saved_keys, on=key_cols, how='left', indicator=True)
+    return (merged['_merge'] == 'left_only').to_numpy()
+
+
 def _build_entry_signals_df(signals: list) -> pd.DataFrame:
     """Convert entry signal dicts into a display DataFrame."""
     rows = []
     for sig in signals:
         d = sig['details']
-        rows.append({
-            'Symbol': sig['symbol'],
-            'Chart': sig.get('chart_url', ''),
-            'Direction': sig.get('direction', ''),
-            'Setup': sig.get('setup', ''),
-            'Strength': sig['strength'],
-            'Entry $': sig['entry_price'],
-            'EMA20': sig['ema20'],
-            'Pullback %': sig['pullback_pct'],
-            'Stop $': sig['stop_loss'],
-            'Target 1': sig['target_1'],
-            'Target 2': sig['target_2'],
-            'Risk %': sig['risk_pct'],
-            'ADX': d.get('adx') if d.get('adx') is not None else 0,
-            'RSI': d.get('rsi') if d.get('rsi') is not None else 0,
-            'Vol Ratio': d.get('volume_ratio') if d.get('volume_ratio') is not None else 0,
-            'Conditions': ', '.join(sig['conditions_met']),
-            'Missing': ', '.join(sig['conditions_missing']),
-        })
-    return pd.DataFrame(rows)
+        rows.append((
+            sig['symbol'],
+            sig.get('chart_url', ''),
+            sig.get('direction', ''),
+            sig.get('setup', ''),
+            sig['strength'],
+            sig['entry_price'],
+            sig['ema20'],
+            sig['pullback_pct'],
+            sig['stop_loss'],
+            sig['target_1'],
+            sig['target_2'],
+            sig['risk_pct'],
+            d.get('adx') if d.get('adx') is not None else 0,
+            d.get('rsi') if d.get('rsi') is not None else 0,
+            d.get('volume_ratio') if d.get('volume_ratio') is not None else 0,
+            ', '.join(sig['conditions_met']),
+            ', '.join(sig['conditions_missing']),
+        ))
+    return rows_to_frame(rows, ENTRY_SIGNAL_COLUMNS, ENTRY_SIGNAL_FLOAT_COLUMNS)
 
 
 def _render_entry_signals(signals: list, skipped_count: int, key_prefix: str):
@@ -252,53 +443,14 @@ def _render_entry_signals(signals: list, skipped_count: int, key_prefix: str):
     # Build and display table
     sig_df = _build_entry_signals_df(signals)
 
-    def color_strength(val):
-        if val == 'Strong':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Moderate':
-            return 'background-color: #ff8f00; color: black'
-        return ''
-
-    def color_direction(val):
-        if val == 'Bullish':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Bearish':
-            return 'background-color: #b71c1c; color: white'
-        return ''
-
-    col_order = [
-        'Symbol', 'Chart', 'Direction', 'Setup', 'Strength',
-        'Entry $', 'EMA20', 'Pullback %',
-        'Stop $', 'Target 1', 'Target 2', 'Risk %',
-        'ADX', 'RSI', 'Vol Ratio', 'Conditions', 'Missing',
-    ]
-
     st.dataframe(
         sig_df.style
-            .applymap(color_strength, subset=['Strength'])
-            .applymap(color_direction, subset=['Direction']),
+            .apply(css_from_map, css_map=STRENGTH_CSS, subset=['Strength'])
+            .apply(css_from_map, css_map=DIRECTION_CSS, subset=['Direction']),
         use_container_width=True,
         hide_index=True,
-        column_order=col_order,
-        column_config={
-            'Symbol': st.column_config.TextColumn('Symbol', width='small'),
-            'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-            'Direction': st.column_config.TextColumn('Direction', width='small'),
-            'Setup': st.column_config.TextColumn('Setup', width='small'),
-            'Strength': st.column_config.TextColumn('Signal', width='small'),
-            'Entry $': st.column_config.NumberColumn('Entry $', format="%.2f"),
-            'EMA20': st.column_config.NumberColumn('EMA20', format="%.2f"),
-            'Pullback %': st.column_config.NumberColumn('Pullback %', format="%.1f%%"),
-            'Stop $': st.column_config.NumberColumn('Stop $', format="%.2f"),
-            'Target 1': st.column_config.NumberColumn('T1 (2:1)', format="%.2f"),
-            'Target 2': st.column_config.NumberColumn('T2 (3:1)', format="%.2f"),
-            'Risk %': st.column_config.NumberColumn('Risk %', format="%.1f%%"),
-            'ADX': st.column_config.NumberColumn('ADX', format="%.0f"),
-            'RSI': st.column_config.NumberColumn('RSI', format="%.0f"),
-            'Vol Ratio': st.column_config.NumberColumn('Vol', format="%.1fx"),
-            'Conditions': st.column_config.TextColumn('Conditions Met', width='large'),
-            'Missing': st.column_config.TextColumn('Missing', width='medium'),
-        },
+        column_order=list(ENTRY_SIGNAL_COLUMNS),
+        column_config=ENTRY_SIGNAL_COLUMN_CONFIG,
     )
 
 
@@ -318,25 +470,39 @@ def render(daily_data: Dict[str, pd.DataFrame], market: str = 'us'):
         """)
         return
 
+    # Indicators computed once per data refresh, reused across reruns
+    indicator_data = _indicator_data(watchlist, daily_data)
+
     # Sub-tabs
     tab_perf, tab_entry = st.tabs(["📈 Performance", "🎯 Entry Signals"])
 
     with tab_entry:
-        _render_watchlist_entry_tab(watchlist, daily_data, market)
+        _render_watchlist_entry_tab(watchlist, daily_data, indicator_data, market)
 
     with tab_perf:
         _render_watchlist_perf_tab(watchlist, market)
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _saved_watchlist_signals() -> list:
+    """Active Watchlist signals. Short TTL; cleared explicitly whenever
+    signals are saved or closed."""
+    return db_load_active_entry_signals(source='Watchlist')
+
+
 def _render_watchlist_entry_tab(watchlist: List[dict], daily_data: Dict[str, pd.DataFrame],
-                                market: str = 'us'):
-    """Entry Signals tab — saved signals from DB + live scan for new ones."""
+                                indicator_data: Dict[str, pd.DataFrame], market: str = 'us'):
+    """Entry Signals tab — saved signals from DB + live scan for new ones.
+
+    indicator_data holds the watchlist symbols' frames already run through
+    compute_entry_indicators(), so the live scan does not recompute indicators.
+    """
 
     # ── Section A: Saved Signals (from DB) ─────────────────────────────
     st.subheader("🗂️ Saved Entry Signals")
     st.caption("Persisted across sessions. Close a signal when your trade is done.")
 
-    saved = db_load_active_entry_signals(source='Watchlist')
+    saved = _saved_watchlist_signals()
 
     if saved:
         _render_saved_signals_table(saved, daily_data, key_prefix='wl_saved')
@@ -350,15 +516,11 @@ def _render_watchlist_entry_tab(watchlist: List[dict], daily_data: Dict[str, pd.
     st.caption("Live scan of your watchlist for fresh Trend Following entry signals.")
 
     with st.spinner("Scanning for entry signals..."):
-        entry_signals, entry_skipped = _scan_entry_signals(watchlist, daily_data)
+        entry_signals, entry_skipped = _scan_entry_signals(watchlist, indicator_data)
 
     # Filter out signals already saved (same symbol + today + direction)
-    today = datetime.now().strftime('%Y-%m-%d')
-    saved_keys = {(s['symbol'], s['signal_date'], s['direction']) for s in saved}
-    new_signals = [
-        s for s in entry_signals
-        if (s['_raw_symbol'], today, s.get('direction', '')) not in saved_keys
-    ]
+    today = datetime.now().strftime(DATE_FMT)
+    new_signals = [sig for sig, keep in zip(entry_signals, _unsaved_mask(entry_signals, saved, today)) if keep]
 
     if new_signals:
         _render_entry_signals(new_signals, entry_skipped, key_prefix='wl_new')
@@ -416,6 +578,8 @@ def _render_watchlist_entry_tab(watchlist: List[dict], daily_data: Dict[str, pd.
                 })
             count = db_save_entry_signals(to_save)
             if count > 0:
+                _saved_watchlist_signals.clear()
+                _build_saved_signals_df.clear()
                 st.success(f"Saved {count} new entry signal(s)")
                 st.rerun()
             else:
@@ -427,48 +591,54 @@ def _render_watchlist_entry_tab(watchlist: List[dict], daily_data: Dict[str, pd.
         st.info(msg)
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_saved_signals_df(_saved: list, saved_key: tuple, last_close: tuple) -> pd.DataFrame:
+    """Display frame for saved signals with live performance columns.
+
+    saved_key (the signal ids) and last_close ((symbol, close), ...) are the
+    cache key; the unhashed _saved rows are only rebuilt when they change.
+    """
+    sig_df = pd.DataFrame(_saved)
+    now_prices = sig_df['symbol'].map(dict(last_close)).fillna(sig_df['entry_price'])
+    perf = compute_signal_performance_batch(sig_df, now_prices)
+
+    return pd.DataFrame({
+        '_id': sig_df['id'],
+        'Symbol': sig_df['symbol'].str.removesuffix('.NS'),
+        'Chart': sig_df['symbol'].map({sym: get_chart_url(sym) for sym in sig_df['symbol'].unique()}),
+        'Direction': sig_df['direction'],
+        'Setup': sig_df['setup'].fillna(''),
+        'Strength': sig_df['strength'],
+        'Signal Date': sig_df['signal_date'],
+        'Days Held': perf['days_held'],
+        'Entry $': sig_df['entry_price'],
+        'Now $': perf['current_price'],
+        'P&L %': perf['pnl_pct'],
+        'Stop $': sig_df['stop_loss'],
+        'T1 (2:1)': sig_df['target_1'],
+        'T2 (3:1)': sig_df['target_2'],
+        'Risk %': sig_df['risk_pct'],
+        'Status': perf['status_hint'],
+    })
+
+
 def _render_saved_signals_table(saved: list, daily_data: Dict[str, pd.DataFrame],
                                  key_prefix: str):
     """Render saved entry signals table with live performance data."""
-    rows = []
-    for sig in saved:
-        raw_sym = sig['symbol']
-        display_sym = raw_sym.replace('.NS', '') if raw_sym.endswith('.NS') else raw_sym
-
-        # Get current price from daily_data
-        if raw_sym in daily_data and not daily_data[raw_sym].empty:
-            current_price = float(daily_data[raw_sym]['Close'].iloc[-1])
-        else:
-            current_price = sig['entry_price']
-
-        perf = compute_signal_performance(sig, current_price)
-
-        rows.append({
-            '_id': sig['id'],
-            'Symbol': display_sym,
-            'Chart': get_chart_url(raw_sym),
-            'Direction': sig['direction'],
-            'Setup': sig.get('setup', ''),
-            'Strength': sig['strength'],
-            'Signal Date': sig['signal_date'],
-            'Days Held': perf['days_held'],
-            'Entry $': sig['entry_price'],
-            'Now $': perf['current_price'],
-            'P&L %': perf['pnl_pct'],
-            'Stop $': sig['stop_loss'],
-            'T1 (2:1)': sig['target_1'],
-            'T2 (3:1)': sig['target_2'],
-            'Risk %': sig['risk_pct'],
-            'Status': perf['status_hint'],
-        })
-
-    df = pd.DataFrame(rows)
-
-    # Summary metrics
-    total = len(df)
-    active = len(df[df['Status'] == 'Active'])
-    winners = len(df[df['P&L %'] > 0])
-    avg_pnl = df['P&L %'].mean() if total > 0 else 0
+    # Current price from daily_data, one last-close lookup per symbol
+    last_close = tuple(sorted(
+        (sym, float(daily_data[sym]['Close'].values[-1]))
+        for sym in {sig['symbol'] for sig in saved}
+        if sym in daily_data and not daily_data[sym].empty
+    ))
+    df = _build_saved_signals_df(saved, tuple(sig['id'] for sig in saved), last_close)
+
+    # Summary metrics, as boolean reductions over plain arrays (no filtered sub-frames)
+    pnl = df['P&L %'].to_numpy(dtype=float)
+    total = pnl.size
+    active = int((df['Status'].to_numpy() == 'Active').sum())
+    winners = int((pnl > 0).sum())
+    avg_pnl = float(np.nanmean(pnl)) if total > 0 else 0
 
     c1, c2, c3, c4 = st.columns(4)
     with c1:
@@ -480,72 +650,37 @@ def _render_saved_signals_table(saved: list, daily_data: Dict[str, pd.DataFrame]
     with c4:
         st.metric("Avg P&L", f"{avg_pnl:.1f}%")
 
-    def color_pnl(val):
-        if val >= 5:
-            return 'background-color: #1b5e20; color: white'
-        elif val >= 0:
-            return 'background-color: #2e7d32; color: white'
-        elif val >= -5:
-            return 'background-color: #ff8f00; color: black'
-        else:
-            return 'background-color: #b71c1c; color: white'
-
-    def color_status(val):
-        if val == 'Target Hit':
-            return 'background-color: #1b5e20; color: white'
-        elif val == 'Stopped Out':
-            return 'background-color: #b71c1c; color: white'
-        elif val == 'Active':
-            return 'background-color: #1565c0; color: white'
-        return ''
-
     display_cols = [c for c in df.columns if c != '_id']
 
     st.dataframe(
         df[display_cols].style
-            .applymap(color_pnl, subset=['P&L %'])
-            .applymap(color_status, subset=['Status']),
+            .apply(pnl_css, subset=['P&L %'])
+            .apply(css_from_map, css_map=SIGNAL_STATUS_CSS, subset=['Status']),
         use_container_width=True,
         hide_index=True,
-        column_config={
-            'Symbol': st.column_config.TextColumn('Symbol', width='small'),
-            'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
-            'Direction': st.column_config.TextColumn('Dir', width='small'),
-            'Setup': st.column_config.TextColumn('Setup', width='small'),
-            'Strength': st.column_config.TextColumn('Signal', width='small'),
-            'Signal Date': st.column_config.TextColumn('Triggered', width='small'),
-            'Days Held': st.column_config.NumberColumn('Days', format="%d"),
-            'Entry $': st.column_config.NumberColumn('Entry $', format="%.2f"),
-            'Now $': st.column_config.NumberColumn('Now $', format="%.2f"),
-            'P&L %': st.column_config.NumberColumn('P&L %', format="%.1f%%"),
-            'Stop $': st.column_config.NumberColumn('Stop $', format="%.2f"),
-            'T1 (2:1)': st.column_config.NumberColumn('T1', format="%.2f"),
-            'T2 (3:1)': st.column_config.NumberColumn('T2', format="%.2f"),
-            'Risk %': st.column_config.NumberColumn('Risk %', format="%.1f%%"),
-            'Status': st.column_config.TextColumn('Status', width='small'),
-        },
+        column_config=SAVED_SIGNAL_COLUMN_CONFIG,
     )
 
     # Close signals management
-    id_to_sym = {row['_id']: row['Symbol'] for _, row in df.iterrows()}
-    options = [f"{row['Symbol']} ({row['Direction']}, {row['Signal Date']})" for _, row in df.iterrows()]
     id_list = df['_id'].tolist()
+    exit_prices = df['Now $'].tolist()
+    options = [
+        f"{sym} ({direction}, {signal_date})"
+        for sym, direction, signal_date in zip(df['Symbol'], df['Direction'], df['Signal Date'])
+    ]
+    option_idx = {label: idx for idx, label in enumerate(options)}
 
     to_close = st.multiselect("Select signals to close", options=options, key=f'{key_prefix}_close')
 
     if to_close and st.button("Close Selected", key=f'{key_prefix}_close_btn'):
-        closed = 0
-        for label in to_close:
-            idx = options.index(label)
-            sig_id = id_list[idx]
-            now_price = df.iloc[idx]['Now $']
-            if db_update_entry_signal_status(
-                sig_id, 'Closed',
-                exit_price=now_price,
-                exit_date=datetime.now().strftime('%Y-%m-%d')
-            ):
-                closed += 1
+        picked = [option_idx[label] for label in to_close]
+        closed = db_close_entry_signals(
+            [(id_list[idx], exit_prices[idx]) for idx in picked],
+            datetime.now().strftime(DATE_FMT),
+        )
         if closed > 0:
+            _saved_watchlist_signals.clear()
+            _build_saved_signals_df.clear()
             st.success(f"Closed {closed} signal(s)")
             st.rerun()
 
@@ -576,43 +711,52 @@ def _render_watchlist_perf_tab(watchlist: List[dict], market: str):
             key='wl_sort'
         )
 
-    # Apply pre-filters
-    filtered_watchlist = watchlist
-    if market_filter != 'All':
-        filtered_watchlist = [
-            w for w in filtered_watchlist
-            if _safe_market(w.get('market', 'us')) == market_filter.upper()
-        ]
-    if direction_filter != 'All':
-        filtered_watchlist = [
-            w for w in filtered_watchlist
-            if w.get('direction', '').lower() == direction_filter.lower()
-        ]
-
-    if not filtered_watchlist:
-        st.info("No watchlist stocks match the current filters.")
-        return
-
-    # Calculate performance (parallel)
-    progress_bar = st.progress(0, text="Loading watchlist performance...")
-    performance_data = _process_watchlist_parallel(filtered_watchlist, progress_bar)
-    progress_bar.empty()
-
-    perf_df = pd.DataFrame(performance_data)
+    # Reruns from unrelated widgets (sort, buttons, other tabs) reuse the last
+    # table while the watchlist object and filters are unchanged and it is fresh.
+    # load_watchlist() hands back a new list after any add/remove.
+    memo = st.session_state.get('_watchlist_perf_memo')
+    if (memo and memo['watchlist'] is watchlist
+            and memo['filters'] == (market_filter, direction_filter)
+            and time.time() - memo['computed_at'] < WATCHLIST_REFRESH_SECONDS):
+        perf_df, symbol_map = memo['perf_df'], memo['symbol_map']
+    else:
+        # Apply pre-filters as boolean masks over one frame of the watchlist
+        items = pd.DataFrame(watchlist)
+        mask = np.ones(len(items), dtype=bool)
+        if market_filter != 'All':
+            mask &= (_market_labels(items['market']) == market_filter.upper()).to_numpy()
+        if direction_filter != 'All':
+            mask &= (items['direction'].fillna('').str.lower() == direction_filter.lower()).to_numpy()
+        items = items[mask].reset_index(drop=True)
+
+        if items.empty:
+            st.info("No watchlist stocks match the current filters.")
+            return
+
+        # Calculate performance (parallel)
+        progress_bar = st.progress(0, text="Loading watchlist performance...")
+        perf_df = _process_watchlist_parallel(items, progress_bar)
+        progress_bar.empty()
+
+        # Display symbol -> raw symbol, so the table itself never carries the raw
+        # column; perf_df rows line up with items, so zip the two arrays directly
+        symbol_map = dict(zip(perf_df['Symbol'].to_numpy(), items['symbol'].to_numpy()))
+
+        st.session_state['_watchlist_perf_memo'] = {
+            'watchlist': watchlist,
+            'filters': (market_filter, direction_filter),
+            'computed_at': time.time(),
+            'perf_df': perf_df,
+            'symbol_map': symbol_map,
+        }
 
     if perf_df.empty:
         st.warning("Could not calculate performance data")
         return
 
     # Sort
-    if sort_by == 'Date Added':
-        perf_df = perf_df.sort_values('Date Added', ascending=False)
-    elif sort_by == 'Score':
-        perf_df = perf_df.sort_values('Score', ascending=False)
-    elif sort_by == 'P&L %':
-        perf_df = perf_df.sort_values('P&L %', ascending=False)
-    elif sort_by == 'Symbol':
-        perf_df = perf_df.sort_values('Symbol')
+    sort_col, ascending = WATCHLIST_SORT_KEYS[sort_by]
+    perf_df = perf_df.sort_values(sort_col, ascending=ascending, kind='stable')
 
     # Summary metrics
     _render_summary_metrics(perf_df)
@@ -632,6 +776,7 @@ def _render_watchlist_perf_tab(watchlist: List[dict], market: str):
             hide_index=True,
             column_config={
                 'Chart': st.column_config.LinkColumn('Chart', display_text='View', width='small'),
+                'Date Added': st.column_config.DatetimeColumn('Date Added', format='YYYY-MM-DD'),
             }
         )
 
@@ -639,8 +784,6 @@ def _render_watchlist_perf_tab(watchlist: List[dict], market: str):
     st.divider()
     st.subheader("🗑️ Remove from Watchlist")
     symbols_in_list = perf_df['Symbol'].tolist()
-    raw_symbols = perf_df['_raw_symbol'].tolist()
-    symbol_map = dict(zip(symbols_in_list, raw_symbols))
 
     to_remove = st.multiselect(
         "Select stocks to remove",
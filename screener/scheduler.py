@@ -2,30 +2,39 @@
 import pandas as pd
 from datetime import datetime, time
 from typing import Dict, Optional
-import pytz
+from zoneinfo import ZoneInfo
 
 from screener.stock_lists import get_stock_list
 from screener.data_fetcher import fetch_batch
 from screener.alerts import generate_alerts
 from screener.alert_history import save_alerts
 from screener.config import DEFAULT_LOOKBACK_DAYS
-from screener.db import db_get_scheduler_state, db_set_scheduler_last_run
+from screener.db import db_get_scheduler_state, db_set_scheduler_last_runs
 
 
 # Market timings
 MARKET_TIMINGS = {
     'us': {
         'timezone': 'America/New_York',
+        'open_hour': 9,
+        'open_minute': 30,
         'close_hour': 16,
         'close_minute': 0,
     },
     'indian': {
         'timezone': 'Asia/Kolkata',
+        'open_hour': 9,
+        'open_minute': 15,
         'close_hour': 15,
         'close_minute': 30,
     }
 }
 
+# Zones and session bounds built once from MARKET_TIMINGS, not on every check
+_MARKET_TZ = {m: ZoneInfo(t['timezone']) for m, t in MARKET_TIMINGS.items()}
+_OPEN_TIMES = {m: time(t['open_hour'], t['open_minute']) for m, t in MARKET_TIMINGS.items()}
+_CLOSE_TIMES = {m: time(t['close_hour'], t['close_minute']) for m, t in MARKET_TIMINGS.items()}
+
 
 def _load_scheduler_state() -> dict:
     """Load scheduler state from SQLite."""
@@ -34,21 +43,30 @@ def _load_scheduler_state() -> dict:
 
 def _save_scheduler_state(state: dict) -> None:
     """Save scheduler state to SQLite."""
-    for market, date_str in state.get('last_run', {}).items():
-        db_set_scheduler_last_run(market, date_str)
+    db_set_scheduler_last_runs(state.get('last_run', {}))
 
 
 def is_market_closed(market: str) -> bool:
     """Check if market is closed for the day."""
-    timing = MARKET_TIMINGS.get(market.lower())
-    if not timing:
+    market = market.lower()
+    if market not in _MARKET_TZ:
         return False
 
-    tz = pytz.timezone(timing['timezone'])
-    now = datetime.now(tz)
-    close_time = time(timing['close_hour'], timing['close_minute'])
+    return datetime.now(_MARKET_TZ[market]).time() >= _CLOSE_TIMES[market]
+
+
+def is_market_open(market: str) -> bool:
+    """Check if market is in its regular weekday session (holidays not handled).
+    Unknown markets count as open."""
+    market = market.lower()
+    if market not in _MARKET_TZ:
+        return True
+
+    now = datetime.now(_MARKET_TZ[market])
+    if now.weekday() >= 5:
+        return False
 
-    return now.time() >= close_time
+    return _OPEN_TIMES[market] <= now.time() < _CLOSE_TIMES[market]
 
 
 def should_run_auto_save(market: str) -> bool:
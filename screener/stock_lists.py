@@ -1,7 +1,13 @@
+import sys
+from functools import lru_cache
 from typing import List, Tuple
 
+# Symbols are interned at construction: they key dicts and sets throughout the
+# app (daily data, scores, watchlist lookups), so equal keys compare by identity
 
-def get_nifty50() -> List[str]:
+
+@lru_cache(maxsize=1)
+def get_nifty50() -> Tuple[str, ...]:
     symbols = [
         "ADANIENT", "ADANIPORTS", "APOLLOHOSP", "ASIANPAINT", "AXISBANK",
         "BAJAJ-AUTO", "BAJFINANCE", "BAJAJFINSV", "BPCL", "BHARTIARTL",
@@ -14,10 +20,11 @@ def get_nifty50() -> List[str]:
         "TCS", "TATACONSUM", "TATAMOTORS", "TATASTEEL", "TECHM",
         "TITAN", "ULTRACEMCO", "UPL", "WIPRO", "LTIM",
     ]
-    return [f"{s}.NS" for s in symbols]
+    return tuple(sys.intern(f"{s}.NS") for s in symbols)
 
 
-def get_nifty200() -> List[str]:
+@lru_cache(maxsize=1)
+def get_nifty200() -> Tuple[str, ...]:
     symbols = [
         "ADANIENT", "ADANIGREEN", "ADANIPORTS", "ADANIPOWER", "AMBUJACEM",
         "APOLLOHOSP", "ASIANPAINT", "AUROPHARMA", "AXISBANK", "BAJAJ-AUTO",
@@ -53,19 +60,21 @@ def get_nifty200() -> List[str]:
         "TVSMOTOR", "UBL", "ULTRACEMCO", "UNIONBANK", "UPL",
         "VEDL", "VOLTAS", "WIPRO", "ZEEL", "ZYDUSLIFE",
     ]
-    return [f"{s}.NS" for s in symbols]
+    return tuple(sys.intern(f"{s}.NS") for s in symbols)
 
 
-def get_banknifty() -> List[str]:
+@lru_cache(maxsize=1)
+def get_banknifty() -> Tuple[str, ...]:
     symbols = [
         "HDFCBANK", "ICICIBANK", "SBIN", "KOTAKBANK", "AXISBANK",
         "INDUSINDBK", "BANDHANBNK", "FEDERALBNK", "PNB", "IDFCFIRSTB",
         "BANKBARODA", "AUBANK",
     ]
-    return [f"{s}.NS" for s in symbols]
+    return tuple(sys.intern(f"{s}.NS") for s in symbols)
 
 
-def get_sp500() -> List[str]:
+@lru_cache(maxsize=1)
+def get_sp500() -> Tuple[str, ...]:
     """Current S&P 500 components as of February 2026."""
     symbols = [
         # Top holdings and mega caps
@@ -122,18 +131,24 @@ def get_sp500() -> List[str]:
         "TAP", "POOL", "APA", "ARE", "MGM", "DVA", "HSIC", "SWKS", "CRL", "CAG",
         "FRT", "MOS", "CPB", "FDS", "MTCH", "PAYC", "LW", "MOH", "UNH",
     ]
-    return symbols
+    return tuple(sys.intern(s) for s in symbols)
+
+
+# (market, index) -> (symbol tuple, benchmark index symbol), built once at import
+_STOCK_LISTS = {
+    ('indian', 'nifty50'): (get_nifty50(), '^NSEI'),
+    ('indian', 'nifty200'): (get_nifty200(), '^NSEI'),
+    ('indian', 'banknifty'): (get_banknifty(), '^NSEBANK'),
+    ('us', 'sp500'): (get_sp500(), '^GSPC'),
+}
+_NO_STOCK_LIST = ((), '')
+
+# Index names are matched without spaces or '&' (e.g. 'Nifty 50' -> 'nifty50')
+_INDEX_NAME_STRIP = str.maketrans('', '', ' &')
 
 
 def get_stock_list(market: str, index: str) -> Tuple[List[str], str]:
-    mapping = {
-        ('indian', 'nifty50'): (get_nifty50, '^NSEI'),
-        ('indian', 'nifty200'): (get_nifty200, '^NSEI'),
-        ('indian', 'banknifty'): (get_banknifty, '^NSEBANK'),
-        ('us', 'sp500'): (get_sp500, '^GSPC'),
-    }
-    key = (market.lower(), index.lower().replace(' ', '').replace('&', ''))
-    if key in mapping:
-        func, idx_sym = mapping[key]
-        return func(), idx_sym
-    return [], ''
+    key = (market.lower(), index.lower().translate(_INDEX_NAME_STRIP))
+    symbols, idx_sym = _STOCK_LISTS.get(key, _NO_STOCK_LIST)
+    # Stored lists are shared tuples; hand each caller its own list
+    return list(symbols), idx_sym
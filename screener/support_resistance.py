@@ -1,19 +1,32 @@
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Tuple
 from screener.config import SR_PIVOT_WINDOW, SR_CLUSTER_TOLERANCE_PCT
 
+# Classic pivot levels, in the order calculate_classic_pivots computes them
+_PIVOT_KEYS = ('PP', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3')
+
+
+def _centered_extreme_mask(values: pd.Series, window: int, reduce) -> pd.Series:
+    """True where a bar equals the max/min (reduce) of the 2*window+1 bars
+    centered on it, like values == values.rolling(..., center=True).max().
+    Edge bars and windows containing NaN are never pivots."""
+    arr = values.to_numpy(dtype=float)
+    span = 2 * window + 1
+    mask = np.zeros(arr.size, dtype=bool)
+    if arr.size >= span:
+        extremes = reduce(sliding_window_view(arr, span), axis=1)
+        mask[window:arr.size - window] = arr[window:arr.size - window] == extremes
+    return pd.Series(mask, index=values.index)
+
 
 def find_pivot_highs(df: pd.DataFrame, window: int = SR_PIVOT_WINDOW) -> pd.Series:
-    highs = df['High']
-    pivots = highs == highs.rolling(window=2 * window + 1, center=True).max()
-    return pivots
+    return _centered_extreme_mask(df['High'], window, np.max)
 
 
 def find_pivot_lows(df: pd.DataFrame, window: int = SR_PIVOT_WINDOW) -> pd.Series:
-    lows = df['Low']
-    pivots = lows == lows.rolling(window=2 * window + 1, center=True).min()
-    return pivots
+    return _centered_extreme_mask(df['Low'], window, np.min)
 
 
 def cluster_levels(prices: np.ndarray,
@@ -21,31 +34,44 @@ def cluster_levels(prices: np.ndarray,
     if len(prices) == 0:
         return []
     sorted_prices = np.sort(prices)
-    clusters = []
-    current_cluster = [sorted_prices[0]]
-    for price in sorted_prices[1:]:
-        if current_cluster[0] > 0 and (price - current_cluster[0]) / current_cluster[0] * 100 <= tolerance_pct:
-            current_cluster.append(price)
-        else:
-            clusters.append(round(float(np.mean(current_cluster)), 2))
-            current_cluster = [price]
-    clusters.append(round(float(np.mean(current_cluster)), 2))
-    return clusters
+    n = sorted_prices.size
+
+    # A cluster is its head plus every later price within tolerance_pct of
+    # the head. Prices are sorted, so each cluster ends where a binary search
+    # for the head's bound lands; only cluster heads are visited in Python
+    starts = []
+    i = 0
+    while i < n:
+        starts.append(i)
+        head = sorted_prices[i]
+        if head <= 0:
+            i += 1
+            continue
+        end = int(np.searchsorted(sorted_prices, head * (1 + tolerance_pct / 100), side='right'))
+        # Nudge past float rounding so membership matches the exact percent test
+        while end < n and (sorted_prices[end] - head) / head * 100 <= tolerance_pct:
+            end += 1
+        while end > i + 1 and (sorted_prices[end - 1] - head) / head * 100 > tolerance_pct:
+            end -= 1
+        i = max(end, i + 1)
+
+    ends = starts[1:] + [n]
+    return [round(float(sorted_prices[a:b].mean()), 2) for a, b in zip(starts, ends)]
 
 
 def calculate_classic_pivots(df: pd.DataFrame) -> dict:
-    last = df.iloc[-1]
-    h, l, c = float(last['High']), float(last['Low']), float(last['Close'])
+    h, l, c = df[['High', 'Low', 'Close']].to_numpy(dtype=float)[-1]
     pp = (h + l + c) / 3
-    return {
-        'PP': round(pp, 2),
-        'R1': round(2 * pp - l, 2),
-        'R2': round(pp + (h - l), 2),
-        'R3': round(h + 2 * (pp - l), 2),
-        'S1': round(2 * pp - h, 2),
-        'S2': round(pp - (h - l), 2),
-        'S3': round(l - 2 * (h - pp), 2),
-    }
+    levels = np.round([
+        pp,
+        2 * pp - l,
+        pp + (h - l),
+        h + 2 * (pp - l),
+        2 * pp - h,
+        pp - (h - l),
+        l - 2 * (h - pp),
+    ], 2)
+    return dict(zip(_PIVOT_KEYS, levels.tolist()))
 
 
 def detect_levels(df: pd.DataFrame, window: int = SR_PIVOT_WINDOW,
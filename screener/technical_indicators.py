@@ -1,66 +1,129 @@
 import talib
+from math import isnan
 import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Optional
 from screener.config import (EMA_PERIODS, RSI_PERIOD, MACD_FAST, MACD_SLOW,
                               MACD_SIGNAL, BB_PERIOD, BB_STD, ADX_PERIOD)
 
+# Columns generate_signals() reads from the last bar
+_SIGNAL_COLUMNS = ('RSI', 'MACD', 'MACD_Signal', 'Close', 'EMA_20', 'EMA_50', 'EMA_200',
+                   'BB_Upper', 'BB_Lower', 'ADX', 'Plus_DI', 'Minus_DI', 'Volume_Ratio')
+
+# batch_summary() columns, in row-tuple order
+_SUMMARY_COLUMNS = ('Symbol', 'Close', 'RSI', 'MACD', 'EMA_Trend', 'ADX', 'Volume', 'BB')
+
+
+def _ohlcv_arrays(df: pd.DataFrame) -> tuple:
+    """(open, high, low, close, volume) as float64 arrays, without copying
+    columns that are already float64."""
+    return tuple(df[col].to_numpy(dtype=float) for col in ('Open', 'High', 'Low', 'Close', 'Volume'))
+
+
+def _with_columns(df: pd.DataFrame, cols: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """Return df plus the computed indicator columns, added in one concat
+    (a stale column of the same name is replaced). df itself is not modified."""
+    return pd.concat([df.drop(columns=list(cols), errors='ignore'),
+                      pd.DataFrame(cols, index=df.index)], axis=1)
+
+
+def _volume_ratio(v: np.ndarray, vol_sma: np.ndarray) -> np.ndarray:
+    # Masked divide: positions without a positive average are never divided
+    ratio = np.full_like(vol_sma, np.nan)
+    np.divide(v, vol_sma, out=ratio, where=vol_sma > 0)
+    return ratio
 
-def compute_all(df: pd.DataFrame) -> pd.DataFrame:
-    o = df['Open'].values.astype(float)
-    h = df['High'].values.astype(float)
-    l = df['Low'].values.astype(float)
-    c = df['Close'].values.astype(float)
-    v = df['Volume'].values.astype(float)
+
+def _indicator_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Every compute_all() indicator as {column: array}, without building a frame."""
+    o, h, l, c, v = _ohlcv_arrays(df)
+    cols = {}
 
     for period in EMA_PERIODS:
-        df[f'EMA_{period}'] = talib.EMA(c, timeperiod=period)
-
-    df['RSI'] = talib.RSI(c, timeperiod=RSI_PERIOD)
-
-    macd, macd_sig, macd_hist = talib.MACD(c, fastperiod=MACD_FAST,
-                                            slowperiod=MACD_SLOW,
-                                            signalperiod=MACD_SIGNAL)
-    df['MACD'] = macd
-    df['MACD_Signal'] = macd_sig
-    df['MACD_Hist'] = macd_hist
-
-    upper, middle, lower = talib.BBANDS(c, timeperiod=BB_PERIOD,
-                                         nbdevup=BB_STD, nbdevdn=BB_STD)
-    df['BB_Upper'] = upper
-    df['BB_Middle'] = middle
-    df['BB_Lower'] = lower
-
-    df['ADX'] = talib.ADX(h, l, c, timeperiod=ADX_PERIOD)
-    df['Plus_DI'] = talib.PLUS_DI(h, l, c, timeperiod=ADX_PERIOD)
-    df['Minus_DI'] = talib.MINUS_DI(h, l, c, timeperiod=ADX_PERIOD)
-
-    # VWAP (cumulative for daily data)
-    tp = (h + l + c) / 3
-    cumulative_tp_vol = np.cumsum(tp * v)
+        cols[f'EMA_{period}'] = talib.EMA(c, timeperiod=period)
+
+    cols['RSI'] = talib.RSI(c, timeperiod=RSI_PERIOD)
+
+    cols['MACD'], cols['MACD_Signal'], cols['MACD_Hist'] = talib.MACD(
+        c, fastperiod=MACD_FAST, slowperiod=MACD_SLOW, signalperiod=MACD_SIGNAL)
+
+    cols['BB_Upper'], cols['BB_Middle'], cols['BB_Lower'] = talib.BBANDS(
+        c, timeperiod=BB_PERIOD, nbdevup=BB_STD, nbdevdn=BB_STD)
+
+    cols['ADX'] = talib.ADX(h, l, c, timeperiod=ADX_PERIOD)
+    cols['Plus_DI'] = talib.PLUS_DI(h, l, c, timeperiod=ADX_PERIOD)
+    cols['Minus_DI'] = talib.MINUS_DI(h, l, c, timeperiod=ADX_PERIOD)
+
+    # VWAP (cumulative for daily data), accumulated in one scratch buffer.
+    # Stays float64: a float32 running sum of price * volume loses cents.
+    tp_vol = h + l
+    tp_vol += c
+    tp_vol /= 3
+    tp_vol *= v
+    np.cumsum(tp_vol, out=tp_vol)
     cumulative_vol = np.cumsum(v)
-    with np.errstate(divide='ignore', invalid='ignore'):
-        vwap = np.where(cumulative_vol > 0, cumulative_tp_vol / cumulative_vol, np.nan)
-    df['VWAP'] = vwap
+    vwap = np.full_like(cumulative_vol, np.nan)
+    np.divide(tp_vol, cumulative_vol, out=vwap, where=cumulative_vol > 0)
+    cols['VWAP'] = vwap
 
-    df['Volume_SMA_20'] = talib.SMA(v, timeperiod=20)
-    with np.errstate(divide='ignore', invalid='ignore'):
-        df['Volume_Ratio'] = np.where(df['Volume_SMA_20'] > 0,
-                                       v / df['Volume_SMA_20'].values, np.nan)
+    cols['Volume_SMA_20'] = talib.SMA(v, timeperiod=20)
+    cols['Volume_Ratio'] = _volume_ratio(v, cols['Volume_SMA_20'])
 
-    df['ATR'] = talib.ATR(h, l, c, timeperiod=14)
+    cols['ATR'] = talib.ATR(h, l, c, timeperiod=14)
 
-    return df
+    return cols
+
+
+def compute_all(df: pd.DataFrame) -> pd.DataFrame:
+    return _with_columns(df, _indicator_columns(df))
+
+
+def compute_entry_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """The compute_all() columns the entry-signal checks read (EMAs, RSI,
+    ADX, volume ratio, ATR), skipping MACD, Bollinger Bands, DI and VWAP."""
+    _, h, l, c, v = _ohlcv_arrays(df)
+    cols = {}
+
+    for period in EMA_PERIODS:
+        cols[f'EMA_{period}'] = talib.EMA(c, timeperiod=period)
+
+    cols['RSI'] = talib.RSI(c, timeperiod=RSI_PERIOD)
+    cols['ADX'] = talib.ADX(h, l, c, timeperiod=ADX_PERIOD)
+
+    cols['Volume_SMA_20'] = talib.SMA(v, timeperiod=20)
+    cols['Volume_Ratio'] = _volume_ratio(v, cols['Volume_SMA_20'])
+
+    cols['ATR'] = talib.ATR(h, l, c, timeperiod=14)
+
+    return _with_columns(df, cols)
+
+
+def last_volume_ratio(df: pd.DataFrame) -> float:
+    """The last bar's compute_all() Volume_Ratio, without the other indicators."""
+    v = df['Volume'].to_numpy(dtype=float)
+    return float(_volume_ratio(v, talib.SMA(v, timeperiod=20))[-1])
 
 
 def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
-    last = df.iloc[-1]
-    prev = df.iloc[-2]
+    return _signals_from_arrays({col: df[col].to_numpy(dtype=float)
+                                 for col in _SIGNAL_COLUMNS if col in df.columns})
+
+
+def _signals_from_arrays(arrays: Dict[str, np.ndarray]) -> Dict[str, str]:
+    """generate_signals() over {column: float array} for the _SIGNAL_COLUMNS present."""
+    # Last two values of each column straight from its array, instead of
+    # boxing whole rows with iloc; prev is only needed for the MACD cross
+    last, prev = {}, {}
+    for col, vals in arrays.items():
+        if col in _SIGNAL_COLUMNS:
+            last[col] = vals[-1]
+            if col in ('MACD', 'MACD_Signal'):
+                prev[col] = vals[-2]
     signals = {}
 
     # RSI
     rsi = last.get('RSI', np.nan)
-    if pd.notna(rsi):
+    if not isnan(rsi):
         if rsi < 30:
             signals['RSI'] = f'Oversold ({rsi:.1f})'
         elif rsi > 70:
@@ -73,7 +136,7 @@ def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
     macd_sig_now = last.get('MACD_Signal', np.nan)
     macd_prev = prev.get('MACD', np.nan)
     macd_sig_prev = prev.get('MACD_Signal', np.nan)
-    if pd.notna(macd_now) and pd.notna(macd_sig_now):
+    if not isnan(macd_now) and not isnan(macd_sig_now):
         if macd_now > macd_sig_now and macd_prev <= macd_sig_prev:
             signals['MACD'] = 'Bullish Crossover'
         elif macd_now < macd_sig_now and macd_prev >= macd_sig_prev:
@@ -88,7 +151,7 @@ def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
     ema20 = last.get('EMA_20', np.nan)
     ema50 = last.get('EMA_50', np.nan)
     ema200 = last.get('EMA_200', np.nan)
-    if pd.notna(c) and pd.notna(ema20) and pd.notna(ema50) and pd.notna(ema200):
+    if not isnan(c) and not isnan(ema20) and not isnan(ema50) and not isnan(ema200):
         if c > ema20 > ema50 > ema200:
             signals['EMA_Trend'] = 'Strong Bullish'
         elif c < ema20 < ema50 < ema200:
@@ -103,7 +166,7 @@ def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
     # Bollinger Bands
     bb_upper = last.get('BB_Upper', np.nan)
     bb_lower = last.get('BB_Lower', np.nan)
-    if pd.notna(bb_upper) and pd.notna(bb_lower) and pd.notna(c):
+    if not isnan(bb_upper) and not isnan(bb_lower) and not isnan(c):
         bb_range = bb_upper - bb_lower
         if bb_range > 0:
             bb_pct = (c - bb_lower) / bb_range
@@ -118,7 +181,7 @@ def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
     adx = last.get('ADX', np.nan)
     plus_di = last.get('Plus_DI', np.nan)
     minus_di = last.get('Minus_DI', np.nan)
-    if pd.notna(adx) and pd.notna(plus_di) and pd.notna(minus_di):
+    if not isnan(adx) and not isnan(plus_di) and not isnan(minus_di):
         direction = 'Bullish' if plus_di > minus_di else 'Bearish'
         if adx > 25:
             signals['ADX'] = f'Strong {direction} Trend ({adx:.1f})'
@@ -127,7 +190,7 @@ def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
 
     # Volume
     vol_ratio = last.get('Volume_Ratio', np.nan)
-    if pd.notna(vol_ratio):
+    if not isnan(vol_ratio):
         if vol_ratio > 1.5:
             signals['Volume'] = f'High Volume ({vol_ratio:.1f}x avg)'
         elif vol_ratio < 0.5:
@@ -138,23 +201,35 @@ def generate_signals(df: pd.DataFrame) -> Dict[str, str]:
     return signals
 
 
+def _summary_row(item: tuple) -> Optional[tuple]:
+    """batch_summary() row (in _SUMMARY_COLUMNS order) for one (symbol, frame)
+    pair, or None on failure."""
+    sym, df = item
+    try:
+        # Straight from the indicator arrays: the enriched frame compute_all()
+        # would build is never looked at beyond its last two bars
+        cols = _indicator_columns(df)
+        cols['Close'] = df['Close'].to_numpy(dtype=float)
+        sigs = _signals_from_arrays(cols)
+        close, rsi, adx = cols['Close'][-1], cols['RSI'][-1], cols['ADX'][-1]
+        return (
+            sym,
+            round(float(close), 2),
+            None if isnan(rsi) else round(float(rsi), 1),
+            sigs.get('MACD', ''),
+            sigs.get('EMA_Trend', ''),
+            None if isnan(adx) else round(float(adx), 1),
+            sigs.get('Volume', ''),
+            sigs.get('BB', ''),
+        )
+    except Exception:
+        return None
+
+
 def batch_summary(data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-    rows = []
-    for sym, df in data.items():
-        try:
-            enriched = compute_all(df.copy())
-            sigs = generate_signals(enriched)
-            last = enriched.iloc[-1]
-            rows.append({
-                'Symbol': sym,
-                'Close': round(float(last['Close']), 2),
-                'RSI': round(float(last['RSI']), 1) if pd.notna(last.get('RSI')) else None,
-                'MACD': sigs.get('MACD', ''),
-                'EMA_Trend': sigs.get('EMA_Trend', ''),
-                'ADX': round(float(last['ADX']), 1) if pd.notna(last.get('ADX')) else None,
-                'Volume': sigs.get('Volume', ''),
-                'BB': sigs.get('BB', ''),
-            })
-        except Exception:
-            continue
-    return pd.DataFrame(rows) if rows else pd.DataFrame()
+    # generate_signals() compares the last two bars, so shorter frames are skipped up front
+    items = [(sym, df) for sym, df in data.items() if len(df) >= 2]
+    if not items:
+        return pd.DataFrame()
+    rows = [row for row in map(_summary_row, items) if row is not None]
+    return pd.DataFrame.from_records(rows, columns=_SUMMARY_COLUMNS) if rows else pd.DataFrame()
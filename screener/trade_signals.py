@@ -1,8 +1,9 @@
 import pandas as pd
 import numpy as np
+from itertools import product
 from typing import Dict, List, Tuple, Optional
 from screener.market_mood import get_cached_scores
-from screener.technical_indicators import compute_all
+from screener.technical_indicators import last_volume_ratio
 from screener.support_resistance import detect_levels
 from screener.config import NIFTY_STRIKE_STEP, BANKNIFTY_STRIKE_STEP
 
@@ -87,6 +88,104 @@ SECTOR_MAP = {
     'HAL.NS': 'Defence', 'BEL.NS': 'Defence',
 }
 
+# SECTOR_MAP as a categorical Series ('Other' included), so the heatmap
+# assigns every symbol its sector in one reindex
+_SECTOR_DTYPE = pd.CategoricalDtype(sorted(set(SECTOR_MAP.values()) | {'Other'}))
+_SECTOR_LOOKUP = pd.Series(SECTOR_MAP).astype(_SECTOR_DTYPE)
+
+
+# Strike step for the index names the F&O page offers
+_INDEX_STRIKE_STEPS = {
+    'NIFTY': NIFTY_STRIKE_STEP,
+    'BANKNIFTY': BANKNIFTY_STRIKE_STEP,
+    'FINNIFTY': NIFTY_STRIKE_STEP,
+    'MIDCPNIFTY': NIFTY_STRIKE_STEP,
+    'S&P 500 (SPY)': NIFTY_STRIKE_STEP,
+}
+
+
+def get_strike_step(index_name: str) -> int:
+    """Option strike step for an index; names outside _INDEX_STRIKE_STEPS
+    use the bank-index step if they mention BANK."""
+    step = _INDEX_STRIKE_STEPS.get(index_name)
+    if step is None:
+        step = BANKNIFTY_STRIKE_STEP if 'BANK' in index_name.upper() else NIFTY_STRIKE_STEP
+    return step
+
+
+# Which side of the decision-tree thresholds a max-pain distance falls on:
+# (< 1.5%, < 3%, > 2%). 'unknown' is a NaN distance, which clears none of them.
+_DISTANCE_BUCKETS = {
+    'near': (True, True, False),
+    'mid': (False, True, False),
+    'wide': (False, True, True),
+    'far': (False, False, True),
+    'unknown': (False, False, False),
+}
+
+
+def _distance_bucket(distance_pct: float) -> str:
+    if distance_pct < 1.5:
+        return 'near'
+    if distance_pct <= 2:
+        return 'mid'
+    if distance_pct < 3.0:
+        return 'wide'
+    if distance_pct >= 3.0:
+        return 'far'
+    return 'unknown'
+
+
+def _decide_strategy(distance: str, vix_regime: str, pcr_bias: str) -> tuple:
+    """The index strategy decision tree for one (distance bucket, VIX regime,
+    PCR bias) case: (strategy, reason, risk level override or None)."""
+    near, within_3, beyond_2 = _DISTANCE_BUCKETS[distance]
+    if near and vix_regime in ("normal", "low") and pcr_bias == "neutral":
+        return ("Short Straddle", "Price near Max Pain + neutral PCR = range-bound expected",
+                "Low" if vix_regime == "low" else "Medium")
+    if within_3 and vix_regime == "normal":
+        return "Short Strangle", "Moderate distance from Max Pain -- wider strikes safer", None
+    if vix_regime == "high":
+        return "Iron Condor", "High VIX -- defined-risk Iron Condor preferred", None
+    if pcr_bias == "bullish" and beyond_2:
+        return "Directional (CE Buy)", "Strong put support + bullish bias -- buy calls", None
+    if pcr_bias == "bearish" and beyond_2:
+        return "Directional (PE Buy)", "Bearish PCR + weak support -- buy puts", None
+    return "Short Straddle", "Default: neutral conditions favor ATM straddle", None
+
+
+# Reasoning note per PCR bias
+_PCR_NOTES = {
+    "bullish": "heavy put writing, bullish support",
+    "bearish": "low PCR, bearish bias",
+    "neutral": "neutral range",
+}
+
+
+# The decision tree evaluated once for every case, so a signal is a dict lookup
+_STRATEGY_TABLE = {
+    key: _decide_strategy(*key)
+    for key in product(_DISTANCE_BUCKETS, ("low", "normal", "high", "unknown"),
+                       ("bullish", "bearish", "neutral"))
+}
+
+
+def _iron_condor_strikes(atm, step, put_oi_strike, call_oi_strike) -> str:
+    inner_put = put_oi_strike if put_oi_strike > 0 else atm - step
+    inner_call = call_oi_strike if call_oi_strike > 0 else atm + step
+    return (f"Sell PE {inner_put:.0f} / Buy PE {inner_put - step:.0f}, "
+            f"Sell CE {inner_call:.0f} / Buy CE {inner_call + step:.0f}")
+
+
+# Strike text per strategy: (atm, step, put OI strike, call OI strike) -> str
+_STRIKE_BUILDERS = {
+    "Short Straddle": lambda atm, step, put_oi, call_oi: f"ATM: {atm}",
+    "Short Strangle": lambda atm, step, put_oi, call_oi: f"PE: {put_oi:.0f}, CE: {call_oi:.0f}",
+    "Iron Condor": _iron_condor_strikes,
+    "Directional (CE Buy)": lambda atm, step, put_oi, call_oi: f"ATM CE: {atm} or ITM CE: {atm - step}",
+    "Directional (PE Buy)": lambda atm, step, put_oi, call_oi: f"ATM PE: {atm} or ITM PE: {atm + step}",
+}
+
 
 def get_index_strategy_signal(
     index_name: str,
@@ -100,11 +199,7 @@ def get_index_strategy_signal(
     reasoning = []
     risk_level = "Medium"
 
-    # Determine strike step
-    if 'BANK' in index_name.upper():
-        step = BANKNIFTY_STRIKE_STEP
-    else:
-        step = NIFTY_STRIKE_STEP
+    step = get_strike_step(index_name)
 
     # Distance from max pain
     distance_pct = abs(current_price - max_pain) / max_pain * 100 if max_pain > 0 else 0
@@ -116,13 +211,11 @@ def get_index_strategy_signal(
     # PCR interpretation
     if pcr_oi > 1.3:
         pcr_bias = "bullish"
-        reasoning.append(f"PCR (OI): {pcr_oi:.3f} -- heavy put writing, bullish support")
     elif pcr_oi < 0.7:
         pcr_bias = "bearish"
-        reasoning.append(f"PCR (OI): {pcr_oi:.3f} -- low PCR, bearish bias")
     else:
         pcr_bias = "neutral"
-        reasoning.append(f"PCR (OI): {pcr_oi:.3f} -- neutral range")
+    reasoning.append(f"PCR (OI): {pcr_oi:.3f} -- {_PCR_NOTES[pcr_bias]}")
 
     # VIX
     if vix is not None:
@@ -146,40 +239,12 @@ def get_index_strategy_signal(
 
     # Strategy decision tree
     atm = round(current_price / step) * step
-
-    if distance_pct < 1.5 and vix_regime in ("normal", "low") and pcr_bias == "neutral":
-        strategy = "Short Straddle"
-        strikes = f"ATM: {atm}"
-        risk_level = "Low" if vix_regime == "low" else "Medium"
-        reasoning.append("Price near Max Pain + neutral PCR = range-bound expected")
-
-    elif distance_pct < 3.0 and vix_regime == "normal":
-        strategy = "Short Strangle"
-        strikes = f"PE: {highest_put_oi_strike:.0f}, CE: {highest_call_oi_strike:.0f}"
-        reasoning.append("Moderate distance from Max Pain -- wider strikes safer")
-
-    elif vix_regime == "high":
-        strategy = "Iron Condor"
-        inner_put = highest_put_oi_strike if highest_put_oi_strike > 0 else atm - step
-        inner_call = highest_call_oi_strike if highest_call_oi_strike > 0 else atm + step
-        strikes = (f"Sell PE {inner_put:.0f} / Buy PE {inner_put - step:.0f}, "
-                   f"Sell CE {inner_call:.0f} / Buy CE {inner_call + step:.0f}")
-        reasoning.append("High VIX -- defined-risk Iron Condor preferred")
-
-    elif pcr_bias == "bullish" and distance_pct > 2:
-        strategy = "Directional (CE Buy)"
-        strikes = f"ATM CE: {atm} or ITM CE: {atm - step}"
-        reasoning.append("Strong put support + bullish bias -- buy calls")
-
-    elif pcr_bias == "bearish" and distance_pct > 2:
-        strategy = "Directional (PE Buy)"
-        strikes = f"ATM PE: {atm} or ITM PE: {atm + step}"
-        reasoning.append("Bearish PCR + weak support -- buy puts")
-
-    else:
-        strategy = "Short Straddle"
-        strikes = f"ATM: {atm}"
-        reasoning.append("Default: neutral conditions favor ATM straddle")
+    strategy, reason, risk_override = _STRATEGY_TABLE[
+        (_distance_bucket(distance_pct), vix_regime, pcr_bias)]
+    strikes = _STRIKE_BUILDERS[strategy](atm, step, highest_put_oi_strike, highest_call_oi_strike)
+    if risk_override is not None:
+        risk_level = risk_override
+    reasoning.append(reason)
 
     return {
         'strategy': strategy,
@@ -190,22 +255,44 @@ def get_index_strategy_signal(
     }
 
 
-def _find_option(chain: pd.DataFrame, target_strike: float) -> dict:
-    """Find the nearest option to target_strike and return its details."""
-    if chain.empty:
-        return {'strike': target_strike, 'ltp': 0, 'iv': 0, 'oi': 0, 'bid': 0, 'ask': 0}
-    clean = chain.dropna(subset=['strike'])
-    if clean.empty:
-        return {'strike': target_strike, 'ltp': 0, 'iv': 0, 'oi': 0, 'bid': 0, 'ask': 0}
-    idx = (clean['strike'] - target_strike).abs().argsort().iloc[0]
-    row = clean.iloc[idx]
+# _find_option_arr() leg fields and the option-chain columns they come from
+_CHAIN_FIELDS = (('ltp', 'lastPrice'), ('iv', 'impliedVolatility'), ('oi', 'openInterest'),
+                 ('bid', 'bid'), ('ask', 'ask'))
+
+
+def _chain_to_arrays(chain: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Option chain as {'strike', 'ltp', 'iv', 'oi', 'bid', 'ask'} float arrays,
+    missing or NaN fields read as 0, so each leg lookup is plain indexing."""
+    n = len(chain)
+    arrs = {'strike': chain['strike'].to_numpy(dtype=float) if 'strike' in chain.columns
+            else np.full(n, np.nan)}
+    for key, col in _CHAIN_FIELDS:
+        arrs[key] = (np.nan_to_num(chain[col].to_numpy(dtype=float)) if col in chain.columns
+                     else np.zeros(n))
+    return arrs
+
+
+def _find_option_arr(arrs: Dict[str, np.ndarray], target_strike: float,
+                     leg: str, action: str, opt_type: str) -> dict:
+    """Find the nearest option to target_strike and return it as a complete
+    leg dict (details plus leg/action/type), built in one literal."""
+    strikes = arrs['strike']
+    valid = np.flatnonzero(~np.isnan(strikes))
+    if not valid.size:
+        return {'strike': target_strike, 'ltp': 0, 'iv': 0, 'oi': 0, 'bid': 0, 'ask': 0,
+                'leg': leg, 'action': action, 'type': opt_type}
+    # One O(n) argmin over the listed strikes instead of sorting the chain
+    idx = valid[np.abs(strikes[valid] - target_strike).argmin()]
     return {
-        'strike': float(row['strike']),
-        'ltp': round(float(row.get('lastPrice', 0) or 0), 2),
-        'iv': round(float(row.get('impliedVolatility', 0) or 0) * 100, 1),
-        'oi': int(row.get('openInterest', 0) or 0),
-        'bid': round(float(row.get('bid', 0) or 0), 2),
-        'ask': round(float(row.get('ask', 0) or 0), 2),
+        'strike': float(strikes[idx]),
+        'ltp': round(float(arrs['ltp'][idx]), 2),
+        'iv': round(float(arrs['iv'][idx]) * 100, 1),
+        'oi': int(arrs['oi'][idx]),
+        'bid': round(float(arrs['bid'][idx]), 2),
+        'ask': round(float(arrs['ask'][idx]), 2),
+        'leg': leg,
+        'action': action,
+        'type': opt_type,
     }
 
 
@@ -222,16 +309,19 @@ def build_strike_details(
 ) -> dict:
     """Build detailed strike recommendations with LTP, IV, OI for each leg."""
     atm = round(current_price / step) * step
+    # Short strikes at the OI walls, or one step out of the money without OI
+    # data; shared by the strangle and Iron Condor branches
+    inner_ce = highest_call_oi_strike if highest_call_oi_strike > 0 else atm + step
+    inner_pe = highest_put_oi_strike if highest_put_oi_strike > 0 else atm - step
+    # Column arrays extracted once, shared by every leg lookup below
+    ca, pa = _chain_to_arrays(calls), _chain_to_arrays(puts)
     legs = []
     total_premium = 0.0
 
     if strategy == "Short Straddle":
-        ce = _find_option(calls, atm)
-        pe = _find_option(puts, atm)
-        legs = [
-            {**ce, 'leg': 'Leg 1', 'action': 'SELL', 'type': 'CE'},
-            {**pe, 'leg': 'Leg 2', 'action': 'SELL', 'type': 'PE'},
-        ]
+        ce = _find_option_arr(ca, atm, 'Leg 1', 'SELL', 'CE')
+        pe = _find_option_arr(pa, atm, 'Leg 2', 'SELL', 'PE')
+        legs = [ce, pe]
         total_premium = ce['ltp'] + pe['ltp']
         be_upper = atm + total_premium
         be_lower = atm - total_premium
@@ -239,14 +329,9 @@ def build_strike_details(
         max_loss = "Unlimited"
 
     elif strategy == "Short Strangle":
-        ce_strike = highest_call_oi_strike if highest_call_oi_strike > 0 else atm + step
-        pe_strike = highest_put_oi_strike if highest_put_oi_strike > 0 else atm - step
-        ce = _find_option(calls, ce_strike)
-        pe = _find_option(puts, pe_strike)
-        legs = [
-            {**ce, 'leg': 'Leg 1', 'action': 'SELL', 'type': 'CE'},
-            {**pe, 'leg': 'Leg 2', 'action': 'SELL', 'type': 'PE'},
-        ]
+        ce = _find_option_arr(ca, inner_ce, 'Leg 1', 'SELL', 'CE')
+        pe = _find_option_arr(pa, inner_pe, 'Leg 2', 'SELL', 'PE')
+        legs = [ce, pe]
         total_premium = ce['ltp'] + pe['ltp']
         be_upper = ce['strike'] + total_premium
         be_lower = pe['strike'] - total_premium
@@ -254,22 +339,12 @@ def build_strike_details(
         max_loss = "Unlimited"
 
     elif strategy == "Iron Condor":
-        inner_ce = highest_call_oi_strike if highest_call_oi_strike > 0 else atm + step
-        inner_pe = highest_put_oi_strike if highest_put_oi_strike > 0 else atm - step
-        outer_ce = inner_ce + step
-        outer_pe = inner_pe - step
-
-        sell_ce = _find_option(calls, inner_ce)
-        buy_ce = _find_option(calls, outer_ce)
-        sell_pe = _find_option(puts, inner_pe)
-        buy_pe = _find_option(puts, outer_pe)
-
-        legs = [
-            {**sell_pe, 'leg': 'Leg 1', 'action': 'SELL', 'type': 'PE'},
-            {**buy_pe, 'leg': 'Leg 2', 'action': 'BUY', 'type': 'PE'},
-            {**sell_ce, 'leg': 'Leg 3', 'action': 'SELL', 'type': 'CE'},
-            {**buy_ce, 'leg': 'Leg 4', 'action': 'BUY', 'type': 'CE'},
-        ]
+        sell_ce = _find_option_arr(ca, inner_ce, 'Leg 3', 'SELL', 'CE')
+        buy_ce = _find_option_arr(ca, inner_ce + step, 'Leg 4', 'BUY', 'CE')
+        sell_pe = _find_option_arr(pa, inner_pe, 'Leg 1', 'SELL', 'PE')
+        buy_pe = _find_option_arr(pa, inner_pe - step, 'Leg 2', 'BUY', 'PE')
+
+        legs = [sell_pe, buy_pe, sell_ce, buy_ce]
         credit = (sell_ce['ltp'] + sell_pe['ltp']) - (buy_ce['ltp'] + buy_pe['ltp'])
         total_premium = round(credit, 2)
         spread_width = step
@@ -280,12 +355,9 @@ def build_strike_details(
         max_loss = f"{max_loss_val:.2f} (spread width - premium)"
 
     elif "CE Buy" in strategy:
-        atm_ce = _find_option(calls, atm)
-        itm_ce = _find_option(calls, atm - step)
-        legs = [
-            {**atm_ce, 'leg': 'ATM', 'action': 'BUY', 'type': 'CE'},
-            {**itm_ce, 'leg': 'ITM (alt)', 'action': 'BUY', 'type': 'CE'},
-        ]
+        atm_ce = _find_option_arr(ca, atm, 'ATM', 'BUY', 'CE')
+        itm_ce = _find_option_arr(ca, atm - step, 'ITM (alt)', 'BUY', 'CE')
+        legs = [atm_ce, itm_ce]
         total_premium = atm_ce['ltp']  # premium paid (stored as positive)
         be_upper = atm_ce['strike'] + atm_ce['ltp']
         be_lower = atm_ce['strike']
@@ -293,12 +365,9 @@ def build_strike_details(
         max_loss = f"{atm_ce['ltp']:.2f} (premium paid)"
 
     elif "PE Buy" in strategy:
-        atm_pe = _find_option(puts, atm)
-        itm_pe = _find_option(puts, atm + step)
-        legs = [
-            {**atm_pe, 'leg': 'ATM', 'action': 'BUY', 'type': 'PE'},
-            {**itm_pe, 'leg': 'ITM (alt)', 'action': 'BUY', 'type': 'PE'},
-        ]
+        atm_pe = _find_option_arr(pa, atm, 'ATM', 'BUY', 'PE')
+        itm_pe = _find_option_arr(pa, atm + step, 'ITM (alt)', 'BUY', 'PE')
+        legs = [atm_pe, itm_pe]
         total_premium = atm_pe['ltp']  # premium paid (stored as positive)
         be_upper = atm_pe['strike']
         be_lower = atm_pe['strike'] - atm_pe['ltp']
@@ -307,12 +376,9 @@ def build_strike_details(
 
     else:
         # Fallback: ATM straddle
-        ce = _find_option(calls, atm)
-        pe = _find_option(puts, atm)
-        legs = [
-            {**ce, 'leg': 'Leg 1', 'action': 'SELL', 'type': 'CE'},
-            {**pe, 'leg': 'Leg 2', 'action': 'SELL', 'type': 'PE'},
-        ]
+        ce = _find_option_arr(ca, atm, 'Leg 1', 'SELL', 'CE')
+        pe = _find_option_arr(pa, atm, 'Leg 2', 'SELL', 'PE')
+        legs = [ce, pe]
         total_premium = ce['ltp'] + pe['ltp']
         be_upper = atm + total_premium
         be_lower = atm - total_premium
@@ -331,101 +397,136 @@ def build_strike_details(
     }
 
 
+# Last nearest S/R levels per symbol, with the bar stamp they were computed
+# for; reruns over unchanged data skip detect_levels() entirely
+_momentum_cache: Dict[str, tuple] = {}
+
+
+def _nearest_levels(sym: str, df: pd.DataFrame, close: float) -> Tuple[float, float]:
+    """(nearest support below, nearest resistance above) the close for one symbol."""
+    # Length, last timestamp and last bar values: a new bar or an intraday
+    # update of the current one both invalidate the entry
+    stamp = (len(df), df.index[-1],
+             *(df[col].to_numpy()[-1] for col in ('High', 'Low', 'Close', 'Volume')))
+    cached = _momentum_cache.get(sym)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # cluster_levels() returns levels in ascending order, so the nearest
+    # level on each side of the close is one binary search away
+    resistance, support, _ = detect_levels(df)
+    i = np.searchsorted(support, close, side='left') - 1
+    nearest_support = float(support[i]) if i >= 0 else close * 0.97
+    j = np.searchsorted(resistance, close, side='right')
+    nearest_resistance = float(resistance[j]) if j < len(resistance) else close * 1.03
+
+    levels = (nearest_support, nearest_resistance)
+    _momentum_cache[sym] = (stamp, levels)
+    return levels
+
+
 def get_momentum_picks(data: Dict[str, pd.DataFrame],
                        top_n: int = 5) -> Tuple[List[dict], List[dict]]:
     scores = get_cached_scores(data)
-    scored = []
+    syms, frames, results, closes, vol_ratios = [], [], [], [], []
 
     for sym, df in data.items():
         if len(df) < 50:
             continue
         result = scores.get(sym)
-        if not result:
+        # A tied score is neither a bullish nor a bearish pick
+        if not result or result['bullish_score'] == result['bearish_score']:
             continue
         try:
-            enriched = compute_all(df.copy())
-            last = enriched.iloc[-1]
-            close = float(last['Close'])
-
-            vol_ratio = last.get('Volume_Ratio', np.nan)
-            has_volume = pd.notna(vol_ratio) and vol_ratio > 1.0
-
-            resistance, support, _ = detect_levels(df)
-            nearest_support = max([s for s in support if s < close], default=close * 0.97)
-            nearest_resistance = min([r for r in resistance if r > close], default=close * 1.03)
-
-            criteria_str = ', '.join(c['criterion'] for c in result['criteria'][:3])
-
-            scored.append({
-                'symbol': sym,
-                'bullish_score': result['bullish_score'],
-                'bearish_score': result['bearish_score'],
-                'has_volume': has_volume,
-                'close': round(close, 2),
-                'criteria_summary': criteria_str,
-                'support': round(nearest_support, 2),
-                'resistance': round(nearest_resistance, 2),
-            })
+            close = float(df['Close'].to_numpy(dtype=float)[-1])
+            vol_ratio = last_volume_ratio(df)
         except Exception:
             continue
+        syms.append(sym)
+        frames.append(df)
+        results.append(result)
+        closes.append(close)
+        vol_ratios.append(vol_ratio)
 
-    bullish = sorted(
-        [s for s in scored if s['bullish_score'] > s['bearish_score']],
-        key=lambda x: (x['bullish_score'], x['has_volume']),
-        reverse=True,
-    )[:top_n]
+    if not syms:
+        return [], []
 
-    bearish = sorted(
-        [s for s in scored if s['bearish_score'] > s['bullish_score']],
-        key=lambda x: (x['bearish_score'], x['has_volume']),
-        reverse=True,
-    )[:top_n]
+    bull = np.array([r['bullish_score'] for r in results])
+    bear = np.array([r['bearish_score'] for r in results])
+    has_volume = np.array(vol_ratios) > 1.0  # NaN ratio -> False
 
-    def fmt(p, direction):
-        score = p['bullish_score'] if direction == 'bullish' else p['bearish_score']
-        return {
-            'symbol': p['symbol'], 'score': score, 'direction': direction,
-            'criteria': p['criteria_summary'], 'close': p['close'],
-            'support': p['support'], 'resistance': p['resistance'],
-        }
+    def ranked(idx, score):
+        # Highest score first, volume-confirmed first within a score; lexsort is
+        # stable, so remaining ties keep input order like sorted(reverse=True)
+        return idx[np.lexsort((~has_volume[idx], -score[idx]))]
 
-    return ([fmt(p, 'bullish') for p in bullish],
-            [fmt(p, 'bearish') for p in bearish])
+    def levels_of(i):
+        try:
+            return _nearest_levels(syms[i], frames[i], closes[i])
+        except Exception:
+            return None
+
+    def top(mask, score, direction):
+        idx = np.flatnonzero(mask)
+        tiers = [idx]
+        if idx.size > top_n > 0:
+            # Only candidates scoring at least the top_n-th best can make the
+            # cut; the rest are ranked only if S/R detection fails for one of them
+            kth = idx.size - top_n
+            above = score[idx] >= np.partition(score[idx], kth)[kth]
+            tiers = [idx[above], idx[~above]]
+
+        # S/R levels (the expensive part) only for symbols that make the list:
+        # the next still-needed candidates in rank order are detected, and a
+        # failure pulls in the next batch
+        picks = []
+        for tier in tiers:
+            order = ranked(tier, score)
+            while order.size and len(picks) < top_n:
+                need = top_n - len(picks)
+                batch, order = order[:need], order[need:]
+                for i, levels in zip(batch, map(levels_of, batch)):
+                    if levels is None:
+                        continue
+                    support, resistance = levels
+                    picks.append({
+                        'symbol': syms[i], 'score': results[i][f'{direction}_score'],
+                        'direction': direction,
+                        'criteria': ', '.join(c['criterion'] for c in results[i]['criteria'][:3]),
+                        'close': round(closes[i], 2),
+                        'support': round(support, 2), 'resistance': round(resistance, 2),
+                    })
+        return picks
+
+    return top(bull > bear, bull, 'bullish'), top(bear > bull, bear, 'bearish')
+
+
+_HEATMAP_COLUMNS = ['Sector', 'Bullish', 'Bearish', 'Count', 'Avg Net Score']
 
 
 def compute_sector_heatmap(data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     scores = get_cached_scores(data)
-    sector_data = {}
-
-    for sym, df in data.items():
-        sector = SECTOR_MAP.get(sym, 'Other')
-        result = scores.get(sym)
-        if not result:
-            continue
-        net = result['bullish_score'] - result['bearish_score']
-        if sector not in sector_data:
-            sector_data[sector] = {'bulls': 0, 'bears': 0, 'nets': [], 'count': 0}
-        sector_data[sector]['count'] += 1
-        sector_data[sector]['nets'].append(net)
-        if result['bullish_score'] > result['bearish_score']:
-            sector_data[sector]['bulls'] += 1
-        elif result['bearish_score'] > result['bullish_score']:
-            sector_data[sector]['bears'] += 1
-
-    rows = []
-    for sector, info in sector_data.items():
-        if info['count'] == 0 or sector == 'Other':
-            continue
-        rows.append({
-            'Sector': sector,
-            'Bullish': info['bulls'],
-            'Bearish': info['bears'],
-            'Count': info['count'],
-            'Avg Net Score': round(float(np.mean(info['nets'])), 2),
-        })
-
-    df_out = pd.DataFrame(rows) if rows else pd.DataFrame(
-        columns=['Sector', 'Bullish', 'Bearish', 'Count', 'Avg Net Score'])
-    if not df_out.empty:
-        df_out = df_out.sort_values('Avg Net Score', ascending=False).reset_index(drop=True)
-    return df_out
+    scored = [(sym, scores[sym]) for sym in data if scores.get(sym)]
+    if not scored:
+        return pd.DataFrame(columns=_HEATMAP_COLUMNS)
+
+    bull = np.array([r['bullish_score'] for _, r in scored])
+    bear = np.array([r['bearish_score'] for _, r in scored])
+    frame = pd.DataFrame({
+        'Sector': _SECTOR_LOOKUP.reindex([sym for sym, _ in scored], fill_value='Other').array,
+        'Bullish': bull > bear,
+        'Bearish': bear > bull,
+        'Net': bull - bear,
+    })
+    frame = frame[frame['Sector'] != 'Other']
+    if frame.empty:
+        return pd.DataFrame(columns=_HEATMAP_COLUMNS)
+
+    # One groupby over every symbol instead of per-sector Python accumulators;
+    # sectors stay in first-seen order, which breaks ties in the final sort
+    df_out = frame.groupby('Sector', observed=True, sort=False).agg(
+        Bullish=('Bullish', 'sum'), Bearish=('Bearish', 'sum'),
+        Count=('Net', 'size'), Avg=('Net', 'mean')).reset_index()
+    df_out['Sector'] = df_out['Sector'].astype(str)
+    df_out['Avg Net Score'] = [round(float(m), 2) for m in df_out.pop('Avg')]
+    return df_out.sort_values('Avg Net Score', ascending=False, ignore_index=True)
@@ -1,40 +1,42 @@
 """Shared utility functions for the screener app."""
+from functools import lru_cache
 from urllib.parse import quote
 
 
+# Unusual Whales flow URL around the ticker; only the ticker varies per symbol
+_UW_URL_PREFIX = "https://unusualwhales.com/live-options-flow?limit=50&ticker_symbol="
+_UW_URL_SUFFIX = (
+    "&excluded_tags[]=no_side"
+    "&excluded_tags[]=mid_side"
+    "&excluded_tags[]=bid_side"
+    "&excluded_tags[]=china"
+    "&min_open_interest=1"
+    "&report_flag[]=sweep"
+    "&report_flag[]=floor"
+    "&report_flag[]=normal"
+    "&add_agg_trades=true"
+    "&is_multi_leg=false"
+    "&min_ask_perc=0.6"
+    "&min_premium=10000"
+)
+
+
+@lru_cache(maxsize=4096)
 def get_unusual_whales_url(symbol: str) -> str:
     """Generate Unusual Whales option flow URL for a symbol."""
-    ticker = symbol.replace('.NS', '')
-    base_url = "https://unusualwhales.com/live-options-flow"
-    params = (
-        f"?limit=50"
-        f"&ticker_symbol={quote(ticker)}"
-        f"&excluded_tags[]=no_side"
-        f"&excluded_tags[]=mid_side"
-        f"&excluded_tags[]=bid_side"
-        f"&excluded_tags[]=china"
-        f"&min_open_interest=1"
-        f"&report_flag[]=sweep"
-        f"&report_flag[]=floor"
-        f"&report_flag[]=normal"
-        f"&add_agg_trades=true"
-        f"&is_multi_leg=false"
-        f"&min_ask_perc=0.6"
-        f"&min_premium=10000"
-    )
-    return base_url + params
+    return _UW_URL_PREFIX + quote(get_clean_symbol(symbol)) + _UW_URL_SUFFIX
 
 
+@lru_cache(maxsize=4096)
 def get_chart_url(symbol: str) -> str:
     """Generate TradingView chart URL for a symbol."""
     # Remove .NS suffix for URL, TradingView uses NSE: prefix for Indian stocks
     if symbol.endswith('.NS'):
-        clean_symbol = symbol.replace('.NS', '')
-        return f"https://www.tradingview.com/chart/?symbol=NSE%3A{clean_symbol}"
+        return f"https://www.tradingview.com/chart/?symbol=NSE%3A{symbol[:-3]}"
     else:
         return f"https://www.tradingview.com/chart/?symbol={symbol}"
 
 
 def get_clean_symbol(symbol: str) -> str:
     """Get clean symbol name without exchange suffix."""
-    return symbol.replace('.NS', '') if symbol.endswith('.NS') else symbol
+    return symbol.removesuffix('.NS')
@@ -1,10 +1,11 @@
 """Watchlist storage - curated list of stocks to monitor.
 Uses SQLite for persistent local storage."""
+import sys
 from datetime import datetime
 from typing import List
 import streamlit as st
 
-from screener.db import db_load_watchlist, db_add_watchlist_item, db_remove_watchlist_item
+from screener.db import db_load_watchlist, db_add_watchlist_item, db_add_watchlist_items_batch, db_remove_watchlist_item
 
 
 def load_watchlist() -> List[dict]:
@@ -14,21 +15,33 @@ def load_watchlist() -> List[dict]:
         return st.session_state['_watchlist_cache']
 
     result = db_load_watchlist()
+    # Interned like the stock lists, so symbol lookups match by identity
+    for item in result:
+        item['symbol'] = sys.intern(item['symbol'])
     if hasattr(st, 'session_state'):
         st.session_state['_watchlist_cache'] = result
     return result
 
 
 def _invalidate_cache():
-    """Clear the session_state watchlist cache after modifications."""
-    if hasattr(st, 'session_state') and '_watchlist_cache' in st.session_state:
-        del st.session_state['_watchlist_cache']
+    """Clear the session_state watchlist caches after modifications."""
+    if hasattr(st, 'session_state'):
+        for key in ('_watchlist_cache', '_watchlist_symbols_cache', '_watchlist_perf_memo'):
+            if key in st.session_state:
+                del st.session_state[key]
 
 
-def get_watchlist_symbols() -> set:
-    """Get set of all symbols in watchlist. Efficient for batch lookups."""
-    watchlist = load_watchlist()
-    return {item.get('symbol', '') for item in watchlist}
+def get_watchlist_symbols() -> frozenset:
+    """Get set of all symbols in watchlist. Efficient for batch lookups.
+    Cached in session_state alongside the watchlist itself, as a frozenset
+    so the shared cached value can't be modified by callers."""
+    if hasattr(st, 'session_state') and '_watchlist_symbols_cache' in st.session_state:
+        return st.session_state['_watchlist_symbols_cache']
+
+    symbols = frozenset(item.get('symbol', '') for item in load_watchlist())
+    if hasattr(st, 'session_state'):
+        st.session_state['_watchlist_symbols_cache'] = symbols
+    return symbols
 
 
 def is_in_watchlist(symbol: str) -> bool:
@@ -61,6 +74,49 @@ def add_to_watchlist(symbol: str, direction: str, score: int, alert_price: float
     return result
 
 
+def _coerce_score(value) -> int:
+    """Score as an int; missing or NaN/NA scores (e.g. from a DataFrame column) become 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _coerce_market(value) -> str:
+    """Lower-cased market; anything that isn't a non-empty string falls back to 'us'."""
+    return value.lower() if isinstance(value, str) and value else 'us'
+
+
+def add_to_watchlist_bulk(entries: List[dict]) -> int:
+    """Add many stocks to the watchlist in one DB transaction.
+
+    Each entry takes the add_to_watchlist arguments as keys. Returns the
+    number of stocks added; symbols already in the watchlist are skipped.
+    """
+    if not entries:
+        return 0
+    today = datetime.now().strftime('%Y-%m-%d')
+    created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    items = [{
+        'symbol': e['symbol'],
+        'date_added': today,
+        'alert_date': e.get('alert_date') or today,
+        'direction': e['direction'],
+        'score': _coerce_score(e.get('score')),
+        'alert_price': float(e['alert_price']),
+        'criteria': e.get('criteria', ''),
+        'pattern': e.get('pattern', ''),
+        'combo': e.get('combo', ''),
+        'market': _coerce_market(e.get('market')),
+        'created_at': created_at,
+    } for e in entries]
+
+    added = db_add_watchlist_items_batch(items)
+    if added:
+        _invalidate_cache()
+    return added
+
+
 def remove_from_watchlist(symbol: str) -> bool:
     """Remove a stock from the watchlist. Returns True if removed."""
     result = db_remove_watchlist_item(symbol)